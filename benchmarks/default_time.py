@@ -0,0 +1,60 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Default event time benchmark.
+
+Measures ``current_time()`` with the system clock, a coarse clock and inside
+``batch_time()``, as used for events created without a ``time`` attribute.
+
+Usage::
+
+    python benchmarks/default_time.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from cloudevents.core.clock import (
+    CoarseClock,
+    SystemClock,
+    batch_time,
+    current_time,
+    set_clock,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'clock':<22} {'per call':>10}")
+    for name, clock in (
+        ("system clock", SystemClock()),
+        ("coarse clock (1 ms)", CoarseClock(resolution=0.001)),
+        ("coarse clock (100 ms)", CoarseClock(resolution=0.1)),
+    ):
+        set_clock(clock)
+        elapsed = timeit.timeit(current_time, number=args.number)
+        print(f"{name:<22} {elapsed / args.number * 1e9:>7.0f} ns")
+
+    set_clock(SystemClock())
+    with batch_time():
+        elapsed = timeit.timeit(current_time, number=args.number)
+    print(f"{'batch_time()':<22} {elapsed / args.number * 1e9:>7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
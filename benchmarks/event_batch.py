@@ -0,0 +1,116 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+EventBatch benchmark.
+
+Compares creating, validating and encoding a chunk of events as individual
+``CloudEvent`` objects with doing the same through a columnar ``EventBatch``.
+
+Usage::
+
+    python benchmarks/event_batch.py [--size N] [--number R]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from cloudevents.core.batch import EventBatch
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.v1.event import CloudEvent
+
+_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _columns(size: int) -> dict[str, list[Any]]:
+    return {
+        "id": [f"event-{i}" for i in range(size)],
+        "source": ["/benchmarks/source"] * size,
+        "type": ["com.example.benchmark"] * size,
+        "time": [_TIME] * size,
+        "datacontenttype": ["application/json"] * size,
+        "tenant": [f"tenant-{i % 10}" for i in range(size)],
+    }
+
+
+def _events(columns: dict[str, list[Any]], data: list[Any]) -> list[CloudEvent]:
+    names = list(columns)
+    return [
+        CloudEvent({name: columns[name][i] for name in names}, data[i])
+        for i in range(len(data))
+    ]
+
+
+def _memory(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=5_000)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    columns = _columns(args.size)
+    data = [{"index": i} for i in range(args.size)]
+    json_format = JSONFormat()
+    events = _events(columns, data)
+    batch = EventBatch(columns, data)
+
+    cases = [
+        (
+            "create + validate",
+            lambda: _events(columns, data),
+            lambda: EventBatch(columns, data),
+        ),
+        (
+            "filter by attribute",
+            lambda: [e for e in events if e.get_extension("tenant") == "tenant-1"],
+            lambda: batch.filter("tenant", lambda value: value == "tenant-1"),
+        ),
+        (
+            "encode",
+            lambda: [json_format.write(e) for e in events],
+            lambda: batch.write(json_format),
+        ),
+    ]
+
+    print(f"{'operation':<20} {'events':>10} {'batch':>10} {'speedup':>8}")
+    for name, single, columnar in cases:
+        single_time = timeit.timeit(single, number=args.number) / args.number
+        columnar_time = timeit.timeit(columnar, number=args.number) / args.number
+        print(
+            f"{name:<20} "
+            f"{single_time * 1e3:>7.1f} ms "
+            f"{columnar_time * 1e3:>7.1f} ms "
+            f"{single_time / columnar_time:>7.1f}x"
+        )
+
+    events_memory = _memory(lambda: _events(columns, data))
+    batch_memory = _memory(lambda: EventBatch(columns, data))
+    print(
+        f"{'memory':<20} {events_memory / 1024:>7.0f} KB {batch_memory / 1024:>7.0f} KB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Event ID generation benchmark.
+
+Compares ``str(uuid.uuid4())`` with the generators in ``cloudevents.core.ids``,
+both one ID at a time and in bulk with ``generate(n)``.
+
+Usage::
+
+    python benchmarks/event_ids.py [--number N]
+"""
+
+import argparse
+import timeit
+import uuid
+
+from cloudevents.core.ids import UUID4IdGenerator, UUID7IdGenerator
+
+_BULK_SIZE = 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    uuid4 = UUID4IdGenerator()
+    uuid7 = UUID7IdGenerator()
+    bulk_rounds = max(args.number // _BULK_SIZE, 1)
+    cases = [
+        ("str(uuid.uuid4())", lambda: str(uuid.uuid4()), args.number, 1),
+        ("uuid4 generate_id()", uuid4.generate_id, args.number, 1),
+        (
+            "uuid4 generate(n)",
+            lambda: uuid4.generate(_BULK_SIZE),
+            bulk_rounds,
+            _BULK_SIZE,
+        ),
+        ("uuid7 generate_id()", uuid7.generate_id, args.number, 1),
+        (
+            "uuid7 generate(n)",
+            lambda: uuid7.generate(_BULK_SIZE),
+            bulk_rounds,
+            _BULK_SIZE,
+        ),
+    ]
+
+    print(f"{'generator':<22} {'per id':>10}")
+    for name, func, number, ids_per_call in cases:
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name:<22} {elapsed / (number * ids_per_call) * 1e9:>7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
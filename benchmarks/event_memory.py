@@ -0,0 +1,90 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Memory benchmark for the core CloudEvent classes.
+
+Measures the number of bytes retained per event for the slotted core
+implementation and for a dict-backed reference mirroring the previous layout
+(one ``_attributes`` dict per instance plus ``_data``).
+
+Usage::
+
+    python benchmarks/event_memory.py [--events N] [--extensions N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from cloudevents.core.v1.event import CloudEvent
+
+
+class _DictBackedEvent:
+    """Reference layout: all attributes kept in a per-instance dictionary."""
+
+    def __init__(self, attributes: dict[str, Any], data: Any = None) -> None:
+        self._attributes = attributes
+        self._data = data
+
+
+def _make_attributes(index: int, extensions: int) -> dict[str, Any]:
+    attributes: dict[str, Any] = {
+        "id": f"event-{index}",
+        "source": "/benchmarks/source",
+        "type": "com.example.benchmark",
+        "specversion": "1.0",
+        "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "datacontenttype": "application/json",
+        "subject": "benchmark",
+    }
+    for extension in range(extensions):
+        attributes[f"ext{extension}"] = "value"
+    return attributes
+
+
+def _bytes_per_event(
+    factory: Callable[[dict[str, Any], Any], Any], events: int, extensions: int
+) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    retained = [factory(_make_attributes(i, extensions), None) for i in range(events)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Every implementation retains the same id strings and list slots, so they
+    # cancel out when comparing layouts.
+    del retained
+    return (end - start) / events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--extensions", type=int, default=0)
+    args = parser.parse_args()
+
+    before = _bytes_per_event(_DictBackedEvent, args.events, args.extensions)
+    after = _bytes_per_event(CloudEvent, args.events, args.extensions)
+
+    print(f"events: {args.events}, extensions per event: {args.extensions}")
+    print(f"dict-backed layout: {before:8.1f} bytes/event")
+    print(f"slotted CloudEvent: {after:8.1f} bytes/event")
+    print(f"saved:              {before - after:8.1f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
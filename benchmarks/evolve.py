@@ -0,0 +1,77 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Event enrichment benchmark.
+
+Compares adding an extension by reconstructing the event with
+``type(event)(attributes, data)`` against ``CloudEvent.evolve()``, for events
+with 0, 5 and 50 extensions.
+
+Usage::
+
+    python benchmarks/evolve.py [--number N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+from typing import Any
+
+from cloudevents.core.v1.event import CloudEvent
+
+
+def _make_event(extensions: int) -> CloudEvent:
+    attributes: dict[str, Any] = {
+        "id": "event-1",
+        "source": "/benchmarks/source",
+        "type": "com.example.benchmark",
+        "specversion": "1.0",
+        "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "datacontenttype": "application/json",
+        "subject": "benchmark",
+    }
+    for extension in range(extensions):
+        attributes[f"ext{extension}"] = "value"
+    return CloudEvent(attributes, {"key": "value"})
+
+
+def _reconstruct(event: CloudEvent) -> CloudEvent:
+    attributes = event.get_attributes()
+    attributes["enriched"] = "yes"
+    return type(event)(attributes, event.get_data())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'extensions':>10} {'reconstruct':>12} {'evolve':>12} {'speedup':>8}")
+    for extensions in (0, 5, 50):
+        event = _make_event(extensions)
+        reconstruct = timeit.timeit(lambda: _reconstruct(event), number=args.number)
+        evolve = timeit.timeit(
+            lambda: event.evolve({"enriched": "yes"}), number=args.number
+        )
+        print(
+            f"{extensions:>10} "
+            f"{reconstruct / args.number * 1e9:>9.0f} ns "
+            f"{evolve / args.number * 1e9:>9.0f} ns "
+            f"{reconstruct / evolve:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
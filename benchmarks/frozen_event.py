@@ -0,0 +1,75 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Repeated encoding benchmark for frozen events.
+
+Writes the same event to several sinks, once as a regular ``CloudEvent`` and
+once as a ``FrozenCloudEvent`` that caches its encoded bytes.
+
+Usage::
+
+    python benchmarks/frozen_event.py [--number N] [--sinks S]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+from typing import Any
+
+from cloudevents.core.bindings.http import to_binary, to_structured
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+
+def _make_attributes() -> dict[str, Any]:
+    return {
+        "id": "event-1",
+        "source": "/benchmarks/source",
+        "type": "com.example.benchmark",
+        "specversion": "1.0",
+        "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "datacontenttype": "application/json",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--sinks", type=int, default=4)
+    args = parser.parse_args()
+
+    data = {"items": [{"index": i, "name": f"item-{i}"} for i in range(20)]}
+    json_format = JSONFormat()
+
+    print(f"{'event':<18} {'structured':>12} {'binary':>12}")
+    for name, event_class in (
+        ("CloudEvent", CloudEvent),
+        ("FrozenCloudEvent", FrozenCloudEvent),
+    ):
+        event = event_class(_make_attributes(), data)
+        results = []
+        for encode in (to_structured, to_binary):
+
+            def publish() -> None:
+                for _ in range(args.sinks):
+                    encode(event, json_format)
+
+            elapsed = timeit.timeit(publish, number=args.number)
+            results.append(elapsed / args.number * 1e6)
+        print(f"{name:<18} {results[0]:>9.1f} us {results[1]:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON backend benchmark.
+
+Measures ``JSONFormat.write`` and ``JSONFormat.read`` for every installed JSON
+backend, using an event with a nested JSON payload.
+
+Usage::
+
+    python benchmarks/json_backends.py [--number N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.v1.event import CloudEvent
+
+
+def _make_event() -> CloudEvent:
+    return CloudEvent(
+        {
+            "id": "event-1",
+            "source": "/benchmarks/source",
+            "type": "com.example.benchmark",
+            "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "datacontenttype": "application/json",
+        },
+        {
+            "items": [{"name": f"item-{i}", "price": i * 1.5} for i in range(20)],
+            "customer": {"id": 42, "name": "Jane Doe", "tags": ["a", "b", "c"]},
+        },
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    event = _make_event()
+    print(f"{'backend':>8} {'write':>12} {'read':>12}")
+    for backend in ("stdlib", "orjson", "msgspec"):
+        try:
+            json_format = JSONFormat(backend)
+        except ImportError:
+            print(f"{backend:>8} {'not installed':>12}")
+            continue
+        body = json_format.write(event)
+        write = timeit.timeit(lambda: json_format.write(event), number=args.number)
+        read = timeit.timeit(
+            lambda: json_format.read(CloudEvent, body).get_data(), number=args.number
+        )
+        print(
+            f"{backend:>8} "
+            f"{write / args.number * 1e9:>9.0f} ns "
+            f"{read / args.number * 1e9:>9.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON batch reading benchmark.
+
+Compares ``JSONFormat.read_batch`` with the incremental ``JSONBatchReader`` for a
+batch of events, measuring the time and the peak memory allocated while reading.
+
+Usage::
+
+    python benchmarks/json_batch.py [--events N]
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from cloudevents.core.formats.json import JSONBatchReader, JSONFormat
+from cloudevents.core.v1.event import CloudEvent
+
+
+def _measure(read: Callable[[], int]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    read()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    json_format = JSONFormat()
+    body = json_format.write_batch(
+        CloudEvent(
+            {
+                "id": str(i),
+                "source": "/benchmarks/source",
+                "type": "com.example.benchmark",
+                "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "datacontenttype": "application/json",
+            },
+            {"name": f"item-{i}", "tags": ["a", "b"], "index": i},
+        )
+        for i in range(args.events)
+    )
+
+    def read_batch() -> int:
+        return len(json_format.read_batch(None, body))
+
+    def read_stream() -> int:
+        count = 0
+        for _ in JSONBatchReader(io.BytesIO(body), event_format=json_format):
+            count += 1
+        return count
+
+    print(f"{len(body) / 1e6:.1f} MB batch of {args.events} events")
+    for name, read in (("read_batch", read_batch), ("JSONBatchReader", read_stream)):
+        elapsed, peak = _measure(read)
+        print(f"{name:>16}: {elapsed:6.2f} s, peak {peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""
+JSON attribute peeking benchmark.
+
+Compares ``JSONFormat.read`` with ``JSONFormat.peek_attributes`` for events with
+large data of several shapes, peeking skipping the data without decoding it.
+
+Usage::
+
+    python benchmarks/peek_attributes.py [--size N] [--number R]
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.v1.event import CloudEvent
+
+
+def _data(size: int) -> dict[str, Any]:
+    return {
+        "strings": {f"key-{i}": f"value {i} with some text" for i in range(size)},
+        "numbers": {"values": list(range(size * 5))},
+        "records": [{"id": i, "tags": ["a", "b"], "v": i * 1.5} for i in range(size)],
+        "base64": b"\x00\x01\x02" * size * 10,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=25_000)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    json_format = JSONFormat()
+    print(f"{'data':<10} {'size':>8} {'read':>10} {'peek':>10}")
+    for name, data in _data(args.size).items():
+        body = json_format.write(
+            CloudEvent(
+                {
+                    "id": "1",
+                    "source": "/benchmarks/source",
+                    "type": "com.example.benchmark",
+                },
+                data,
+            )
+        )
+        read = timeit.timeit(lambda: json_format.read(None, body), number=args.number)
+        peek = timeit.timeit(
+            lambda: json_format.peek_attributes(body), number=args.number
+        )
+        print(
+            f"{name:<10} {len(body) / 1e6:>6.2f}MB"
+            f" {read / args.number * 1e3:>7.2f} ms {peek / args.number * 1e3:>7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
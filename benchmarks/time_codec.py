@@ -0,0 +1,76 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Timestamp codec benchmark.
+
+Compares ``dateutil.parser.isoparse`` with ``cloudevents.core.time.parse_time``
+for the common timestamp shapes, with and without the parse cache, and times
+``format_time`` against formatting a new datetime every time.
+
+Usage::
+
+    python benchmarks/time_codec.py [--number N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+
+from dateutil.parser import isoparse
+
+from cloudevents.core import time as time_codec
+from cloudevents.core.time import format_time, parse_time
+
+_TIMESTAMPS = (
+    "2023-10-25T17:09:19Z",
+    "2023-10-25T17:09:19.736Z",
+    "2023-10-25T17:09:19.736166Z",
+    "2023-10-25T17:09:19.736166+02:00",
+)
+
+
+def _parse_uncached(value: str) -> datetime:
+    time_codec._parse_cache.clear()
+    return parse_time(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    def per_call(seconds: float) -> str:
+        return f"{seconds / args.number * 1e9:>9.0f} ns"
+
+    print(f"{'timestamp':>33} {'isoparse':>12} {'parse_time':>12} {'cached':>12}")
+    for value in _TIMESTAMPS:
+        isoparse_time = timeit.timeit(lambda: isoparse(value), number=args.number)
+        uncached = timeit.timeit(lambda: _parse_uncached(value), number=args.number)
+        cached = timeit.timeit(lambda: parse_time(value), number=args.number)
+        print(
+            f"{value:>33} {per_call(isoparse_time)} {per_call(uncached)} "
+            f"{per_call(cached)}"
+        )
+
+    now = datetime.now(timezone.utc)
+    fresh = timeit.timeit(
+        lambda: format_time(now.replace(microsecond=1)), number=args.number
+    )
+    repeated = timeit.timeit(lambda: format_time(now), number=args.number)
+    print(f"format_time: new datetime {per_call(fresh)}, same {per_call(repeated)}")
+
+
+if __name__ == "__main__":
+    main()
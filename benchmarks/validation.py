@@ -0,0 +1,78 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Validation benchmark for the core CloudEvent classes.
+
+Compares the single-pass validator used on the success path with the
+error-collecting validation passes, for events with 0, 5 and 50 extensions.
+
+Usage::
+
+    python benchmarks/validation.py [--number N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+from typing import Any
+
+from cloudevents.core.v1.event import CloudEvent
+
+
+def _make_attributes(extensions: int) -> dict[str, Any]:
+    attributes: dict[str, Any] = {
+        "id": "event-1",
+        "source": "/benchmarks/source",
+        "type": "com.example.benchmark",
+        "specversion": "1.0",
+        "time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "datacontenttype": "application/json",
+        "subject": "benchmark",
+    }
+    for extension in range(extensions):
+        attributes[f"ext{extension}"] = "value"
+    return attributes
+
+
+def _collect_errors(attributes: dict[str, Any]) -> None:
+    CloudEvent._validate_required_attributes(attributes=attributes)
+    CloudEvent._validate_optional_attributes(attributes=attributes)
+    CloudEvent._validate_extension_attributes(attributes=attributes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'extensions':>10} {'multi-pass':>12} {'single-pass':>12} {'speedup':>8}")
+    for extensions in (0, 5, 50):
+        attributes = _make_attributes(extensions)
+        multi_pass = timeit.timeit(
+            lambda: _collect_errors(attributes), number=args.number
+        )
+        single_pass = timeit.timeit(
+            lambda: CloudEvent._validate_attribute(attributes), number=args.number
+        )
+        print(
+            f"{extensions:>10} "
+            f"{multi_pass / args.number * 1e9:>9.0f} ns "
+            f"{single_pass / args.number * 1e9:>9.0f} ns "
+            f"{multi_pass / single_pass:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,9 @@ Type alias for a callable that creates a BaseCloudEvent from attributes and data
 
 Args:
     attributes: The CloudEvent attributes (required fields like id, source, type, etc.)
-    data: The CloudEvent data payload (optional)
+    data: The CloudEvent data payload (optional). When lazy decoding is requested
+        from a protocol binding, this is a ``LazyData`` instance, which the core
+        CloudEvent classes accept.
 
 Returns:
     A BaseCloudEvent instance
@@ -39,6 +41,8 @@ class BaseCloudEvent(Protocol):
     obliged to follow this contract.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         attributes: dict[str, Any],
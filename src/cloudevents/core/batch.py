@@ -0,0 +1,529 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Columnar storage for batches of CloudEvents.
+
+An ``EventBatch`` keeps one list per attribute instead of one object per event.
+Repeated string values are interned, validation looks at each distinct value
+once, and filtering, projection and encoding work on the columns directly.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Final
+
+from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.clock import current_time
+from cloudevents.core.exceptions import (
+    CloudEventValidationError,
+    EventBatchValidationError,
+)
+from cloudevents.core.formats.base import BatchFormat, Format
+from cloudevents.core.ids import get_id_generator
+from cloudevents.core.lazy import LazyData, LazyTime, get_encoded_attributes
+from cloudevents.core.spec import SPECVERSION_V0_3, SPECVERSION_V1_0
+from cloudevents.core.v03 import event as v03
+from cloudevents.core.v1 import event as v1
+
+# Attributes that usually repeat within a batch and are stored interned
+_INTERNED_ATTRIBUTES: Final[frozenset[str]] = frozenset(
+    (
+        "source",
+        "type",
+        "specversion",
+        "datacontenttype",
+        "datacontentencoding",
+        "dataschema",
+        "schemaurl",
+        "subject",
+    )
+)
+
+_EVENT_CLASSES: Final[dict[str, type[v1.CloudEvent] | type[v03.CloudEvent]]] = {
+    SPECVERSION_V1_0: v1.CloudEvent,
+    SPECVERSION_V0_3: v03.CloudEvent,
+}
+# Spec attributes in the order the events return them from get_attributes()
+_SPEC_ATTRIBUTES: Final[dict[str, tuple[str, ...]]] = {
+    SPECVERSION_V1_0: (
+        "id",
+        "source",
+        "type",
+        "specversion",
+        "time",
+        "datacontenttype",
+        "dataschema",
+        "subject",
+    ),
+    SPECVERSION_V0_3: (
+        "id",
+        "source",
+        "type",
+        "specversion",
+        "time",
+        "datacontenttype",
+        "datacontentencoding",
+        "schemaurl",
+        "subject",
+    ),
+}
+
+
+def _intern(values: Iterable[Any]) -> list[Any]:
+    """
+    Copy the values into a list, storing equal strings only once.
+
+    :param values: The column values
+    :return: The interned column
+    """
+    pool: dict[str, str] = {}
+    return [
+        pool.setdefault(value, value) if isinstance(value, str) else value
+        for value in values
+    ]
+
+
+class EventView:
+    """
+    Read-only view of a single event in an ``EventBatch``.
+
+    Views implement the same accessors as the core CloudEvent classes and can be
+    passed to formats and protocol bindings. They only hold a reference to the
+    batch and a row position, the attribute values are read from the columns.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "EventBatch", index: int) -> None:
+        """
+        :param batch: The batch holding the event
+        :param index: The position of the event in the batch
+        """
+        self._batch = batch
+        self._index = index
+
+    def _get(self, name: str) -> Any:
+        column = self._batch._columns.get(name)
+        return None if column is None else column[self._index]
+
+    def get_id(self) -> str:
+        return self._batch._columns["id"][self._index]  # type: ignore[no-any-return]
+
+    def get_source(self) -> str:
+        return self._batch._columns["source"][self._index]  # type: ignore[no-any-return]
+
+    def get_type(self) -> str:
+        return self._batch._columns["type"][self._index]  # type: ignore[no-any-return]
+
+    def get_specversion(self) -> str:
+        return self._batch._specversion
+
+    def get_datacontenttype(self) -> str | None:
+        return self._get("datacontenttype")  # type: ignore[no-any-return]
+
+    def get_dataschema(self) -> str | None:
+        if self._batch._specversion == SPECVERSION_V0_3:
+            return self._get("schemaurl")  # type: ignore[no-any-return]
+        return self._get("dataschema")  # type: ignore[no-any-return]
+
+    def get_subject(self) -> str | None:
+        return self._get("subject")  # type: ignore[no-any-return]
+
+    def get_time(self) -> datetime | None:
+        column = self._batch._columns.get("time")
+        if column is None:
+            return None
+        time = column[self._index]
+        if isinstance(time, LazyTime):
+            time = column[self._index] = time.parse()
+        return time  # type: ignore[no-any-return]
+
+    def get_extension(self, extension_name: str) -> Any:
+        return self._get(extension_name)
+
+    def get_data(self) -> dict[str, Any] | str | bytes | None:
+        data_column = self._batch._data
+        data = data_column[self._index]
+        if isinstance(data, LazyData):
+            data = data_column[self._index] = data.decode()
+        return data  # type: ignore[no-any-return]
+
+    def get_attributes(self) -> dict[str, Any]:
+        attributes = self.get_encoded_attributes()
+        if isinstance(attributes.get("time"), LazyTime):
+            attributes["time"] = self.get_time()
+        return attributes
+
+    def get_encoded_attributes(self) -> dict[str, Any]:
+        """
+        Retrieve the attributes of the viewed row like ``get_attributes()``, but
+        with a ``time`` attribute that has not been parsed yet as the original
+        ``LazyTime`` string.
+
+        :return: The attributes of the row
+        """
+        index = self._index
+        attributes: dict[str, Any] = {}
+        for name, column in self._batch._columns.items():
+            value = column[index]
+            if value is not None:
+                attributes[name] = value
+        return attributes
+
+    def to_event(self) -> BaseCloudEvent:
+        """
+        Create a standalone CloudEvent from the viewed row.
+
+        :return: A CloudEvent of the batch's specification version
+        """
+        return self._batch._event_class.from_trusted(
+            self.get_encoded_attributes(), self._batch._data[self._index]
+        )
+
+
+class EventBatch:
+    """
+    A batch of CloudEvents of one specification version, stored column-wise.
+
+    Every attribute is kept in a list with one entry per event, with None where
+    an event does not have the attribute. The data of the events is kept in a
+    separate list. The columns must not be modified after the batch is created.
+    """
+
+    __slots__ = ("_columns", "_data", "_length", "_specversion", "_event_class")
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        data: Sequence[Any] | None = None,
+        specversion: str = SPECVERSION_V1_0,
+        validate: bool = True,
+    ) -> None:
+        """
+        Create a batch from attribute columns.
+
+        Missing ``id`` and ``time`` columns are filled in with IDs from the
+        configured ID generator and a single timestamp from the configured clock.
+        Missing ``specversion`` values default to ``specversion``.
+
+        :param columns: One sequence per attribute, all of the same length.
+        :param data: The data of each event. Defaults to no data.
+        :param specversion: The specification version of all events.
+        :param validate: If False, the events are not validated. Only use this for
+            columns from a trusted, already validated source.
+        :raises ValueError: If the columns differ in length or the specification
+            version is not supported.
+        :raises EventBatchValidationError: If any of the events is invalid.
+        """
+        if specversion not in _EVENT_CLASSES:
+            raise ValueError(f"Unsupported specversion: {specversion}")
+        lengths = {len(column) for column in columns.values()}
+        if data is not None:
+            lengths.add(len(data))
+        if len(lengths) > 1:
+            raise ValueError("All columns of an EventBatch must have the same length")
+        length = lengths.pop() if lengths else 0
+
+        stored: dict[str, list[Any]] = {}
+        for name, column in columns.items():
+            if name in _INTERNED_ATTRIBUTES:
+                stored[name] = _intern(column)
+            else:
+                stored[name] = list(column)
+
+        # Defaults, as applied to a single event
+        if "id" not in stored:
+            stored["id"] = get_id_generator().generate(length)
+        if "specversion" not in stored:
+            stored["specversion"] = [specversion] * length
+        elif None in stored["specversion"]:
+            stored["specversion"] = [
+                specversion if value is None else value
+                for value in stored["specversion"]
+            ]
+        if "time" not in stored:
+            stored["time"] = [current_time()] * length
+        self._columns = {
+            name: stored[name]
+            for name in [*_SPEC_ATTRIBUTES[specversion], *stored]
+            if name in stored
+        }
+        self._data: list[Any] = [None] * length if data is None else list(data)
+        self._length = length
+        self._specversion = specversion
+        self._event_class = _EVENT_CLASSES[specversion]
+
+        if validate:
+            self._validate()
+
+    @classmethod
+    def _from_trusted_columns(
+        cls, batch: "EventBatch", columns: dict[str, list[Any]], data: list[Any]
+    ) -> "EventBatch":
+        new = cls.__new__(cls)
+        new._columns = columns
+        new._data = data
+        new._length = len(data)
+        new._specversion = batch._specversion
+        new._event_class = batch._event_class
+        return new
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[BaseCloudEvent],
+        specversion: str | None = None,
+        validate: bool = False,
+    ) -> "EventBatch":
+        """
+        Create a batch from individual events.
+
+        :param events: The events, all of the same specification version.
+        :param specversion: The specification version of the events. Defaults to
+            the version of the first event, or 1.0 if there are none.
+        :param validate: If True, the events are validated again.
+        :return: The batch holding the events
+        :raises ValueError: If an event has another specification version.
+        """
+        rows = [(get_encoded_attributes(event), event.get_data()) for event in events]
+        for index, (attributes, _) in enumerate(rows):
+            event_specversion = attributes.get("specversion", SPECVERSION_V1_0)
+            if specversion is None:
+                specversion = event_specversion
+            elif event_specversion != specversion:
+                raise ValueError(
+                    f"Event {index} has specversion {event_specversion!r}, "
+                    f"expected {specversion!r}"
+                )
+        columns: dict[str, list[Any]] = {}
+        for attributes, _ in rows:
+            for name in attributes:
+                if name not in columns:
+                    columns[name] = [None] * len(rows)
+        for index, (attributes, _) in enumerate(rows):
+            for name, value in attributes.items():
+                columns[name][index] = value
+        return cls(
+            columns,
+            [data for _, data in rows],
+            specversion=specversion or SPECVERSION_V1_0,
+            validate=validate,
+        )
+
+    def _validate(self) -> None:
+        """
+        Validate all events in the batch.
+
+        The columns are checked first, looking at each distinct value only once.
+        Only if that fails, the events are validated one by one to collect the
+        detailed errors.
+
+        :raises EventBatchValidationError: If any of the events is invalid.
+        """
+        if self._is_valid():
+            return
+
+        errors: dict[int, CloudEventValidationError] = {}
+        for index in range(self._length):
+            attributes = EventView(self, index).get_encoded_attributes()
+            try:
+                self._event_class._validate_attribute(attributes=attributes)
+            except CloudEventValidationError as e:
+                errors[index] = e
+        if errors:
+            raise EventBatchValidationError(errors=errors)
+
+    def _is_valid(self) -> bool:
+        columns = self._columns
+        if not self._length:
+            return True
+        for name in v1.REQUIRED_ATTRIBUTES:
+            column = columns.get(name)
+            if column is None or None in column:
+                return False
+
+        has_valid_values = self._event_class._has_valid_values
+        for name, column in columns.items():
+            values: Iterable[Any]
+            try:
+                values = set(column)
+            except TypeError:
+                values = column
+            for value in values:
+                if value is not None and not has_valid_values(attributes={name: value}):
+                    return False
+        return True
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[EventView]:
+        for index in range(self._length):
+            yield EventView(self, index)
+
+    def __getitem__(self, index: int) -> EventView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("EventBatch index out of range")
+        return EventView(self, index)
+
+    def get_specversion(self) -> str:
+        """
+        :return: The specification version of the events in the batch
+        """
+        return self._specversion
+
+    def get_attribute_names(self) -> list[str]:
+        """
+        :return: The names of all attribute columns
+        """
+        return list(self._columns)
+
+    def get_column(self, name: str) -> list[Any]:
+        """
+        Get the values of an attribute for all events.
+
+        The returned list is the column itself and must not be modified.
+
+        :param name: The name of the attribute
+        :return: The values, None for events without the attribute
+        :raises KeyError: If no event in the batch has the attribute
+        """
+        return self._columns[name]
+
+    def get_data(self) -> list[Any]:
+        """
+        Get the data of all events.
+
+        The returned list is stored in the batch and must not be modified.
+
+        :return: The data of each event
+        """
+        return self._data
+
+    def take(self, indices: Iterable[int]) -> "EventBatch":
+        """
+        Create a batch with the events at the given positions.
+
+        :param indices: The positions of the events to keep, in the new order
+        :return: The new batch
+        """
+        selected = list(indices)
+        if len(selected) > 1:
+            getter = itemgetter(*selected)
+
+            def pick(column: list[Any]) -> list[Any]:
+                return list(getter(column))
+
+        else:
+
+            def pick(column: list[Any]) -> list[Any]:
+                return [column[index] for index in selected]
+
+        columns = {name: pick(column) for name, column in self._columns.items()}
+        return EventBatch._from_trusted_columns(self, columns, pick(self._data))
+
+    def filter(self, name: str, predicate: Callable[[Any], bool]) -> "EventBatch":
+        """
+        Create a batch with the events whose attribute value matches a predicate.
+
+        :param name: The name of the attribute to test
+        :param predicate: Called with the attribute value of each event, None if
+            the event does not have the attribute
+        :return: The new batch
+        """
+        column = self._columns.get(name)
+        if column is None:
+            column = [None] * self._length
+        return self.take(
+            index for index, value in enumerate(column) if predicate(value)
+        )
+
+    def project(self, names: Iterable[str]) -> "EventBatch":
+        """
+        Create a batch with only the given attributes and the required ones.
+
+        The new batch shares the columns and the data with this batch.
+
+        :param names: The names of the optional and extension attributes to keep
+        :return: The new batch
+        """
+        keep = set(names).union(v1.REQUIRED_ATTRIBUTES)
+        columns = {
+            name: column for name, column in self._columns.items() if name in keep
+        }
+        return EventBatch._from_trusted_columns(self, columns, self._data)
+
+    def to_events(self) -> list[BaseCloudEvent]:
+        """
+        Create standalone CloudEvents for all events in the batch.
+
+        :return: The events
+        """
+        return [view.to_event() for view in self]
+
+    def write(self, event_format: Format) -> list[bytes]:
+        """
+        Serialize every event in the batch with a format.
+
+        A single view is moved over the rows, so no object is created per event
+        apart from what the format itself needs.
+
+        :param event_format: The format to serialize the events with
+        :return: The serialized events
+        """
+        cursor = EventView(self, 0)
+        encoded: list[bytes] = []
+        for index in range(self._length):
+            cursor._index = index
+            encoded.append(event_format.write(cursor))
+        return encoded
+
+    def write_batch(self, event_format: BatchFormat) -> bytes:
+        """
+        Serialize the batch into a single message with the batch representation of
+        a format, e.g. ``application/cloudevents-batch+json``.
+
+        :param event_format: The format to serialize the events with
+        :return: The serialized batch
+        """
+        return event_format.write_batch(
+            EventView(self, index) for index in range(self._length)
+        )
+
+    def write_data(self, event_format: Format) -> list[bytes]:
+        """
+        Serialize the data of every event, e.g. for binary content mode messages.
+
+        Data that is still held in the encoded form it was read in is forwarded
+        as it is, unless its content type or the format differ from those it was
+        read with.
+
+        :param event_format: The format to serialize the data with
+        :return: The serialized data of each event
+        """
+        content_types = self._columns.get("datacontenttype") or [None] * self._length
+        encoded: list[bytes] = []
+        for data, content_type in zip(self._data, content_types):
+            if isinstance(data, LazyData):
+                body = data.body_for(content_type, event_format)
+                if body is not None:
+                    encoded.append(body)
+                    continue
+                data = data.decode()
+            encoded.append(event_format.write_data(data, content_type))
+        return encoded
@@ -16,12 +16,22 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Final
 
-from dateutil.parser import isoparse
-
 from cloudevents.core.base import BaseCloudEvent, EventFactory
-from cloudevents.core.bindings.common import get_event_factory_for_version
+from cloudevents.core.bindings.common import (
+    get_event_factory_for_version,
+    get_trusted_event_factory,
+    read_event_data,
+    read_message_body,
+    resolve_data_format,
+    resolve_format,
+    write_binary_body,
+    write_structured_body,
+)
 from cloudevents.core.formats.base import Format
+from cloudevents.core.formats.content_type import parse_content_type
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.lazy import LazyTime, get_encoded_attributes, read_attributes
 from cloudevents.core.spec import SPECVERSION_V1_0
 from cloudevents.core.v1.event import CloudEvent
 
@@ -30,6 +40,7 @@ from cloudevents.core.v1.event import CloudEvent
 CE_PREFIX_UNDERSCORE: Final[str] = "cloudEvents_"
 CE_PREFIX_COLON: Final[str] = "cloudEvents:"
 CONTENT_TYPE_PROPERTY: Final[str] = "content-type"
+CONTENT_ENCODING_PROPERTY: Final[str] = "content-encoding"
 
 
 @dataclass(frozen=True)
@@ -62,12 +73,16 @@ def _encode_amqp_value(value: Any) -> Any:
     senders SHOULD use native AMQP types when efficient.
 
     :param value: The attribute value to encode
-    :return: Encoded value (int for datetime timestamp, original type otherwise)
+    :return: Encoded value (int for datetime timestamp, str for an unparsed
+        LazyTime, original type otherwise)
     """
     if isinstance(value, datetime):
         # AMQP 1.0 timestamp: milliseconds since Unix epoch (UTC)
         timestamp_ms = int(value.timestamp() * 1000)
         return timestamp_ms
+    if isinstance(value, LazyTime):
+        # Not parsed yet, forward the original RFC 3339 string as-is
+        return str(value)
 
     return value
 
@@ -82,15 +97,16 @@ def _decode_amqp_value(attr_name: str, value: Any) -> Any:
 
     :param attr_name: The name of the CloudEvent attribute
     :param value: The AMQP property value
-    :return: Decoded value (datetime for 'time' attribute, original type otherwise)
+    :return: Decoded value (datetime or LazyTime for 'time' attribute, original type otherwise)
     """
     if attr_name == "time":
         if isinstance(value, int):
             # AMQP timestamp: milliseconds since Unix epoch
             return datetime.fromtimestamp(value / 1000.0, tz=timezone.utc)
         if isinstance(value, str):
-            # ISO 8601 string (canonical form, also accepted per spec)
-            return isoparse(value)
+            # ISO 8601 string (canonical form, also accepted per spec),
+            # parsed when the time is first accessed
+            return LazyTime(value)
 
     return value
 
@@ -128,7 +144,7 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
     """
     properties: dict[str, Any] = {}
     application_properties: dict[str, Any] = {}
-    attributes = event.get_attributes()
+    attributes = get_encoded_attributes(event)
 
     for attr_name, attr_value in attributes.items():
         if attr_name == "datacontenttype":
@@ -139,9 +155,9 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
             # Other types (bool, int, str, bytes) use native AMQP types
             application_properties[property_name] = _encode_amqp_value(attr_value)
 
-    data = event.get_data()
-    datacontenttype = attributes.get("datacontenttype")
-    application_data = event_format.write_data(data, datacontenttype)
+    application_data, content_encoding = write_binary_body(event, event_format)
+    if content_encoding is not None:
+        properties[CONTENT_ENCODING_PROPERTY] = content_encoding
 
     return AMQPMessage(
         properties=properties,
@@ -152,8 +168,10 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
 
 def from_binary(
     message: AMQPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse an AMQP binary content mode message to a CloudEvent.
@@ -185,10 +203,48 @@ def from_binary(
         >>> event = from_binary(message, JSONFormat(), CloudEvent)
 
     :param message: AMQPMessage to parse
-    :param event_format: Format implementation for data deserialization
+    :param event_format: Format implementation for data deserialization, or a
+                         registry whose default format is used
     :param event_factory: Factory function to create CloudEvent instances
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
+    attributes = _read_binary_attributes(message)
+
+    # Auto-detect version if factory not provided
+    if event_factory is None:
+        specversion = attributes.get("specversion", SPECVERSION_V1_0)
+        event_factory = get_event_factory_for_version(specversion, validate)
+    elif not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    datacontenttype = attributes.get("datacontenttype")
+    data_format, body = read_message_body(
+        resolve_data_format(event_format),
+        message.application_data,
+        _read_content_encoding(message),
+    )
+    data = read_event_data(
+        body,
+        datacontenttype,
+        data_format,
+        lazy,
+    )
+
+    return event_factory(attributes, data)
+
+
+def _read_binary_attributes(message: AMQPMessage) -> dict[str, Any]:
+    """
+    Extract the CloudEvent attributes of an AMQP binary content mode message.
+
+    :param message: AMQPMessage to read the properties of
+    :return: The attributes from the prefixed application properties and the
+        'content-type' property
+    """
     attributes: dict[str, Any] = {}
 
     for prop_name, prop_value in message.application_properties.items():
@@ -207,15 +263,25 @@ def from_binary(
     if CONTENT_TYPE_PROPERTY in message.properties:
         attributes["datacontenttype"] = message.properties[CONTENT_TYPE_PROPERTY]
 
-    # Auto-detect version if factory not provided
-    if event_factory is None:
-        specversion = attributes.get("specversion", SPECVERSION_V1_0)
-        event_factory = get_event_factory_for_version(specversion)
+    return attributes
 
-    datacontenttype = attributes.get("datacontenttype")
-    data = event_format.read_data(message.application_data, datacontenttype)
 
-    return event_factory(attributes, data)
+def _read_content_type(message: AMQPMessage) -> str | None:
+    """
+    :param message: AMQPMessage to read the properties of
+    :return: The 'content-type' property, if any
+    """
+    content_type = message.properties.get(CONTENT_TYPE_PROPERTY)
+    return content_type if isinstance(content_type, str) else None
+
+
+def _read_content_encoding(message: AMQPMessage) -> str | None:
+    """
+    :param message: AMQPMessage to read the properties of
+    :return: The 'content-encoding' property, if any
+    """
+    content_encoding = message.properties.get(CONTENT_ENCODING_PROPERTY)
+    return content_encoding if isinstance(content_encoding, str) else None
 
 
 def to_structured(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
@@ -248,7 +314,9 @@ def to_structured(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
     properties = {CONTENT_TYPE_PROPERTY: content_type}
     application_properties: dict[str, Any] = {}
 
-    application_data = event_format.write(event)
+    application_data, content_encoding = write_structured_body(event, event_format)
+    if content_encoding is not None:
+        properties[CONTENT_ENCODING_PROPERTY] = content_encoding
 
     return AMQPMessage(
         properties=properties,
@@ -259,8 +327,9 @@ def to_structured(event: BaseCloudEvent, event_format: Format) -> AMQPMessage:
 
 def from_structured(
     message: AMQPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
 ) -> BaseCloudEvent:
     """
     Parse an AMQP structured content mode message to a CloudEvent.
@@ -288,19 +357,32 @@ def from_structured(
         >>> event = from_structured(message, JSONFormat())
 
     :param message: AMQPMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances.
                          If None, the format will auto-detect the version.
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
     :return: CloudEvent instance
     """
+    if not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.application_data,
+        _read_content_encoding(message),
+    )
     # Delegate version detection to format layer
-    return event_format.read(event_factory, message.application_data)
+    return structured_format.read(event_factory, body)
 
 
 def from_amqp(
     message: AMQPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse an AMQP message to a CloudEvent with automatic mode detection.
@@ -335,18 +417,56 @@ def from_amqp(
         >>> event2 = from_amqp(structured_msg, JSONFormat(), CloudEvent)
 
     :param message: AMQPMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances (auto-detected if None)
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
     content_type = message.properties.get(CONTENT_TYPE_PROPERTY, "")
 
-    if isinstance(content_type, str) and content_type.lower().startswith(
-        "application/cloudevents"
-    ):
-        return from_structured(message, event_format, event_factory)
+    if isinstance(content_type, str) and parse_content_type(content_type).is_structured:
+        return from_structured(message, event_format, event_factory, validate)
+
+    return from_binary(message, event_format, event_factory, validate, lazy)
+
+
+def peek_attributes(
+    message: AMQPMessage, event_format: Format | FormatRegistry
+) -> dict[str, Any]:
+    """
+    Read only the CloudEvent attributes of an AMQP message, without decoding the
+    event data or creating an event.
+
+    Detects the content mode like ``from_amqp()``. In binary mode the attributes
+    are taken from the application properties and the application-data section is
+    not touched. In structured mode they are read from the application-data section
+    with ``event_format.peek_attributes()``, or by reading the whole event if the
+    format cannot peek. The attributes are not validated.
+
+    Example:
+        >>> attributes = peek_attributes(message, JSONFormat())
+        >>> route(attributes["type"], attributes["source"])
+
+    :param message: AMQPMessage to read
+    :param event_format: Format implementation of structured mode messages, or
+        a registry to select it from by content type
+    :return: The attributes of the event
+    """
+    content_type = message.properties.get(CONTENT_TYPE_PROPERTY, "")
+
+    if isinstance(content_type, str) and parse_content_type(content_type).is_structured:
+        structured_format, body = read_message_body(
+            resolve_format(event_format, _read_content_type(message)),
+            message.application_data,
+            _read_content_encoding(message),
+        )
+        return read_attributes(structured_format, body)
 
-    return from_binary(message, event_format, event_factory)
+    return _read_binary_attributes(message)
 
 
 def to_binary_event(
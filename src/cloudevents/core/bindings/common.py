@@ -23,15 +23,20 @@ from datetime import datetime
 from typing import Any, Final
 from urllib.parse import quote, unquote
 
-from dateutil.parser import isoparse
-
-from cloudevents.core.base import EventFactory
-from cloudevents.core.spec import SPECVERSION_V0_3
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.formats.base import BatchFormat, Format
+from cloudevents.core.formats.compression import CompressedFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.frozen import encode_cached
+from cloudevents.core.lazy import LazyData, LazyTime
+from cloudevents.core.spec import SPECVERSION_V0_3, SPECVERSION_V1_0
+from cloudevents.core.time import format_time
 from cloudevents.core.v03.event import CloudEvent as CloudEventV03
 from cloudevents.core.v1.event import CloudEvent
 
 TIME_ATTR: Final[str] = "time"
 CONTENT_TYPE_HEADER: Final[str] = "content-type"
+CONTENT_ENCODING_HEADER: Final[str] = "content-encoding"
 DATACONTENTTYPE_ATTR: Final[str] = "datacontenttype"
 
 
@@ -46,10 +51,7 @@ def encode_header_value(value: Any) -> str:
     :return: Percent-encoded string suitable for protocol headers
     """
     if isinstance(value, datetime):
-        str_value = value.isoformat()
-        if str_value.endswith("+00:00"):
-            str_value = str_value[:-6] + "Z"
-        return quote(str_value, safe="")
+        return quote(format_time(value), safe="")
 
     return quote(str(value), safe="")
 
@@ -58,22 +60,24 @@ def decode_header_value(attr_name: str, value: str) -> Any:
     """
     Decode a CloudEvent attribute value from a protocol header.
 
-    Applies percent-decoding and special parsing for the 'time' attribute
-    (converts to datetime object using RFC 3339 parsing).
+    Applies percent-decoding and wraps the 'time' attribute in ``LazyTime``, so it
+    is only parsed as RFC 3339 when accessed.
 
     :param attr_name: The name of the CloudEvent attribute
     :param value: The percent-encoded header value
-    :return: Decoded value (datetime for 'time' attribute, string otherwise)
+    :return: Decoded value (LazyTime for 'time' attribute, string otherwise)
     """
     decoded = unquote(value)
 
     if attr_name == TIME_ATTR:
-        return isoparse(decoded)
+        return LazyTime(decoded)
 
     return decoded
 
 
-def get_event_factory_for_version(specversion: str) -> EventFactory:
+def get_event_factory_for_version(
+    specversion: str, validate: bool = True
+) -> EventFactory:
     """
     Get the appropriate event factory based on the CloudEvents specification version.
 
@@ -81,9 +85,195 @@ def get_event_factory_for_version(specversion: str) -> EventFactory:
     version. Used by protocol bindings for automatic version detection.
 
     :param specversion: The CloudEvents specification version (e.g., "0.3" or "1.0")
+    :param validate: If False, the returned factory skips attribute validation
     :return: EventFactory for the specified version (defaults to v1.0 for unknown versions)
     """
     if specversion == SPECVERSION_V0_3:
-        return CloudEventV03
+        return CloudEventV03 if validate else CloudEventV03.from_trusted
     # Default to v1.0 for unknown versions
-    return CloudEvent
+    return CloudEvent if validate else CloudEvent.from_trusted
+
+
+def trusted_event_factory(
+    attributes: dict[str, Any],
+    data: dict[str, Any] | str | bytes | LazyData | None = None,
+) -> BaseCloudEvent:
+    """
+    Event factory that detects the version from the attributes and skips validation.
+
+    :param attributes: The CloudEvent attributes
+    :param data: The CloudEvent data payload
+    :return: CloudEvent instance (v0.3 or v1.0 based on specversion)
+    """
+    if attributes.get("specversion", SPECVERSION_V1_0) == SPECVERSION_V0_3:
+        return CloudEventV03.from_trusted(attributes, data)
+    return CloudEvent.from_trusted(attributes, data)
+
+
+def get_trusted_event_factory(event_factory: EventFactory | None) -> EventFactory:
+    """
+    Get the variant of an event factory that skips attribute validation.
+
+    Factories exposing a ``from_trusted`` constructor (such as the core CloudEvent
+    classes) are swapped for it; other factories are returned unchanged. If no
+    factory is given, a version-detecting trusted factory is returned.
+
+    :param event_factory: The event factory requested by the caller, if any
+    :return: EventFactory that builds events without validation
+    """
+    if event_factory is None:
+        return trusted_event_factory
+    trusted: EventFactory = getattr(event_factory, "from_trusted", event_factory)
+    return trusted
+
+
+def read_event_data(
+    body: bytes,
+    datacontenttype: str | None,
+    event_format: Format,
+    lazy: bool = False,
+) -> Any:
+    """
+    Deserialize the event data of a binary content mode message.
+
+    :param body: The message body as bytes
+    :param datacontenttype: Content type of the data
+    :param event_format: Format implementation for data deserialization
+    :param lazy: If True, the body is wrapped in ``LazyData`` and only decoded when
+        the event data is first accessed
+    :return: Deserialized data, or ``LazyData`` when ``lazy`` is set. Only event
+        factories accepting ``LazyData`` (such as the core CloudEvent classes)
+        should be used in the latter case.
+    """
+    if lazy:
+        return LazyData(body, datacontenttype, event_format)
+    return event_format.read_data(body, datacontenttype)
+
+
+def write_event_data(event: BaseCloudEvent, event_format: Format) -> bytes:
+    """
+    Serialize the event data for a binary content mode message.
+
+    If the event still holds its data in the encoded form it was read in, and
+    neither its ``datacontenttype`` nor the format differ from those it was read
+    with, the original bytes are returned without decoding and re-encoding them.
+    The result is cached on frozen events.
+
+    :param event: The CloudEvent whose data to serialize
+    :param event_format: Format implementation for data serialization
+    :return: Serialized data as bytes
+    """
+    if isinstance(event, (CloudEvent, CloudEventV03)):
+        lazy_data = event.get_lazy_data()
+        if lazy_data is not None:
+            body = lazy_data.body_for(event.get_datacontenttype(), event_format)
+            if body is not None:
+                return body
+    return encode_cached(
+        event,
+        (event_format, "data"),
+        lambda: event_format.write_data(event.get_data(), event.get_datacontenttype()),
+    )
+
+
+def write_binary_body(
+    event: BaseCloudEvent, event_format: Format
+) -> tuple[bytes, str | None]:
+    """
+    Serialize the body of a binary content mode message, the event data, and
+    compress it if ``event_format`` is a ``CompressedFormat``.
+
+    :param event: The CloudEvent whose data to serialize
+    :param event_format: Format implementation for data serialization
+    :return: The body and its content encoding, or None if it is not compressed
+    """
+    if isinstance(event_format, CompressedFormat):
+        return event_format.compress(write_event_data(event, event_format.format))
+    return write_event_data(event, event_format), None
+
+
+def write_structured_body(
+    event: BaseCloudEvent, event_format: Format
+) -> tuple[bytes, str | None]:
+    """
+    Serialize the body of a structured content mode message, the whole event, and
+    compress it if ``event_format`` is a ``CompressedFormat``.
+
+    :param event: The CloudEvent to serialize
+    :param event_format: Format implementation for serialization
+    :return: The body and its content encoding, or None if it is not compressed
+    """
+    if isinstance(event_format, CompressedFormat):
+        return event_format.compress(event_format.format.write(event))
+    return event_format.write(event), None
+
+
+def read_message_body(
+    event_format: Format, body: bytes, content_encoding: str | None
+) -> tuple[Format, bytes]:
+    """
+    Decompress the body of a message if the binding was given a
+    ``CompressedFormat``. Other formats get the body as it is, whatever its
+    content encoding.
+
+    :param event_format: The format resolved to read the message with
+    :param body: The message body
+    :param content_encoding: The content encoding of the message, if any
+    :return: The format to read the body with and the body
+    :raises ValueError: If the body is invalid or too large once decompressed
+    """
+    if isinstance(event_format, CompressedFormat):
+        return event_format.format, event_format.decompress(body, content_encoding)
+    return event_format, body
+
+
+def resolve_format(
+    event_format: Format | FormatRegistry, content_type: str | None
+) -> Format:
+    """
+    Select the format to read a structured content mode message with.
+
+    A registry is asked for the format of the content type. A single format is
+    always used as it is, whatever the content type.
+
+    :param event_format: The format or registry passed to the binding
+    :param content_type: The content type of the message, if any
+    :return: The format
+    :raises ValueError: If a registry has no formats
+    """
+    if isinstance(event_format, FormatRegistry):
+        return event_format.get(content_type) or event_format.default
+    return event_format
+
+
+def resolve_batch_format(
+    event_format: BatchFormat | FormatRegistry, content_type: str | None
+) -> BatchFormat:
+    """
+    Select the format to read a batched content mode message with, like
+    ``resolve_format()``.
+
+    :param event_format: The format or registry passed to the binding
+    :param content_type: The content type of the message, if any
+    :return: The format
+    :raises ValueError: If a registry has no batch format for the content type
+    """
+    if isinstance(event_format, FormatRegistry):
+        batch_format = event_format.get_batch(content_type)
+        if batch_format is None:
+            raise ValueError(f"No batch format is registered for {content_type!r}")
+        return batch_format
+    return event_format
+
+
+def resolve_data_format(event_format: Format | FormatRegistry) -> Format:
+    """
+    Select the format to read the data of a binary content mode message with.
+
+    :param event_format: The format or registry passed to the binding
+    :return: The format, or the default format of a registry
+    :raises ValueError: If a registry has no formats
+    """
+    if isinstance(event_format, FormatRegistry):
+        return event_format.default
+    return event_format
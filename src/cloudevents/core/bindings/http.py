@@ -14,21 +14,31 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Final
+from typing import Any, Final, Iterable
 from urllib.parse import quote, unquote
 
-from dateutil.parser import isoparse
-
 from cloudevents.core.base import BaseCloudEvent, EventFactory
 from cloudevents.core.bindings.common import (
+    CONTENT_ENCODING_HEADER,
     CONTENT_TYPE_HEADER,
     DATACONTENTTYPE_ATTR,
     TIME_ATTR,
     get_event_factory_for_version,
+    get_trusted_event_factory,
+    read_event_data,
+    read_message_body,
+    resolve_batch_format,
+    resolve_data_format,
+    resolve_format,
+    write_binary_body,
+    write_structured_body,
 )
-from cloudevents.core.formats.base import Format
+from cloudevents.core.formats.base import BatchFormat, Format
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.lazy import LazyTime, get_encoded_attributes, read_attributes
 from cloudevents.core.spec import SPECVERSION_V1_0
+from cloudevents.core.time import format_time
 
 # Per CloudEvents HTTP binding spec (section 3.1.3.2), all printable ASCII
 # characters (U+0021-U+007E) are safe EXCEPT space, double-quote, and percent.
@@ -48,10 +58,7 @@ def _encode_header_value(value: Any) -> str:
     :return: Percent-encoded string suitable for HTTP headers
     """
     if isinstance(value, datetime):
-        str_value = value.isoformat()
-        if str_value.endswith("+00:00"):
-            str_value = str_value[:-6] + "Z"
-        return quote(str_value, safe=_CE_SAFE_CHARS)
+        return quote(format_time(value), safe=_CE_SAFE_CHARS)
     return quote(str(value), safe=_CE_SAFE_CHARS)
 
 
@@ -59,15 +66,16 @@ def _decode_header_value(attr_name: str, value: str) -> Any:
     """
     Decode a CloudEvent attribute value from an HTTP header.
 
-    Applies percent-decoding and parses the 'time' attribute as datetime.
+    Applies percent-decoding and wraps the 'time' attribute in ``LazyTime``, so it
+    is only parsed as RFC 3339 when accessed.
 
     :param attr_name: The name of the CloudEvent attribute
     :param value: The percent-encoded header value
-    :return: Decoded value (datetime for 'time' attribute, string otherwise)
+    :return: Decoded value (LazyTime for 'time' attribute, string otherwise)
     """
     decoded = unquote(value)
     if attr_name == TIME_ATTR:
-        return isoparse(decoded)
+        return LazyTime(decoded)
     return decoded
 
 
@@ -117,7 +125,7 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> HTTPMessage:
     :return: HTTPMessage with ce-prefixed headers and event data as body
     """
     headers: dict[str, str] = {}
-    attributes = event.get_attributes()
+    attributes = get_encoded_attributes(event)
 
     for attr_name, attr_value in attributes.items():
         if attr_value is None:
@@ -129,17 +137,19 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> HTTPMessage:
             header_name = f"{CE_PREFIX}{attr_name}"
             headers[header_name] = _encode_header_value(attr_value)
 
-    data = event.get_data()
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    body = event_format.write_data(data, datacontenttype)
+    body, content_encoding = write_binary_body(event, event_format)
+    if content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = content_encoding
 
     return HTTPMessage(headers=headers, body=body)
 
 
 def from_binary(
     message: HTTPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse an HTTP binary content mode message to a CloudEvent.
@@ -163,10 +173,40 @@ def from_binary(
         >>> event = from_binary(message, JSONFormat(), CloudEvent)
 
     :param message: HTTPMessage to parse
-    :param event_format: Format implementation for data deserialization
+    :param event_format: Format implementation for data deserialization, or a
+                         registry whose default format is used
     :param event_factory: Factory function to create CloudEvent instances (auto-detected if None)
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
+    attributes = _read_binary_attributes(message)
+
+    # Auto-detect version if factory not provided
+    if event_factory is None:
+        specversion = attributes.get("specversion", SPECVERSION_V1_0)
+        event_factory = get_event_factory_for_version(specversion, validate)
+    elif not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
+    data_format, body = read_message_body(
+        resolve_data_format(event_format), message.body, _read_content_encoding(message)
+    )
+    data = read_event_data(body, datacontenttype, data_format, lazy)
+
+    return event_factory(attributes, data)
+
+
+def _read_binary_attributes(message: HTTPMessage) -> dict[str, Any]:
+    """
+    Extract the CloudEvent attributes of an HTTP binary content mode message.
+
+    :param message: HTTPMessage to read the headers of
+    :return: The attributes from the ce-prefixed headers and the 'Content-Type' header
+    """
     attributes: dict[str, Any] = {}
 
     for header_name, header_value in message.headers.items():
@@ -178,15 +218,29 @@ def from_binary(
         elif normalized_name == CONTENT_TYPE_HEADER:
             attributes[DATACONTENTTYPE_ATTR] = header_value
 
-    # Auto-detect version if factory not provided
-    if event_factory is None:
-        specversion = attributes.get("specversion", SPECVERSION_V1_0)
-        event_factory = get_event_factory_for_version(specversion)
+    return attributes
 
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    data = event_format.read_data(message.body, datacontenttype)
 
-    return event_factory(attributes, data)
+def _read_content_type(message: HTTPMessage) -> str | None:
+    """
+    :param message: HTTPMessage to read the headers of
+    :return: The value of the 'Content-Type' header, if any
+    """
+    for header_name, header_value in message.headers.items():
+        if header_name.lower() == CONTENT_TYPE_HEADER:
+            return header_value
+    return None
+
+
+def _read_content_encoding(message: HTTPMessage) -> str | None:
+    """
+    :param message: HTTPMessage to read the headers of
+    :return: The value of the 'Content-Encoding' header, if any
+    """
+    for header_name, header_value in message.headers.items():
+        if header_name.lower() == CONTENT_ENCODING_HEADER:
+            return header_value
+    return None
 
 
 def to_structured(event: BaseCloudEvent, event_format: Format) -> HTTPMessage:
@@ -217,15 +271,18 @@ def to_structured(event: BaseCloudEvent, event_format: Format) -> HTTPMessage:
 
     headers = {CONTENT_TYPE_HEADER: content_type}
 
-    body = event_format.write(event)
+    body, content_encoding = write_structured_body(event, event_format)
+    if content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = content_encoding
 
     return HTTPMessage(headers=headers, body=body)
 
 
 def from_structured(
     message: HTTPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
 ) -> BaseCloudEvent:
     """
     Parse an HTTP structured content mode message to a CloudEvent.
@@ -251,19 +308,102 @@ def from_structured(
         >>> event = from_structured(message, JSONFormat())
 
     :param message: HTTPMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances.
                          If None, the format will auto-detect the version.
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
     :return: CloudEvent instance
     """
+    if not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.body,
+        _read_content_encoding(message),
+    )
     # Delegate version detection to format layer
-    return event_format.read(event_factory, message.body)
+    return structured_format.read(event_factory, body)
+
+
+def to_batch(
+    events: Iterable[BaseCloudEvent], event_format: BatchFormat
+) -> HTTPMessage:
+    """
+    Convert CloudEvents to a single HTTP batched content mode message.
+
+    In batched mode, all events are serialized into the HTTP body using the batch
+    representation of the specified format. The Content-Type header is set to the
+    format's batch media type.
+
+    Example:
+        >>> from cloudevents.core.v1.event import CloudEvent
+        >>> from cloudevents.core.formats.json import JSONFormat
+        >>>
+        >>> events = [
+        ...     CloudEvent(attributes={"type": "com.example.test", "source": "/test"})
+        ...     for _ in range(10)
+        ... ]
+        >>> message = to_batch(events, JSONFormat())
+        >>> # message.headers = {"content-type": "application/cloudevents-batch+json"}
+        >>> # message.body = b'[{"type": "com.example.test", ...}, ...]'
+
+    :param events: The CloudEvents to convert
+    :param event_format: Format implementation for serialization
+    :return: HTTPMessage with all events in the body
+    """
+    headers = {CONTENT_TYPE_HEADER: event_format.get_batch_content_type()}
+
+    body = event_format.write_batch(events)
+
+    return HTTPMessage(headers=headers, body=body)
+
+
+def from_batch(
+    message: HTTPMessage,
+    event_format: BatchFormat | FormatRegistry,
+    event_factory: EventFactory | None = None,
+    validate: bool = True,
+) -> list[BaseCloudEvent]:
+    """
+    Parse an HTTP batched content mode message to CloudEvents.
+
+    If event_factory is not provided, the version of every event is detected
+    separately, so a batch may mix v0.3 and v1.0 events.
+
+    Example:
+        >>> from cloudevents.core.formats.json import JSONFormat
+        >>>
+        >>> message = HTTPMessage(
+        ...     headers={"content-type": "application/cloudevents-batch+json"},
+        ...     body=b'[{"type": "com.example.test", "source": "/test", ...}]'
+        ... )
+        >>> events = from_batch(message, JSONFormat())
+
+    :param message: HTTPMessage to parse
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
+    :param event_factory: Factory function to create CloudEvent instances.
+                         If None, the format will auto-detect the version.
+    :param validate: If False, the events are created without validating their attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :return: CloudEvent instances, in the order of the batch
+    """
+    if not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    batch_format = resolve_batch_format(event_format, _read_content_type(message))
+    return batch_format.read_batch(event_factory, message.body)
 
 
 def from_http(
     message: HTTPMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse an HTTP message to a CloudEvent with automatic mode detection.
@@ -296,14 +436,51 @@ def from_http(
         >>> event2 = from_http(structured_msg, JSONFormat(), CloudEvent)
 
     :param message: HTTPMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances (auto-detected if None)
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
     if any(key.lower().startswith(CE_PREFIX) for key in message.headers.keys()):
-        return from_binary(message, event_format, event_factory)
+        return from_binary(message, event_format, event_factory, validate, lazy)
 
-    return from_structured(message, event_format, event_factory)
+    return from_structured(message, event_format, event_factory, validate)
+
+
+def peek_attributes(
+    message: HTTPMessage, event_format: Format | FormatRegistry
+) -> dict[str, Any]:
+    """
+    Read only the CloudEvent attributes of an HTTP message, without decoding the
+    event data or creating an event.
+
+    Detects the content mode like ``from_http()``. In binary mode the attributes
+    are taken from the headers and the body is not touched. In structured mode they
+    are read from the body with ``event_format.peek_attributes()``, or by reading
+    the whole event if the format cannot peek. The attributes are not validated.
+
+    Example:
+        >>> attributes = peek_attributes(message, JSONFormat())
+        >>> route(attributes["type"], attributes["source"])
+
+    :param message: HTTPMessage to read
+    :param event_format: Format implementation of structured mode messages, or
+        a registry to select it from by content type
+    :return: The attributes of the event
+    """
+    if any(key.lower().startswith(CE_PREFIX) for key in message.headers.keys()):
+        return _read_binary_attributes(message)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.body,
+        _read_content_encoding(message),
+    )
+    return read_attributes(structured_format, body)
 
 
 def to_binary_event(
@@ -421,3 +598,45 @@ def from_http_event(
     if event_format is None:
         event_format = JSONFormat()
     return from_http(message, event_format, None)
+
+
+def to_batch_event(
+    events: Iterable[BaseCloudEvent],
+    event_format: BatchFormat | None = None,
+) -> HTTPMessage:
+    """
+    Convenience wrapper for to_batch with JSON format as default.
+
+    Example:
+        >>> from cloudevents.core.bindings import http
+        >>> message = http.to_batch_event(events)
+
+    :param events: The CloudEvents to convert
+    :param event_format: Format implementation (defaults to JSONFormat)
+    :return: HTTPMessage with all events in the body
+    """
+    if event_format is None:
+        event_format = JSONFormat()
+    return to_batch(events, event_format)
+
+
+def from_batch_event(
+    message: HTTPMessage,
+    event_format: BatchFormat | None = None,
+) -> list[BaseCloudEvent]:
+    """
+    Convenience wrapper for from_batch with JSON format and auto-detection.
+
+    Auto-detects the CloudEvents version (v0.3 or v1.0) of every event.
+
+    Example:
+        >>> from cloudevents.core.bindings import http
+        >>> events = http.from_batch_event(message)
+
+    :param message: HTTPMessage to parse
+    :param event_format: Format implementation (defaults to JSONFormat)
+    :return: CloudEvent instances (v0.3 or v1.0 based on specversion)
+    """
+    if event_format is None:
+        event_format = JSONFormat()
+    return from_batch(message, event_format, None)
@@ -16,18 +16,29 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Final
 
-from dateutil.parser import isoparse
-
 from cloudevents.core.base import BaseCloudEvent, EventFactory
 from cloudevents.core.bindings.common import (
+    CONTENT_ENCODING_HEADER,
     CONTENT_TYPE_HEADER,
     DATACONTENTTYPE_ATTR,
     TIME_ATTR,
     get_event_factory_for_version,
+    get_trusted_event_factory,
+    read_event_data,
+    read_message_body,
+    resolve_data_format,
+    resolve_format,
+    write_binary_body,
+    write_structured_body,
 )
 from cloudevents.core.formats.base import Format
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.lazy import LazyTime, get_encoded_attributes, read_attributes
 from cloudevents.core.spec import SPECVERSION_V1_0
+from cloudevents.core.time import format_time
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
 
 CE_PREFIX: Final[str] = "ce_"
 PARTITIONKEY_ATTR: Final[str] = "partitionkey"
@@ -99,7 +110,7 @@ def to_binary(
     :return: KafkaMessage with ce_-prefixed headers and event data as value
     """
     headers: dict[str, bytes] = {}
-    attributes = event.get_attributes()
+    attributes = get_encoded_attributes(event)
 
     # Apply key mapper
     if key_mapper is None:
@@ -115,24 +126,23 @@ def to_binary(
         else:
             header_name = f"{CE_PREFIX}{attr_name}"
             if isinstance(attr_value, datetime):
-                s = attr_value.isoformat()
-                if s.endswith("+00:00"):
-                    s = s[:-6] + "Z"
-                headers[header_name] = s.encode("utf-8")
+                headers[header_name] = format_time(attr_value).encode("utf-8")
             else:
                 headers[header_name] = str(attr_value).encode("utf-8")
 
-    data = event.get_data()
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    value = event_format.write_data(data, datacontenttype)
+    value, content_encoding = write_binary_body(event, event_format)
+    if content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = content_encoding.encode("utf-8")
 
     return KafkaMessage(headers=headers, key=message_key, value=value)
 
 
 def from_binary(
     message: KafkaMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse a Kafka binary content mode message to a CloudEvent.
@@ -158,10 +168,51 @@ def from_binary(
         >>> event = from_binary(message, JSONFormat(), CloudEvent)
 
     :param message: KafkaMessage to parse
-    :param event_format: Format implementation for data deserialization
+    :param event_format: Format implementation for data deserialization, or a
+                         registry whose default format is used
     :param event_factory: Factory function to create CloudEvent instances
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
+    attributes = _read_binary_attributes(message)
+
+    # Auto-detect version if factory not provided
+    if event_factory is None:
+        specversion = attributes.get("specversion", SPECVERSION_V1_0)
+        event_factory = get_event_factory_for_version(specversion, validate)
+    elif not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
+    data_format, body = read_message_body(
+        resolve_data_format(event_format),
+        message.value,
+        _read_content_encoding(message),
+    )
+    data = read_event_data(body, datacontenttype, data_format, lazy)
+
+    return event_factory(attributes, data)
+
+
+def _read_partition_key(message: KafkaMessage) -> str | None:
+    if message.key is None:
+        return None
+    return (
+        message.key.decode("utf-8") if isinstance(message.key, bytes) else message.key
+    )
+
+
+def _read_binary_attributes(message: KafkaMessage) -> dict[str, Any]:
+    """
+    Extract the CloudEvent attributes of a Kafka binary content mode message.
+
+    :param message: KafkaMessage to read the headers and key of
+    :return: The attributes from the ce_-prefixed headers, the 'content-type'
+        header and the message key as 'partitionkey'
+    """
     attributes: dict[str, Any] = {}
 
     for header_name, header_value_bytes in message.headers.items():
@@ -172,30 +223,40 @@ def from_binary(
         if normalized_name.startswith(CE_PREFIX):
             attr_name = normalized_name[len(CE_PREFIX) :]
             if attr_name == TIME_ATTR:
-                attributes[attr_name] = isoparse(header_value)
+                attributes[attr_name] = LazyTime(header_value)
             else:
                 attributes[attr_name] = header_value
         elif normalized_name == CONTENT_TYPE_HEADER:
             attributes[DATACONTENTTYPE_ATTR] = header_value
 
     # If message has a key, add it as partitionkey extension attribute
-    if message.key is not None:
-        key_value = (
-            message.key.decode("utf-8")
-            if isinstance(message.key, bytes)
-            else message.key
-        )
+    key_value = _read_partition_key(message)
+    if key_value is not None:
         attributes[PARTITIONKEY_ATTR] = key_value
 
-    # Auto-detect version if factory not provided
-    if event_factory is None:
-        specversion = attributes.get("specversion", SPECVERSION_V1_0)
-        event_factory = get_event_factory_for_version(specversion)
+    return attributes
 
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    data = event_format.read_data(message.value, datacontenttype)
 
-    return event_factory(attributes, data)
+def _read_content_type(message: KafkaMessage) -> str | None:
+    """
+    :param message: KafkaMessage to read the headers of
+    :return: The value of the 'content-type' header, if any
+    """
+    for header_name, header_value in message.headers.items():
+        if header_name.lower() == CONTENT_TYPE_HEADER:
+            return header_value.decode("utf-8")
+    return None
+
+
+def _read_content_encoding(message: KafkaMessage) -> str | None:
+    """
+    :param message: KafkaMessage to read the headers of
+    :return: The value of the 'content-encoding' header, if any
+    """
+    for header_name, header_value in message.headers.items():
+        if header_name.lower() == CONTENT_ENCODING_HEADER:
+            return header_value.decode("utf-8")
+    return None
 
 
 def to_structured(
@@ -232,7 +293,9 @@ def to_structured(
 
     headers = {CONTENT_TYPE_HEADER: content_type.encode("utf-8")}
 
-    value = event_format.write(event)
+    value, content_encoding = write_structured_body(event, event_format)
+    if content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = content_encoding.encode("utf-8")
 
     if key_mapper is None:
         key_mapper = _default_key_mapper
@@ -243,8 +306,9 @@ def to_structured(
 
 def from_structured(
     message: KafkaMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
 ) -> BaseCloudEvent:
     """
     Parse a Kafka structured content mode message to a CloudEvent.
@@ -272,35 +336,51 @@ def from_structured(
         >>> event = from_structured(message, JSONFormat())
 
     :param message: KafkaMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances.
                          If None, the format will auto-detect the version.
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
     :return: CloudEvent instance
     """
+    if not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.value,
+        _read_content_encoding(message),
+    )
     # Delegate version detection to format layer
-    event = event_format.read(event_factory, message.value)
+    event = structured_format.read(event_factory, body)
 
     # If message has a key, we need to add it as partitionkey extension attribute
     # Since the event is already created, we need to reconstruct it with the additional attribute
-    if message.key is not None:
-        key_value = (
-            message.key.decode("utf-8")
-            if isinstance(message.key, bytes)
-            else message.key
-        )
-        attributes = event.get_attributes()
-        attributes[PARTITIONKEY_ATTR] = key_value
-        data = event.get_data()
+    key_value = _read_partition_key(message)
+    if key_value is not None:
+        if isinstance(event, (CloudEvent, CloudEventV03)):
+            # Only the added attribute is validated, the data is shared as-is
+            event = event.evolve({PARTITIONKEY_ATTR: key_value})
+        else:
+            attributes = event.get_attributes()
+            attributes[PARTITIONKEY_ATTR] = key_value
+            data = event.get_data()
 
-        event = type(event)(attributes, data)
+            factory: EventFactory = type(event)
+            if not validate:
+                factory = get_trusted_event_factory(factory)
+            event = factory(attributes, data)
 
     return event
 
 
 def from_kafka(
     message: KafkaMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse a Kafka message to a CloudEvent with automatic mode detection.
@@ -335,15 +415,58 @@ def from_kafka(
         >>> event2 = from_kafka(structured_msg, JSONFormat(), CloudEvent)
 
     :param message: KafkaMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances (auto-detected if None)
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
     for header_name in message.headers.keys():
         if header_name.lower().startswith(CE_PREFIX):
-            return from_binary(message, event_format, event_factory)
+            return from_binary(message, event_format, event_factory, validate, lazy)
 
-    return from_structured(message, event_format, event_factory)
+    return from_structured(message, event_format, event_factory, validate)
+
+
+def peek_attributes(
+    message: KafkaMessage, event_format: Format | FormatRegistry
+) -> dict[str, Any]:
+    """
+    Read only the CloudEvent attributes of a Kafka message, without decoding the
+    event data or creating an event.
+
+    Detects the content mode like ``from_kafka()``. In binary mode the attributes
+    are taken from the headers and the value is not touched. In structured mode they
+    are read from the value with ``event_format.peek_attributes()``, or by reading
+    the whole event if the format cannot peek. In both modes a message key is
+    returned as the 'partitionkey' attribute. The attributes are not validated.
+
+    Example:
+        >>> attributes = peek_attributes(message, JSONFormat())
+        >>> route(attributes["type"], attributes["source"])
+
+    :param message: KafkaMessage to read
+    :param event_format: Format implementation of structured mode messages, or
+        a registry to select it from by content type
+    :return: The attributes of the event
+    """
+    for header_name in message.headers.keys():
+        if header_name.lower().startswith(CE_PREFIX):
+            return _read_binary_attributes(message)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.value,
+        _read_content_encoding(message),
+    )
+    attributes = read_attributes(structured_format, body)
+    key_value = _read_partition_key(message)
+    if key_value is not None:
+        attributes[PARTITIONKEY_ATTR] = key_value
+    return attributes
 
 
 def to_binary_event(
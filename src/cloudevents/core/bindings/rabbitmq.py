@@ -23,17 +23,26 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Final
 
-from dateutil.parser import isoparse
-
 from cloudevents.core.base import BaseCloudEvent, EventFactory
 from cloudevents.core.bindings.common import (
     DATACONTENTTYPE_ATTR,
     TIME_ATTR,
     get_event_factory_for_version,
+    get_trusted_event_factory,
+    read_event_data,
+    read_message_body,
+    resolve_data_format,
+    resolve_format,
+    write_binary_body,
+    write_structured_body,
 )
 from cloudevents.core.formats.base import Format
+from cloudevents.core.formats.content_type import parse_content_type
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.lazy import LazyTime, get_encoded_attributes, read_attributes
 from cloudevents.core.spec import SPECVERSION_V1_0
+from cloudevents.core.time import format_time
 from cloudevents.core.v1.event import CloudEvent
 
 CE_PREFIX: Final[str] = "ce-"
@@ -52,11 +61,14 @@ class RabbitMQMessage:
         headers: RabbitMQ message headers as string key-value pairs
         content_type: RabbitMQ BasicProperties content_type field
         body: Message body as bytes
+        content_encoding: RabbitMQ BasicProperties content_encoding field, set when
+            the body is compressed
     """
 
     headers: dict[str, str]
     content_type: str | None
     body: bytes
+    content_encoding: str | None = None
 
 
 def to_binary(event: BaseCloudEvent, event_format: Format) -> RabbitMQMessage:
@@ -87,7 +99,7 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> RabbitMQMessage:
     """
     headers: dict[str, str] = {}
     content_type: str | None = None
-    attributes = event.get_attributes()
+    attributes = get_encoded_attributes(event)
 
     for attr_name, attr_value in attributes.items():
         if attr_value is None:
@@ -98,24 +110,26 @@ def to_binary(event: BaseCloudEvent, event_format: Format) -> RabbitMQMessage:
         else:
             header_name = f"{CE_PREFIX}{attr_name}"
             if isinstance(attr_value, datetime):
-                s = attr_value.isoformat()
-                if s.endswith("+00:00"):
-                    s = s[:-6] + "Z"
-                headers[header_name] = s
+                headers[header_name] = format_time(attr_value)
             else:
                 headers[header_name] = str(attr_value)
 
-    data = event.get_data()
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    body = event_format.write_data(data, datacontenttype)
+    body, content_encoding = write_binary_body(event, event_format)
 
-    return RabbitMQMessage(headers=headers, content_type=content_type, body=body)
+    return RabbitMQMessage(
+        headers=headers,
+        content_type=content_type,
+        body=body,
+        content_encoding=content_encoding,
+    )
 
 
 def from_binary(
     message: RabbitMQMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse a RabbitMQ binary content mode message to a CloudEvent.
@@ -144,10 +158,40 @@ def from_binary(
         >>> event = from_binary(message, JSONFormat(), CloudEvent)
 
     :param message: RabbitMQMessage to parse
-    :param event_format: Format implementation for data deserialization
+    :param event_format: Format implementation for data deserialization, or a
+                         registry whose default format is used
     :param event_factory: Factory function to create CloudEvent instances
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
+    attributes = _read_binary_attributes(message)
+
+    # Auto-detect version if factory not provided
+    if event_factory is None:
+        specversion = attributes.get("specversion", SPECVERSION_V1_0)
+        event_factory = get_event_factory_for_version(specversion, validate)
+    elif not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
+    data_format, body = read_message_body(
+        resolve_data_format(event_format), message.body, _read_content_encoding(message)
+    )
+    data = read_event_data(body, datacontenttype, data_format, lazy)
+
+    return event_factory(attributes, data)
+
+
+def _read_binary_attributes(message: RabbitMQMessage) -> dict[str, Any]:
+    """
+    Extract the CloudEvent attributes of a RabbitMQ binary content mode message.
+
+    :param message: RabbitMQMessage to read the headers of
+    :return: The attributes from the ce-prefixed headers and the content_type property
+    """
     attributes: dict[str, Any] = {}
 
     for header_name, header_value in message.headers.items():
@@ -156,7 +200,7 @@ def from_binary(
         if normalized_name.startswith(CE_PREFIX):
             attr_name = normalized_name[len(CE_PREFIX) :]
             if attr_name == TIME_ATTR:
-                attributes[attr_name] = isoparse(header_value)
+                attributes[attr_name] = LazyTime(header_value)
             else:
                 attributes[attr_name] = header_value
         # Non-prefixed headers are ignored
@@ -164,15 +208,23 @@ def from_binary(
     if message.content_type is not None:
         attributes[DATACONTENTTYPE_ATTR] = message.content_type
 
-    # Auto-detect version if factory not provided
-    if event_factory is None:
-        specversion = attributes.get("specversion", SPECVERSION_V1_0)
-        event_factory = get_event_factory_for_version(specversion)
+    return attributes
 
-    datacontenttype = attributes.get(DATACONTENTTYPE_ATTR)
-    data = event_format.read_data(message.body, datacontenttype)
 
-    return event_factory(attributes, data)
+def _read_content_type(message: RabbitMQMessage) -> str | None:
+    """
+    :param message: RabbitMQMessage to read the properties of
+    :return: The content type property, if any
+    """
+    return message.content_type
+
+
+def _read_content_encoding(message: RabbitMQMessage) -> str | None:
+    """
+    :param message: RabbitMQMessage to read the properties of
+    :return: The content encoding property, if any
+    """
+    return message.content_encoding
 
 
 def to_structured(event: BaseCloudEvent, event_format: Format) -> RabbitMQMessage:
@@ -201,15 +253,21 @@ def to_structured(event: BaseCloudEvent, event_format: Format) -> RabbitMQMessag
     """
     content_type = event_format.get_content_type()
     headers: dict[str, str] = {}
-    body = event_format.write(event)
+    body, content_encoding = write_structured_body(event, event_format)
 
-    return RabbitMQMessage(headers=headers, content_type=content_type, body=body)
+    return RabbitMQMessage(
+        headers=headers,
+        content_type=content_type,
+        body=body,
+        content_encoding=content_encoding,
+    )
 
 
 def from_structured(
     message: RabbitMQMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
 ) -> BaseCloudEvent:
     """
     Parse a RabbitMQ structured content mode message to a CloudEvent.
@@ -232,18 +290,31 @@ def from_structured(
         >>> event = from_structured(message, JSONFormat(), CloudEvent)
 
     :param message: RabbitMQMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances.
                          If None, the format will auto-detect the version.
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
     :return: CloudEvent instance
     """
-    return event_format.read(event_factory, message.body)
+    if not validate:
+        event_factory = get_trusted_event_factory(event_factory)
+
+    structured_format, body = read_message_body(
+        resolve_format(event_format, _read_content_type(message)),
+        message.body,
+        _read_content_encoding(message),
+    )
+    return structured_format.read(event_factory, body)
 
 
 def from_rabbitmq(
     message: RabbitMQMessage,
-    event_format: Format,
+    event_format: Format | FormatRegistry,
     event_factory: EventFactory | None = None,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> BaseCloudEvent:
     """
     Parse a RabbitMQ message to a CloudEvent with automatic mode detection.
@@ -275,16 +346,56 @@ def from_rabbitmq(
         >>> event2 = from_rabbitmq(structured_msg, JSONFormat(), CloudEvent)
 
     :param message: RabbitMQMessage to parse
-    :param event_format: Format implementation for deserialization
+    :param event_format: Format implementation for deserialization, or a
+                         registry to select it from by content type
     :param event_factory: Factory function to create CloudEvent instances (auto-detected if None)
+    :param validate: If False, the event is created without validating its attributes.
+                     Only use this for messages from a trusted, already validated source.
+    :param lazy: If True, the data is kept encoded and only decoded on the first
+                 get_data() call (binary content mode only)
     :return: CloudEvent instance
     """
-    content_type = message.content_type or ""
+    content_type = message.content_type
+
+    if content_type and parse_content_type(content_type).is_structured:
+        return from_structured(message, event_format, event_factory, validate)
+
+    return from_binary(message, event_format, event_factory, validate, lazy)
+
+
+def peek_attributes(
+    message: RabbitMQMessage, event_format: Format | FormatRegistry
+) -> dict[str, Any]:
+    """
+    Read only the CloudEvent attributes of a RabbitMQ message, without decoding
+    the event data or creating an event.
+
+    Detects the content mode like ``from_rabbitmq()``. In binary mode the
+    attributes are taken from the headers and the body is not touched. In
+    structured mode they are read from the body with
+    ``event_format.peek_attributes()``, or by reading the whole event if the format
+    cannot peek. The attributes are not validated.
+
+    Example:
+        >>> attributes = peek_attributes(message, JSONFormat())
+        >>> route(attributes["type"], attributes["source"])
+
+    :param message: RabbitMQMessage to read
+    :param event_format: Format implementation of structured mode messages, or
+        a registry to select it from by content type
+    :return: The attributes of the event
+    """
+    content_type = message.content_type
 
-    if content_type.lower().startswith("application/cloudevents"):
-        return from_structured(message, event_format, event_factory)
+    if content_type and parse_content_type(content_type).is_structured:
+        structured_format, body = read_message_body(
+            resolve_format(event_format, _read_content_type(message)),
+            message.body,
+            _read_content_encoding(message),
+        )
+        return read_attributes(structured_format, body)
 
-    return from_binary(message, event_format, event_factory)
+    return _read_binary_attributes(message)
 
 
 def to_binary_event(
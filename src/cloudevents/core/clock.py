@@ -0,0 +1,152 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Clock sources for the default event time.
+
+CloudEvent classes call ``current_time()`` when an event is created without a
+``time``. The clock behind it can be replaced with ``set_clock()``, and
+``batch_time()`` stamps all events created in a block with a single timestamp.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Protocol
+
+
+class Clock(Protocol):
+    """
+    Protocol for clock sources.
+    """
+
+    def now(self) -> datetime:
+        """
+        Get the current time.
+
+        :return: The current time as a timezone-aware datetime
+        """
+        ...
+
+
+class SystemClock:
+    """
+    Reads the system clock on every call. This is the default clock.
+    """
+
+    def now(self) -> datetime:
+        """
+        Get the current UTC time from the system clock.
+
+        :return: The current time as a timezone-aware datetime
+        """
+        return datetime.now(timezone.utc)
+
+
+class CoarseClock:
+    """
+    Caches the current UTC time and only reads the system clock again once the
+    configured resolution has elapsed.
+
+    Events created within the same resolution window share one ``datetime``
+    instance, trading timestamp precision for less work per event.
+    """
+
+    def __init__(self, resolution: float = 0.001) -> None:
+        """
+        Create a new coarse clock.
+
+        :param resolution: Time in seconds for which a timestamp is reused
+        :raises ValueError: If the resolution is negative
+        """
+        if resolution < 0:
+            raise ValueError("Clock resolution must not be negative")
+        self._resolution_ns = int(resolution * 1_000_000_000)
+        self._expires_ns = 0
+        self._now = datetime.now(timezone.utc)
+
+    def now(self) -> datetime:
+        """
+        Get the current UTC time, at most ``resolution`` seconds old.
+
+        :return: The current time as a timezone-aware datetime
+        """
+        monotonic_ns = time.monotonic_ns()
+        if monotonic_ns >= self._expires_ns:
+            self._now = datetime.now(timezone.utc)
+            self._expires_ns = monotonic_ns + self._resolution_ns
+        return self._now
+
+
+_clock: Clock = SystemClock()
+_batch_time: ContextVar[datetime | None] = ContextVar(
+    "cloudevents_batch_time", default=None
+)
+
+
+def get_clock() -> Clock:
+    """
+    Get the clock used for default event times.
+
+    :return: The current clock
+    """
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """
+    Set the clock used for default event times.
+
+    For example, ``set_clock(CoarseClock(resolution=0.01))`` makes events created
+    without a ``time`` reuse a timestamp for up to 10 milliseconds.
+
+    :param clock: The clock to use
+    """
+    global _clock
+    _clock = clock
+
+
+def current_time() -> datetime:
+    """
+    Get the time for an event created without a ``time`` attribute.
+
+    :return: The batch timestamp inside ``batch_time()``, otherwise the current
+        time of the configured clock
+    """
+    batch = _batch_time.get()
+    if batch is not None:
+        return batch
+    return _clock.now()
+
+
+@contextmanager
+def batch_time(timestamp: datetime | None = None) -> Iterator[datetime]:
+    """
+    Stamp all events created inside the block with the same time.
+
+    The timestamp is bound to the current context, so concurrent threads and
+    asyncio tasks are not affected. Blocks can be nested.
+
+    :param timestamp: The timestamp to use, the current time of the configured
+        clock if not given
+    :return: A context manager yielding the timestamp used for the block
+    """
+    if timestamp is None:
+        timestamp = _clock.now()
+    token = _batch_time.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _batch_time.reset(token)
@@ -41,6 +41,26 @@ class CloudEventValidationError(BaseCloudEventException):
         return f"{super().__str__()}: {', '.join(error_messages)}"
 
 
+class EventBatchValidationError(BaseCloudEventException):
+    """
+    Holds the validation errors of the invalid events in an event batch.
+    """
+
+    def __init__(self, errors: dict[int, CloudEventValidationError]) -> None:
+        """
+        :param errors: The validation errors where key is the position of the
+            event in the batch and value is the validation error of that event.
+        """
+        super().__init__("Failed to create EventBatch due to the validation errors")
+        self.errors: dict[int, CloudEventValidationError] = errors
+
+    def __str__(self) -> str:
+        error_messages: list[str] = [
+            f"event {index}: {error}" for index, error in self.errors.items()
+        ]
+        return f"{super().__str__()}: {'; '.join(error_messages)}"
+
+
 class MissingRequiredAttributeError(BaseCloudEventException, ValueError):
     """
     Raised for attributes that are required to be present by the specification.
@@ -79,3 +99,24 @@ class InvalidAttributeValueError(BaseCloudEventException, ValueError):
     def __init__(self, attribute_name: str, msg: str) -> None:
         self.attribute_name: str = attribute_name
         super().__init__(msg)
+
+
+class BatchEntryError(BaseCloudEventException, ValueError):
+    """
+    Raised for an entry of a batch or stream of events that cannot be read.
+
+    Streaming readers collect these errors and skip the entry instead of aborting
+    the stream.
+    """
+
+    def __init__(self, index: int, offset: int, error: Exception) -> None:
+        """
+        :param index: The position of the entry in the batch or stream
+        :param offset: The offset of the entry in the stream, in bytes or
+            characters as documented by the reader
+        :param error: The error raised while reading the entry
+        """
+        self.index: int = index
+        self.offset: int = offset
+        self.error: Exception = error
+        super().__init__(f"Invalid entry {index} at offset {offset}: {error}")
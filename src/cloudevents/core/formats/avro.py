@@ -0,0 +1,837 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Avro event format (``application/cloudevents+avro``).
+
+Events are encoded with the ``CloudEvent`` record schema of the CloudEvents Avro
+format specification, ``CLOUDEVENT_SCHEMA``. The schema is compiled once into
+encoder and decoder functions shared by all ``AvroFormat`` instances, so the
+format does not depend on an Avro library. Object container files, for archiving
+many events in one file, are written and read in blocks.
+"""
+
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import IO, Any, Callable, Final, Iterable, Iterator
+
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.formats.binary import BinaryFormat
+from cloudevents.core.formats.content_type import parse_content_type
+from cloudevents.core.formats.json_backends import JSONBackend
+from cloudevents.core.lazy import LazyTime, RawJSON, get_encoded_attributes
+from cloudevents.core.spec import SPECVERSION_V1_0
+from cloudevents.core.time import format_time
+
+CLOUDEVENT_SCHEMA: Final[dict[str, Any]] = {
+    "namespace": "io.cloudevents",
+    "type": "record",
+    "name": "CloudEvent",
+    "version": "1.0",
+    "doc": "Avro Event Format for CloudEvents",
+    "fields": [
+        {
+            "name": "attribute",
+            "type": {
+                "type": "map",
+                "values": ["null", "boolean", "int", "string", "bytes"],
+            },
+        },
+        {
+            "name": "data",
+            "type": [
+                "bytes",
+                "null",
+                "boolean",
+                {
+                    "type": "map",
+                    "values": [
+                        "null",
+                        "boolean",
+                        {
+                            "type": "record",
+                            "name": "CloudEventData",
+                            "doc": "Representation of a JSON Value",
+                            "fields": [
+                                {
+                                    "name": "value",
+                                    "type": {
+                                        "type": "map",
+                                        "values": [
+                                            "null",
+                                            "boolean",
+                                            {"type": "map", "values": "CloudEventData"},
+                                            {
+                                                "type": "array",
+                                                "items": "CloudEventData",
+                                            },
+                                            "double",
+                                            "string",
+                                        ],
+                                    },
+                                }
+                            ],
+                        },
+                        "double",
+                        "string",
+                    ],
+                },
+                {"type": "array", "items": "CloudEventData"},
+                "double",
+                "string",
+            ],
+        },
+    ],
+}
+"""The ``CloudEvent`` record schema of the CloudEvents Avro format."""
+
+# Default number of uncompressed bytes of events in a block of a container file
+DEFAULT_BLOCK_SIZE: Final[int] = 64 * 1024
+
+# Records holding a JSON value in their only field, written from and read into
+# the plain value
+_JSON_VALUE_RECORDS: Final[frozenset[str]] = frozenset(
+    {"io.cloudevents.CloudEventData"}
+)
+
+_CONTAINER_MAGIC: Final[bytes] = b"Obj\x01"
+_SYNC_SIZE: Final[int] = 16
+_CODECS: Final[frozenset[str]] = frozenset({"null", "deflate"})
+_INT_MIN: Final[int] = -(2**31)
+_INT_MAX: Final[int] = 2**31 - 1
+_DOUBLE: Final[struct.Struct] = struct.Struct("<d")
+_FLOAT: Final[struct.Struct] = struct.Struct("<f")
+
+# Encodes a value to the end of a buffer
+_Encoder = Callable[[bytearray, Any], None]
+# Decodes a value at a position, returning it and the position after it
+_Decoder = Callable[[ReadableBuffer, int], tuple[Any, int]]
+# Whether a value can be encoded with a branch of a union
+_Matcher = Callable[[Any], bool]
+
+
+def _write_long(buffer: bytearray, value: int) -> None:
+    # Zigzag encoding maps small negative numbers to small varints
+    value = value << 1 if value >= 0 else (-value << 1) - 1
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_long(data: ReadableBuffer, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        try:
+            byte = data[pos]
+        except IndexError:
+            raise ValueError("Truncated Avro data") from None
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value >> 1) ^ -(value & 1), pos
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Invalid long in Avro data")
+
+
+def _write_bytes(buffer: bytearray, value: ReadableBuffer) -> None:
+    _write_long(buffer, len(value))
+    buffer += value
+
+
+def _read_slice(data: ReadableBuffer, pos: int) -> tuple[int, int]:
+    length, pos = _read_long(data, pos)
+    end = pos + length
+    if length < 0 or end > len(data):
+        raise ValueError("Truncated Avro data")
+    return pos, end
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int and _INT_MIN <= value <= _INT_MAX
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_PRIMITIVE_MATCHERS: Final[dict[str, _Matcher]] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: isinstance(value, bool),
+    "int": _is_int,
+    "long": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "float": _is_number,
+    "double": _is_number,
+    "string": lambda value: isinstance(value, str),
+    "bytes": lambda value: isinstance(value, (bytes, bytearray, memoryview)),
+}
+
+
+class _SchemaCompiler:
+    """
+    Compiles an Avro schema into encoder and decoder functions.
+
+    Supports the primitive types, records, maps, arrays, unions, enums and fixed
+    types, including recursive references to named types.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[str, Any] = {}
+        self._encoders: dict[str, _Encoder] = {}
+        self._decoders: dict[str, _Decoder] = {}
+
+    def _full_name(self, schema: dict[str, Any], namespace: str | None) -> str:
+        name: str = schema["name"]
+        namespace = schema.get("namespace", namespace)
+        return name if "." in name or not namespace else f"{namespace}.{name}"
+
+    def _resolve(self, name: str, namespace: str | None) -> str:
+        if "." not in name and namespace and f"{namespace}.{name}" in self._schemas:
+            return f"{namespace}.{name}"
+        if name not in self._schemas:
+            raise ValueError(f"Unknown Avro type: {name}")
+        return name
+
+    def _register(self, schema: Any, namespace: str | None) -> None:
+        """
+        Register the named types of a schema, so they can be referenced before
+        their definition is compiled.
+        """
+        if isinstance(schema, list):
+            for branch in schema:
+                self._register(branch, namespace)
+        elif isinstance(schema, dict):
+            schema_type = schema.get("type")
+            if schema_type in ("record", "error", "enum", "fixed"):
+                full_name = self._full_name(schema, namespace)
+                self._schemas[full_name] = schema
+                namespace = full_name.rpartition(".")[0] or None
+            if schema_type in ("record", "error"):
+                for field in schema["fields"]:
+                    self._register(field["type"], namespace)
+            elif schema_type == "map":
+                self._register(schema["values"], namespace)
+            elif schema_type == "array":
+                self._register(schema["items"], namespace)
+
+    def compile(self, schema: Any) -> tuple[_Encoder, _Decoder]:
+        """
+        :param schema: The parsed schema
+        :return: The encoder and decoder for values of the schema
+        :raises ValueError: If the schema is invalid or uses an unsupported type
+        """
+        self._register(schema, None)
+        return self._encoder(schema, None), self._decoder(schema, None)
+
+    def _named(self, schema: Any, namespace: str | None) -> str | None:
+        if isinstance(schema, str) and schema not in _PRIMITIVE_MATCHERS:
+            return self._resolve(schema, namespace)
+        if isinstance(schema, dict) and schema.get("type") in (
+            "record",
+            "error",
+            "enum",
+            "fixed",
+        ):
+            return self._full_name(schema, namespace)
+        return None
+
+    def _matcher(self, schema: Any, namespace: str | None) -> _Matcher:
+        name = self._named(schema, namespace)
+        if name is not None:
+            schema = self._schemas[name]
+        schema_type = schema if isinstance(schema, str) else schema["type"]
+        if isinstance(schema_type, dict):
+            return self._matcher(schema_type, namespace)
+        if schema_type in _PRIMITIVE_MATCHERS:
+            return _PRIMITIVE_MATCHERS[schema_type]
+        if schema_type in ("record", "error"):
+            if name in _JSON_VALUE_RECORDS:
+                return lambda value: isinstance(value, dict)
+            field_names = {field["name"] for field in schema["fields"]}
+            return lambda value: isinstance(value, dict) and value.keys() <= field_names
+        if schema_type == "map":
+            return lambda value: isinstance(value, dict)
+        if schema_type == "array":
+            return lambda value: isinstance(value, (list, tuple))
+        if schema_type == "enum":
+            symbols = frozenset(schema["symbols"])
+            return lambda value: value in symbols
+        if schema_type == "fixed":
+            size = schema["size"]
+            return lambda value: (
+                isinstance(value, (bytes, bytearray, memoryview)) and len(value) == size
+            )
+        raise ValueError(f"Unsupported Avro type: {schema_type}")
+
+    def _encoder(self, schema: Any, namespace: str | None) -> _Encoder:
+        if isinstance(schema, list):
+            return self._union_encoder(schema, namespace)
+
+        name = self._named(schema, namespace)
+        if name is not None:
+            if isinstance(schema, str):
+                # A reference, possibly to a type that is still being compiled
+                encoders = self._encoders
+                return lambda buffer, value: encoders[name](buffer, value)
+            encoder = self._encoders[name] = self._named_encoder(schema, name)
+            return encoder
+
+        schema_type = schema if isinstance(schema, str) else schema["type"]
+        if isinstance(schema_type, (dict, list)):
+            return self._encoder(schema_type, namespace)
+        if schema_type == "null":
+            return lambda buffer, value: None
+        if schema_type == "boolean":
+            return lambda buffer, value: buffer.append(1 if value else 0)
+        if schema_type in ("int", "long"):
+            return _write_long
+        if schema_type == "double":
+            return lambda buffer, value: buffer.extend(_DOUBLE.pack(value))
+        if schema_type == "float":
+            return lambda buffer, value: buffer.extend(_FLOAT.pack(value))
+        if schema_type == "string":
+            return lambda buffer, value: _write_bytes(buffer, value.encode("utf-8"))
+        if schema_type == "bytes":
+            return _write_bytes
+        if schema_type == "map":
+            return self._map_encoder(self._encoder(schema["values"], namespace))
+        if schema_type == "array":
+            return self._array_encoder(self._encoder(schema["items"], namespace))
+        raise ValueError(f"Unsupported Avro type: {schema_type}")
+
+    def _named_encoder(self, schema: dict[str, Any], name: str) -> _Encoder:
+        namespace = name.rpartition(".")[0] or None
+        schema_type = schema["type"]
+        if schema_type == "enum":
+            indexes = {symbol: index for index, symbol in enumerate(schema["symbols"])}
+            return lambda buffer, value: _write_long(buffer, indexes[value])
+        if schema_type == "fixed":
+            return lambda buffer, value: buffer.extend(value)
+
+        fields = [
+            (field["name"], self._encoder(field["type"], namespace))
+            for field in schema["fields"]
+        ]
+        if name in _JSON_VALUE_RECORDS:
+            (_, encode_value), *_ = fields
+            return encode_value
+
+        def encode_record(buffer: bytearray, value: dict[str, Any]) -> None:
+            for field_name, encode in fields:
+                encode(buffer, value.get(field_name))
+
+        return encode_record
+
+    def _union_encoder(self, schema: list[Any], namespace: str | None) -> _Encoder:
+        branches = [
+            (index, self._matcher(branch, namespace), self._encoder(branch, namespace))
+            for index, branch in enumerate(schema)
+        ]
+
+        def encode_union(buffer: bytearray, value: Any) -> None:
+            start = len(buffer)
+            for index, matches, encode in branches:
+                if not matches(value):
+                    continue
+                _write_long(buffer, index)
+                try:
+                    encode(buffer, value)
+                    return
+                except (ValueError, TypeError, AttributeError, KeyError):
+                    # A nested value does not fit this branch, try the next one
+                    del buffer[start:]
+            raise ValueError(
+                f"Value of type {type(value).__name__} matches no branch of the "
+                "Avro union"
+            )
+
+        return encode_union
+
+    @staticmethod
+    def _map_encoder(encode_value: _Encoder) -> _Encoder:
+        def encode_map(buffer: bytearray, value: dict[str, Any]) -> None:
+            if value:
+                _write_long(buffer, len(value))
+                for key, item in value.items():
+                    _write_bytes(buffer, key.encode("utf-8"))
+                    encode_value(buffer, item)
+            buffer.append(0)
+
+        return encode_map
+
+    @staticmethod
+    def _array_encoder(encode_item: _Encoder) -> _Encoder:
+        def encode_array(buffer: bytearray, value: list[Any]) -> None:
+            if value:
+                _write_long(buffer, len(value))
+                for item in value:
+                    encode_item(buffer, item)
+            buffer.append(0)
+
+        return encode_array
+
+    def _decoder(self, schema: Any, namespace: str | None) -> _Decoder:
+        if isinstance(schema, list):
+            decoders = [self._decoder(branch, namespace) for branch in schema]
+
+            def decode_union(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+                index, pos = _read_long(data, pos)
+                if not 0 <= index < len(decoders):
+                    raise ValueError(f"Invalid Avro union branch {index}")
+                return decoders[index](data, pos)
+
+            return decode_union
+
+        name = self._named(schema, namespace)
+        if name is not None:
+            if isinstance(schema, str):
+                named_decoders = self._decoders
+                return lambda data, pos: named_decoders[name](data, pos)
+            decoder = self._decoders[name] = self._named_decoder(schema, name)
+            return decoder
+
+        schema_type = schema if isinstance(schema, str) else schema["type"]
+        if isinstance(schema_type, (dict, list)):
+            return self._decoder(schema_type, namespace)
+        if schema_type == "null":
+            return lambda data, pos: (None, pos)
+        if schema_type == "boolean":
+            return _read_boolean
+        if schema_type in ("int", "long"):
+            return _read_long
+        if schema_type == "double":
+            return _read_double
+        if schema_type == "float":
+            return _read_float
+        if schema_type == "string":
+            return _read_string
+        if schema_type == "bytes":
+            return _read_bytes
+        if schema_type == "map":
+            return self._map_decoder(self._decoder(schema["values"], namespace))
+        if schema_type == "array":
+            return self._array_decoder(self._decoder(schema["items"], namespace))
+        raise ValueError(f"Unsupported Avro type: {schema_type}")
+
+    def _named_decoder(self, schema: dict[str, Any], name: str) -> _Decoder:
+        namespace = name.rpartition(".")[0] or None
+        schema_type = schema["type"]
+        if schema_type == "enum":
+            symbols = list(schema["symbols"])
+
+            def decode_enum(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+                index, pos = _read_long(data, pos)
+                if not 0 <= index < len(symbols):
+                    raise ValueError(f"Invalid Avro enum index {index}")
+                return symbols[index], pos
+
+            return decode_enum
+        if schema_type == "fixed":
+            size = schema["size"]
+
+            def decode_fixed(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+                if pos + size > len(data):
+                    raise ValueError("Truncated Avro data")
+                return bytes(data[pos : pos + size]), pos + size
+
+            return decode_fixed
+
+        fields = [
+            (field["name"], self._decoder(field["type"], namespace))
+            for field in schema["fields"]
+        ]
+        if name in _JSON_VALUE_RECORDS:
+            (_, decode_value), *_ = fields
+            return decode_value
+
+        def decode_record(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+            record = {}
+            for field_name, decode in fields:
+                record[field_name], pos = decode(data, pos)
+            return record, pos
+
+        return decode_record
+
+    @staticmethod
+    def _map_decoder(decode_value: _Decoder) -> _Decoder:
+        def decode_map(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+            result: dict[str, Any] = {}
+            while True:
+                count, pos = _read_long(data, pos)
+                if count == 0:
+                    return result, pos
+                if count < 0:
+                    # A negative count is followed by the size of the block
+                    count = -count
+                    _, pos = _read_long(data, pos)
+                for _ in range(count):
+                    key, pos = _read_string(data, pos)
+                    result[key], pos = decode_value(data, pos)
+
+        return decode_map
+
+    @staticmethod
+    def _array_decoder(decode_item: _Decoder) -> _Decoder:
+        def decode_array(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+            result: list[Any] = []
+            while True:
+                count, pos = _read_long(data, pos)
+                if count == 0:
+                    return result, pos
+                if count < 0:
+                    count = -count
+                    _, pos = _read_long(data, pos)
+                for _ in range(count):
+                    item, pos = decode_item(data, pos)
+                    result.append(item)
+
+        return decode_array
+
+
+def _read_boolean(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+    if pos >= len(data):
+        raise ValueError("Truncated Avro data")
+    return data[pos] != 0, pos + 1
+
+
+def _read_double(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+    if pos + 8 > len(data):
+        raise ValueError("Truncated Avro data")
+    return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+
+
+def _read_float(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+    if pos + 4 > len(data):
+        raise ValueError("Truncated Avro data")
+    return _FLOAT.unpack_from(data, pos)[0], pos + 4
+
+
+def _read_string(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+    start, end = _read_slice(data, pos)
+    return str(data[start:end], "utf-8"), end
+
+
+def _read_bytes(data: ReadableBuffer, pos: int) -> tuple[Any, int]:
+    start, end = _read_slice(data, pos)
+    return bytes(data[start:end]), end
+
+
+@lru_cache(maxsize=16)
+def _compile(schema_json: str) -> tuple[_Encoder, _Decoder]:
+    """
+    Compile a schema, memoized by its JSON text.
+
+    :param schema_json: The schema as JSON
+    :return: The encoder and decoder for values of the schema
+    """
+    return _SchemaCompiler().compile(json.loads(schema_json))
+
+
+_SCHEMA_JSON: Final[str] = json.dumps(CLOUDEVENT_SCHEMA, separators=(",", ":"))
+_ATTRIBUTES_DECODER: Final[_Decoder] = _SchemaCompiler()._decoder(
+    CLOUDEVENT_SCHEMA["fields"][0]["type"], "io.cloudevents"
+)
+
+
+def _read_stream_long(stream: IO[bytes]) -> int | None:
+    """
+    Read a long from a stream.
+
+    :return: The value, or None at the end of the stream
+    """
+    encoded = bytearray()
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if encoded:
+                raise ValueError("Truncated Avro container file")
+            return None
+        encoded += byte
+        if byte[0] < 0x80:
+            return _read_long(encoded, 0)[0]
+
+
+def _read_exactly(stream: IO[bytes], size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated Avro container file")
+    return data
+
+
+class AvroFormat(BinaryFormat):
+    """
+    The Avro event format, see ``CLOUDEVENT_SCHEMA``.
+
+    All attributes are written to the ``attribute`` map. Timestamps are written as
+    RFC 3339 strings, booleans, integers and bytes keep their type. Binary data is
+    written as bytes. Without a ``datacontenttype``, other data is written as the
+    JSON value representation of the schema. With a ``datacontenttype``, strings
+    are written as strings and other data as the payload that binary content mode
+    would carry, which is decoded again on reading.
+
+    JSON numbers are doubles in the schema and read back as floats, and JSON
+    values that the schema cannot represent, such as arrays of numbers, are only
+    supported with a JSON ``datacontenttype``.
+    """
+
+    CONTENT_TYPE: Final[str] = "application/cloudevents+avro"
+
+    def __init__(self, json_backend: JSONBackend | str | None = None) -> None:
+        """
+        :param json_backend: The JSON implementation for JSON data, see
+            ``JSONFormat``. Defaults to the standard library ``json`` module.
+        :raises ImportError: If the package of the named backend is not installed
+        """
+        super().__init__(json_backend)
+        self._encode, self._decode = _compile(_SCHEMA_JSON)
+
+    def read(
+        self,
+        event_factory: EventFactory | None,
+        data: str | ReadableBuffer,
+    ) -> BaseCloudEvent:
+        """
+        Read a CloudEvent from an Avro formatted byte string.
+
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, automatically detects version from 'specversion' attribute.
+        :param data: The Avro formatted byte array.
+        :return: The CloudEvent instance.
+        :raises ValueError: If the data is not a valid Avro CloudEvent record.
+        """
+        if isinstance(data, str):
+            raise ValueError("An Avro formatted event must be bytes")
+        record, end = self._decode(data, 0)
+        if end != len(data):
+            raise ValueError(f"Unexpected data after the Avro record at offset {end}")
+        return self._to_event(event_factory, record)
+
+    def peek_attributes(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        """
+        Read only the context attributes of an Avro formatted event.
+
+        The data follows the attributes in the record, so it is not read at all.
+
+        :param data: The Avro formatted byte array.
+        :return: The attributes of the event, with ``time`` kept as the original
+            string in a ``LazyTime``.
+        :raises ValueError: If the data is not a valid Avro CloudEvent record.
+        """
+        if isinstance(data, str):
+            raise ValueError("An Avro formatted event must be bytes")
+        attributes, _ = _ATTRIBUTES_DECODER(data, 0)
+        return self._read_attributes(attributes)
+
+    @staticmethod
+    def _read_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+        if isinstance(attributes.get("time"), str):
+            attributes["time"] = LazyTime(attributes["time"])
+        return attributes
+
+    def _to_event(
+        self, event_factory: EventFactory | None, record: dict[str, Any]
+    ) -> BaseCloudEvent:
+        attributes = record.get("attribute")
+        if not isinstance(attributes, dict):
+            raise ValueError("An Avro CloudEvent record must have an attribute map")
+        attributes = self._read_attributes(attributes)
+
+        # Auto-detect version if factory not provided
+        if event_factory is None:
+            from cloudevents.core.bindings.common import get_event_factory_for_version
+
+            specversion = attributes.get("specversion", SPECVERSION_V1_0)
+            event_factory = get_event_factory_for_version(specversion)
+
+        data = record.get("data")
+        datacontenttype = attributes.get("datacontenttype")
+        if isinstance(data, bytes) and datacontenttype is not None:
+            data = self._data_format.read_data(data, datacontenttype)
+        return event_factory(attributes, data)
+
+    def _write(self, event: BaseCloudEvent) -> bytes:
+        buffer = bytearray()
+        self._encode(buffer, self._to_record(event))
+        return bytes(buffer)
+
+    def _to_record(self, event: BaseCloudEvent) -> dict[str, Any]:
+        attributes = {
+            name: format_time(value) if isinstance(value, datetime) else value
+            for name, value in get_encoded_attributes(event).items()
+        }
+        return {
+            "attribute": attributes,
+            "data": self._to_record_data(event.get_data(), event.get_datacontenttype()),
+        }
+
+    def _to_record_data(self, data: Any, datacontenttype: str | None) -> Any:
+        if datacontenttype is None:
+            # RawJSON is written as the JSON value it holds
+            return data.loads() if isinstance(data, RawJSON) else data
+        if data is None or isinstance(data, (str, bytes, bytearray, memoryview)):
+            return data
+        if parse_content_type(datacontenttype).is_json:
+            return self._backend.dumps(data)
+        return str(data)
+
+    def write_container(
+        self,
+        events: Iterable[BaseCloudEvent],
+        stream: IO[bytes],
+        codec: str = "null",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> int:
+        """
+        Write CloudEvents as an Avro object container file.
+
+        Events are collected into blocks of about ``block_size`` bytes, which are
+        compressed with the codec and written to the stream one at a time.
+
+        Example:
+            >>> with open("events.avro", "wb") as file:
+            ...     AvroFormat().write_container(events, file, codec="deflate")
+
+        :param events: The CloudEvents to write.
+        :param stream: The binary stream to write the file to.
+        :param codec: ``"null"`` for uncompressed blocks, or ``"deflate"``.
+        :param block_size: The number of uncompressed bytes that completes a block.
+        :return: The number of events written.
+        :raises ValueError: If the codec is not supported.
+        """
+        if codec not in _CODECS:
+            raise ValueError(f"Unsupported Avro codec: {codec}")
+        sync = os.urandom(_SYNC_SIZE)
+
+        header = bytearray(_CONTAINER_MAGIC)
+        _write_long(header, 2)
+        for key, value in (
+            ("avro.schema", _SCHEMA_JSON.encode("utf-8")),
+            ("avro.codec", codec.encode("utf-8")),
+        ):
+            _write_bytes(header, key.encode("utf-8"))
+            _write_bytes(header, value)
+        header.append(0)
+        header += sync
+        stream.write(header)
+
+        count = total = 0
+        block = bytearray()
+
+        def write_block() -> None:
+            payload: ReadableBuffer = block
+            if codec == "deflate":
+                compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+                payload = compressor.compress(block) + compressor.flush()
+            prefix = bytearray()
+            _write_long(prefix, count)
+            _write_long(prefix, len(payload))
+            stream.write(prefix)
+            stream.write(payload)
+            stream.write(sync)
+
+        for event in events:
+            block += self.write(event)
+            count += 1
+            if len(block) >= block_size:
+                write_block()
+                total += count
+                count = 0
+                block.clear()
+        if count:
+            write_block()
+            total += count
+        stream.flush()
+        return total
+
+    def read_container(
+        self, stream: IO[bytes], event_factory: EventFactory | None = None
+    ) -> Iterator[BaseCloudEvent]:
+        """
+        Read CloudEvents from an Avro object container file.
+
+        The file is read one block at a time. Files written with a schema other
+        than ``CLOUDEVENT_SCHEMA`` are read with their own schema, as long as their
+        records have the ``attribute`` and ``data`` fields.
+
+        Example:
+            >>> with open("events.avro", "rb") as file:
+            ...     for event in AvroFormat().read_container(file):
+            ...         process(event)
+
+        :param stream: The binary stream to read the file from.
+        :param event_factory: A factory function to create CloudEvent instances.
+            If None, the version of every event is detected separately.
+        :return: An iterator over the events, in the order of the file.
+        :raises ValueError: If the stream is not a valid Avro container file.
+        """
+        if stream.read(len(_CONTAINER_MAGIC)) != _CONTAINER_MAGIC:
+            raise ValueError("Not an Avro object container file")
+
+        metadata: dict[str, bytes] = {}
+        while True:
+            count = _read_stream_long(stream)
+            if count is None:
+                raise ValueError("Truncated Avro container file")
+            if count == 0:
+                break
+            if count < 0:
+                count = -count
+                _read_stream_long(stream)
+            for _ in range(count):
+                key = _read_exactly(stream, _read_stream_long(stream) or 0)
+                value = _read_exactly(stream, _read_stream_long(stream) or 0)
+                metadata[key.decode("utf-8")] = value
+        sync = _read_exactly(stream, _SYNC_SIZE)
+
+        codec = metadata.get("avro.codec", b"null").decode("utf-8")
+        if codec not in _CODECS:
+            raise ValueError(f"Unsupported Avro codec: {codec}")
+        schema = json.loads(metadata["avro.schema"])
+        decode = (
+            self._decode
+            if schema == CLOUDEVENT_SCHEMA
+            else _compile(json.dumps(schema, separators=(",", ":")))[1]
+        )
+
+        while True:
+            count = _read_stream_long(stream)
+            if count is None:
+                return
+            size = _read_stream_long(stream)
+            if size is None or size < 0:
+                raise ValueError("Truncated Avro container file")
+            block = _read_exactly(stream, size)
+            if codec == "deflate":
+                block = zlib.decompress(block, wbits=-zlib.MAX_WBITS)
+            if _read_exactly(stream, _SYNC_SIZE) != sync:
+                raise ValueError("Invalid sync marker in Avro container file")
+
+            pos = 0
+            for _ in range(count):
+                record, pos = decode(block, pos)
+                yield self._to_event(event_factory, record)
+
+    def get_content_type(self) -> str:
+        """
+        Get the Content-Type header value for structured mode.
+
+        :return: Content type string for CloudEvents structured content mode
+        """
+        return self.CONTENT_TYPE
@@ -12,10 +12,32 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from typing import Any, Protocol
+from typing import IO, Any, Iterable, Protocol
 
 from cloudevents.core.base import BaseCloudEvent, EventFactory
 
+# Destination of the write_into() methods of formats
+WritableBuffer = bytearray | IO[bytes]
+
+# Encoded input accepted by formats in addition to bytes, read without copying it
+# into an intermediate bytes object
+ReadableBuffer = bytes | bytearray | memoryview
+
+
+def append_to_buffer(buffer: WritableBuffer, data: ReadableBuffer) -> int:
+    """
+    Append encoded data to a buffer.
+
+    :param buffer: A ``bytearray`` to extend, or a binary stream to write to
+    :param data: The data to append
+    :return: The number of bytes appended
+    """
+    if isinstance(buffer, bytearray):
+        buffer += data
+    else:
+        buffer.write(data)
+    return data.nbytes if isinstance(data, memoryview) else len(data)
+
 
 class Format(Protocol):
     """
@@ -88,3 +110,62 @@ class Format(Protocol):
         :return: Content type string for CloudEvents structured content mode
         """
         ...
+
+
+class PeekableFormat(Format, Protocol):
+    """
+    Protocol for formats that can read the context attributes of a CloudEvent
+    without decoding its data or creating an event.
+    """
+
+    def peek_attributes(self, data: str | bytes) -> dict[str, Any]:
+        """
+        Deserialize only the context attributes of a CloudEvent in its wire format
+        representation, without decoding its data or creating an event.
+
+        :param data: The serialized CloudEvent data as a string or bytes.
+        :return: The attributes of the event.
+        :raises ValueError: If the data cannot be parsed or is invalid according to the format.
+        """
+        ...
+
+
+class BatchFormat(Format, Protocol):
+    """
+    Protocol for formats that also support a batch representation, carrying
+    several CloudEvents in a single message (e.g. the JSON batch format).
+    """
+
+    def read_batch(
+        self,
+        event_factory: EventFactory | None,
+        data: str | bytes,
+    ) -> list[BaseCloudEvent]:
+        """
+        Deserialize CloudEvents from their batch representation.
+
+        :param event_factory: A factory function that creates CloudEvent instances from
+            attributes and data. If None, the format implementation should auto-detect
+            the version of every event separately.
+        :param data: The serialized batch as a string or bytes.
+        :return: The CloudEvent instances, in the order of the batch.
+        :raises ValueError: If the data cannot be parsed or is invalid according to the format.
+        """
+        ...
+
+    def write_batch(self, events: Iterable[BaseCloudEvent]) -> bytes:
+        """
+        Serialize CloudEvents to their batch representation.
+
+        :param events: The CloudEvent instances to serialize.
+        :return: The batch serialized as bytes.
+        """
+        ...
+
+    def get_batch_content_type(self) -> str:
+        """
+        Get the Content-Type header value for batched mode.
+
+        :return: Content type string for CloudEvents batched content mode
+        """
+        ...
@@ -0,0 +1,108 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Base class for event formats with a binary encoding.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Hashable
+
+from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.formats.base import (
+    Format,
+    ReadableBuffer,
+    WritableBuffer,
+    append_to_buffer,
+)
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.json_backends import JSONBackend, resolve_json_backend
+from cloudevents.core.frozen import FormatKeyMixin, encode_cached
+
+
+class BinaryFormat(FormatKeyMixin, Format, ABC):
+    """
+    An event format with a binary encoding, such as Protobuf, Avro or CBOR.
+
+    Encoded events are cached on frozen events. The payload methods for binary
+    content mode (``write_data()`` and ``read_data()``) do not depend on the
+    event format and behave like those of ``JSONFormat``. Subclasses implement
+    ``read``, ``_write`` and ``get_content_type``.
+    """
+
+    def __init__(self, json_backend: JSONBackend | str | None = None) -> None:
+        """
+        :param json_backend: The JSON implementation for JSON data, see
+            ``JSONFormat``. Defaults to the standard library ``json`` module.
+        :raises ImportError: If the package of the named backend is not installed
+        """
+        self._backend = resolve_json_backend(json_backend)
+        self._data_format = JSONFormat(self._backend)
+
+    def _key(self) -> tuple[Hashable, ...]:
+        return (id(self._backend),)
+
+    def write(self, event: BaseCloudEvent) -> bytes:
+        """
+        Write a CloudEvent in the format.
+
+        :param event: The CloudEvent to write.
+        :return: The encoded event.
+        :raises ValueError: If an attribute or the data cannot be encoded.
+        """
+        return encode_cached(event, (self, "event"), lambda: self._write(event))
+
+    @abstractmethod
+    def _write(self, event: BaseCloudEvent) -> bytes:
+        """
+        :param event: The CloudEvent to write
+        :return: The encoded event
+        :raises ValueError: If an attribute or the data cannot be encoded
+        """
+
+    def write_into(self, event: BaseCloudEvent, buffer: WritableBuffer) -> int:
+        """
+        Write a CloudEvent in the format to the end of a buffer.
+
+        :param event: The CloudEvent to write.
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        return append_to_buffer(buffer, self.write(event))
+
+    def write_data(
+        self,
+        data: dict[str, Any] | str | ReadableBuffer | None,
+        datacontenttype: str | None,
+    ) -> bytes:
+        """
+        Serialize just the data payload for binary content mode.
+
+        :param data: Event data to serialize (dict, str, bytes-like, or None)
+        :param datacontenttype: Content type of the data
+        :return: Serialized data as bytes
+        """
+        return self._data_format.write_data(data, datacontenttype)
+
+    def read_data(
+        self, body: ReadableBuffer, datacontenttype: str | None
+    ) -> dict[str, Any] | str | bytes | None:
+        """
+        Deserialize the data payload of a binary content mode message.
+
+        :param body: The message body
+        :param datacontenttype: Content type of the data
+        :return: Deserialized data (dict for JSON, str for text, bytes for binary)
+        """
+        return self._data_format.read_data(body, datacontenttype)
@@ -0,0 +1,77 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+"""
+CBOR event format (``application/cloudevents+cbor``), using the optional ``cbor2``
+package.
+"""
+
+import importlib
+import io
+from typing import Any, Final
+
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.formats.json_backends import JSONBackend
+from cloudevents.core.formats.mapping import MappingFormat
+
+
+class CBORFormat(MappingFormat):
+    """
+    The CBOR event format.
+
+    Binary data is written as a CBOR byte string, and timestamps as epoch-based
+    date/time values (tag 1).
+    """
+
+    CONTENT_TYPE: Final[str] = "application/cloudevents+cbor"
+
+    def __init__(self, json_backend: JSONBackend | str | None = None) -> None:
+        """
+        :param json_backend: The JSON implementation for JSON data in binary
+            content mode, see ``JSONFormat``. Defaults to the standard library
+            ``json`` module.
+        :raises ImportError: If cbor2 or the package of the named backend is not
+            installed
+        """
+        super().__init__(json_backend)
+        self._cbor2 = importlib.import_module("cbor2")
+
+    def _encode(self, obj: dict[str, Any]) -> bytes:
+        try:
+            return self._cbor2.dumps(  # type: ignore[no-any-return]
+                obj, datetime_as_timestamp=True
+            )
+        except self._cbor2.CBOREncodeError as e:
+            raise ValueError(str(e)) from e
+
+    def _decode(self, data: ReadableBuffer) -> Any:
+        stream = io.BytesIO(data)
+        try:
+            decoded = self._cbor2.CBORDecoder(stream).decode()
+        except self._cbor2.CBORDecodeError as e:
+            raise ValueError(str(e)) from e
+        if stream.tell() != len(data):
+            raise ValueError(
+                f"Unexpected data after the CBOR item at offset {stream.tell()}"
+            )
+        return decoded
+
+    def get_content_type(self) -> str:
+        """
+        Get the Content-Type header value for structured mode.
+
+        :return: Content type string for CloudEvents structured content mode
+        """
+        return self.CONTENT_TYPE
@@ -0,0 +1,451 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+"""
+Compression of structured content mode bodies and binary content mode data.
+
+The encodings are named like the HTTP ``Content-Encoding`` codings: ``gzip``,
+``deflate`` (the zlib format, also accepted as ``zlib``), ``xz`` (LZMA, also
+accepted as ``lzma``) and, where the standard library has the
+``compression.zstd`` module (Python 3.14+), ``zstd``.
+
+Only the zstd codec reuses its compressor between bodies. zlib and lzma
+compressors cannot be reset once flushed, and copying a primed zlib compressor is
+slower than the one-shot functions, so gzip, deflate and xz compress each body
+with a new compressor.
+"""
+
+import gzip
+import importlib
+import lzma
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Final
+
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.formats.base import (
+    Format,
+    ReadableBuffer,
+    WritableBuffer,
+    append_to_buffer,
+)
+from cloudevents.core.lazy import read_attributes
+
+GZIP: Final[str] = "gzip"
+DEFLATE: Final[str] = "deflate"
+XZ: Final[str] = "xz"
+ZSTD: Final[str] = "zstd"
+IDENTITY: Final[str] = "identity"
+
+# Bodies smaller than this are not worth compressing
+DEFAULT_MIN_SIZE: Final[int] = 1024
+# Decompressed bodies larger than this are rejected, to bound the memory a small
+# compressed message can claim
+DEFAULT_MAX_SIZE: Final[int] = 16 * 1024 * 1024
+
+_ALIASES: Final[dict[str, str]] = {
+    "x-gzip": GZIP,
+    "zlib": DEFLATE,
+    "lzma": XZ,
+}
+
+try:
+    _zstd: Any = importlib.import_module("compression.zstd")
+except ImportError:
+    _zstd = None
+
+
+class _Codec(ABC):
+    """
+    Compresses and decompresses data in one encoding.
+    """
+
+    # Leading bytes of every compressed body, to recognize it without a header
+    magic: bytes = b""
+
+    @abstractmethod
+    def compress(self, data: ReadableBuffer) -> bytes:
+        """
+        :param data: The data to compress
+        :return: The compressed data
+        """
+
+    @abstractmethod
+    def _decompressor(self) -> Any:
+        """
+        :return: A new decompressor object with a ``decompress(data, max_length)``
+            method and ``eof`` and ``unused_data`` attributes
+        """
+
+    @property
+    @abstractmethod
+    def _errors(self) -> tuple[type[Exception], ...]:
+        """
+        The exceptions the decompressor raises for invalid data.
+        """
+
+    def decompress(self, data: ReadableBuffer, max_size: int) -> bytes:
+        """
+        :param data: The compressed data, one or more concatenated streams
+        :param max_size: The maximum size of the decompressed data in bytes
+        :return: The decompressed data
+        :raises ValueError: If the data is invalid or decompresses to more than
+            ``max_size`` bytes
+        """
+        output = bytearray()
+        remaining: ReadableBuffer = data
+        while remaining:
+            decompressor = self._decompressor()
+            try:
+                # One byte more than allowed tells a body that is too large from
+                # one that is exactly max_size bytes long
+                output += decompressor.decompress(remaining, max_size + 1 - len(output))
+            except self._errors as e:
+                raise ValueError(f"Invalid compressed data: {e}") from e
+            if len(output) > max_size:
+                raise ValueError(f"Decompressed data exceeds {max_size} bytes")
+            if not decompressor.eof:
+                raise ValueError("Invalid compressed data: truncated stream")
+            remaining = decompressor.unused_data
+        return bytes(output)
+
+    def is_compressed(self, data: ReadableBuffer) -> bool:
+        return bytes(data[: len(self.magic)]) == self.magic
+
+
+class _GzipCodec(_Codec):
+    magic = b"\x1f\x8b"
+    _errors = (zlib.error,)
+
+    def __init__(self, level: int | None) -> None:
+        self._level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+
+    def compress(self, data: ReadableBuffer) -> bytes:
+        # A fixed mtime keeps the output stable
+        return gzip.compress(data, self._level, mtime=0)
+
+    def _decompressor(self) -> Any:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+class _DeflateCodec(_Codec):
+    _errors = (zlib.error,)
+
+    def __init__(self, level: int | None) -> None:
+        self._level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+
+    def compress(self, data: ReadableBuffer) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def _decompressor(self) -> Any:
+        return zlib.decompressobj()
+
+    def is_compressed(self, data: ReadableBuffer) -> bool:
+        # zlib has no magic number, but a header that declares deflate and whose
+        # two bytes are a multiple of 31
+        return (
+            len(data) >= 2
+            and data[0] & 0x0F == 8
+            and data[0] >> 4 <= 7
+            and (data[0] << 8 | data[1]) % 31 == 0
+        )
+
+
+class _XZCodec(_Codec):
+    magic = b"\xfd7zXZ\x00"
+    _errors = (lzma.LZMAError,)
+
+    def __init__(self, level: int | None) -> None:
+        self._preset = level
+
+    def compress(self, data: ReadableBuffer) -> bytes:
+        return lzma.compress(data, preset=self._preset)
+
+    def _decompressor(self) -> Any:
+        return lzma.LZMADecompressor()
+
+
+class _ZstdCodec(_Codec):
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def __init__(self, level: int | None) -> None:
+        self._level = level
+        # A compressor keeps its context between frames, but may only be used by
+        # one thread at a time
+        self._local = threading.local()
+
+    @property
+    def _errors(self) -> tuple[type[Exception], ...]:
+        return (_zstd.ZstdError,)
+
+    def compress(self, data: ReadableBuffer) -> bytes:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = _zstd.ZstdCompressor(self._level)
+        return compressor.compress(data, _zstd.ZstdCompressor.FLUSH_FRAME)  # type: ignore[no-any-return]
+
+    def _decompressor(self) -> Any:
+        return _zstd.ZstdDecompressor()
+
+
+def _normalize_encoding(encoding: str) -> str:
+    encoding = encoding.strip().lower()
+    return _ALIASES.get(encoding, encoding)
+
+
+def _create_codec(encoding: str, level: int | None = None) -> _Codec:
+    """
+    :param encoding: A normalized encoding name
+    :param level: The compression level, or None for the default of the codec
+    :raises ValueError: If the encoding is not supported
+    """
+    if encoding == GZIP:
+        return _GzipCodec(level)
+    if encoding == DEFLATE:
+        return _DeflateCodec(level)
+    if encoding == XZ:
+        return _XZCodec(level)
+    if encoding == ZSTD and _zstd is not None:
+        return _ZstdCodec(level)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+# Codecs with default levels for decompression, shared by all callers
+_decoders: dict[str, _Codec] = {}
+
+
+def supported_encodings() -> frozenset[str]:
+    """
+    :return: The encodings supported by this Python installation
+    """
+    encodings = {GZIP, DEFLATE, XZ}
+    if _zstd is not None:
+        encodings.add(ZSTD)
+    return frozenset(encodings)
+
+
+def decompress(
+    data: ReadableBuffer,
+    content_encoding: str | None,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> ReadableBuffer:
+    """
+    Decode a body according to its content encoding.
+
+    Several codings separated by commas, as allowed in the HTTP
+    ``Content-Encoding`` header, are undone in reverse order. A body with a coding
+    that is not supported is returned unchanged, as if it had no content encoding.
+
+    :param data: The encoded body
+    :param content_encoding: The content encoding, None or ``identity`` for an
+        unencoded body
+    :param max_size: The maximum size of the decoded body in bytes
+    :return: The decoded body
+    :raises ValueError: If the data is invalid or decodes to more than
+        ``max_size`` bytes
+    """
+    if not content_encoding:
+        return data
+    encodings = [
+        encoding
+        for encoding in map(_normalize_encoding, content_encoding.split(","))
+        if encoding not in (IDENTITY, "")
+    ]
+    if not all(encoding in supported_encodings() for encoding in encodings):
+        return data
+    for encoding in reversed(encodings):
+        codec = _decoders.get(encoding)
+        if codec is None:
+            codec = _decoders[encoding] = _create_codec(encoding)
+        data = codec.decompress(data, max_size)
+    return data
+
+
+class CompressedFormat(Format):
+    """
+    A format that compresses the output of another format.
+
+    Bodies of at least ``min_size`` bytes are compressed, smaller ones are kept as
+    they are. The bindings announce a compressed body with a ``content-encoding``
+    header or property. Given a ``CompressedFormat``, they decompress messages that
+    carry one of the supported encodings, up to ``max_size`` bytes, so they never
+    need to guess; other formats get the body as it is. Used on its own,
+    ``read()`` and ``read_data()`` recognize a compressed body by the magic number
+    of the encoding, so binary content mode data that itself starts with that
+    number, e.g. an uncompressed gzip file, should only be exchanged through a
+    binding.
+
+    Example:
+        >>> event_format = CompressedFormat(JSONFormat(), "gzip", min_size=4096)
+        >>> message = to_structured(event, event_format)
+        >>> # message.headers["content-encoding"] == "gzip" for large events
+    """
+
+    def __init__(
+        self,
+        event_format: Format,
+        encoding: str = GZIP,
+        min_size: int = DEFAULT_MIN_SIZE,
+        level: int | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        :param event_format: The format to compress the output of
+        :param encoding: ``"gzip"``, ``"deflate"`` or ``"zlib"``, ``"xz"`` or
+            ``"lzma"``, or ``"zstd"`` where supported
+        :param min_size: The size in bytes from which bodies are compressed
+        :param level: The compression level, or None for the default of the
+            encoding
+        :param max_size: The maximum size in bytes of a decompressed body
+        :raises ValueError: If the encoding is not supported
+        """
+        self._format = event_format
+        self._encoding = _normalize_encoding(encoding)
+        self._codec = _create_codec(self._encoding, level)
+        self._min_size = min_size
+        self._max_size = max_size
+
+    @property
+    def format(self) -> Format:
+        """
+        The wrapped format.
+        """
+        return self._format
+
+    @property
+    def encoding(self) -> str:
+        """
+        The content encoding of compressed bodies, e.g. ``gzip``.
+        """
+        return self._encoding
+
+    def compress(self, data: bytes) -> tuple[bytes, str | None]:
+        """
+        Compress a body if it is at least ``min_size`` bytes long.
+
+        :param data: The body
+        :return: The body, compressed or as it was, and its content encoding, or
+            None when it was not compressed
+        """
+        if len(data) < self._min_size:
+            return data, None
+        return self._codec.compress(data), self._encoding
+
+    def decompress(self, data: bytes, content_encoding: str | None) -> bytes:
+        """
+        Decompress the body of a message according to its content encoding, see
+        ``decompress()``.
+
+        :param data: The body
+        :param content_encoding: The content encoding of the message, if any
+        :return: The decompressed body, or the body as it was if it has no
+            supported content encoding
+        :raises ValueError: If the data is invalid or decompresses to more than
+            ``max_size`` bytes
+        """
+        return bytes(decompress(data, content_encoding, self._max_size))
+
+    def _decompress(self, data: bytes) -> bytes:
+        if not self._codec.is_compressed(data):
+            return data
+        return self._codec.decompress(data, self._max_size)
+
+    def read(
+        self,
+        event_factory: EventFactory | None,
+        data: str | bytes,
+    ) -> BaseCloudEvent:
+        """
+        Read a CloudEvent from a body that may be compressed.
+
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, automatically detects version from 'specversion' attribute.
+        :param data: The body.
+        :return: The CloudEvent instance.
+        :raises ValueError: If the data is invalid.
+        """
+        if not isinstance(data, str):
+            data = self._decompress(data)
+        return self._format.read(event_factory, data)
+
+    def peek_attributes(self, data: str | bytes) -> dict[str, Any]:
+        """
+        Read only the context attributes of a body that may be compressed.
+
+        :param data: The body.
+        :return: The attributes of the event.
+        :raises ValueError: If the data is invalid.
+        """
+        if not isinstance(data, str):
+            data = self._decompress(data)
+        return read_attributes(self._format, data)
+
+    def write(self, event: BaseCloudEvent) -> bytes:
+        """
+        Write a CloudEvent with the wrapped format, compressed if it is large
+        enough.
+
+        :param event: The CloudEvent to write.
+        :return: The body.
+        """
+        return self.compress(self._format.write(event))[0]
+
+    def write_into(self, event: BaseCloudEvent, buffer: WritableBuffer) -> int:
+        """
+        Write a CloudEvent like ``write()`` to the end of a buffer.
+
+        :param event: The CloudEvent to write.
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        return append_to_buffer(buffer, self.write(event))
+
+    def write_data(
+        self,
+        data: dict[str, Any] | str | bytes | None,
+        datacontenttype: str | None,
+    ) -> bytes:
+        """
+        Serialize the data payload for binary content mode, compressed if it is
+        large enough.
+
+        :param data: Event data to serialize (dict, str, bytes-like, or None)
+        :param datacontenttype: Content type of the data
+        :return: Serialized data as bytes
+        """
+        return self.compress(self._format.write_data(data, datacontenttype))[0]
+
+    def read_data(
+        self, body: bytes, datacontenttype: str | None
+    ) -> dict[str, Any] | str | bytes | None:
+        """
+        Deserialize the data payload of a binary content mode message that may be
+        compressed.
+
+        :param body: The message body
+        :param datacontenttype: Content type of the data
+        :return: Deserialized data (dict for JSON, str for text, bytes for binary)
+        """
+        return self._format.read_data(self._decompress(body), datacontenttype)
+
+    def get_content_type(self) -> str:
+        """
+        Get the Content-Type header value for structured mode, the one of the
+        wrapped format.
+
+        :return: Content type string for CloudEvents structured content mode
+        """
+        return self._format.get_content_type()
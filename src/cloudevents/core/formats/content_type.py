@@ -0,0 +1,157 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Content type classification.
+
+Formats and protocol bindings call ``parse_content_type()`` to decide how event
+data is encoded and whether a message is in structured content mode. The results
+are memoized, since an application usually only sees a handful of distinct
+content types.
+"""
+
+import codecs
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+
+KIND_JSON: Final[str] = "json"
+KIND_TEXT: Final[str] = "text"
+KIND_BINARY: Final[str] = "binary"
+
+DEFAULT_ENCODING: Final[str] = "utf-8"
+
+# Maximum number of distinct content types memoized by parse_content_type()
+_CACHE_SIZE: Final[int] = 128
+
+_STRUCTURED_PREFIX: Final[str] = "application/cloudevents"
+_BINARY_TOP_LEVEL_TYPES: Final[frozenset[str]] = frozenset(
+    {"audio", "font", "image", "model", "video"}
+)
+_BINARY_APPLICATION_SUBTYPES: Final[frozenset[str]] = frozenset(
+    {
+        "avro",
+        "cbor",
+        "gzip",
+        "msgpack",
+        "octet-stream",
+        "pdf",
+        "protobuf",
+        "vnd.apache.avro+binary",
+        "x-msgpack",
+        "x-protobuf",
+        "zip",
+        "zstd",
+    }
+)
+_BINARY_SUFFIXES: Final[tuple[str, ...]] = (
+    "+cbor",
+    "+gzip",
+    "+msgpack",
+    "+proto",
+    "+protobuf",
+    "+zip",
+)
+
+
+@dataclass(frozen=True)
+class MediaType:
+    """
+    A parsed content type.
+
+    :param essence: The lowercase ``type/subtype`` without parameters
+    :param kind: How the content is encoded, one of ``KIND_JSON``, ``KIND_TEXT``
+        or ``KIND_BINARY``
+    :param charset: The lowercase ``charset`` parameter, if any
+    :param encoding: The Python codec to decode the content with, derived from
+        the charset and UTF-8 when it is missing or unknown
+    """
+
+    essence: str
+    kind: str
+    charset: str | None
+    encoding: str
+
+    @property
+    def is_json(self) -> bool:
+        """
+        Whether the content is JSON.
+        """
+        return self.kind == KIND_JSON
+
+    @property
+    def is_structured(self) -> bool:
+        """
+        Whether the content type denotes an event in structured content mode,
+        e.g. ``application/cloudevents+json``.
+        """
+        return self.essence.startswith(_STRUCTURED_PREFIX)
+
+
+def _classify(essence: str, charset: str | None) -> str:
+    top_level, _, subtype = essence.partition("/")
+    if top_level in ("application", "text") and (
+        subtype == "json" or subtype.endswith("+json")
+    ):
+        return KIND_JSON
+    if top_level == "text" or charset is not None:
+        return KIND_TEXT
+    if (
+        top_level in _BINARY_TOP_LEVEL_TYPES
+        or (top_level == "application" and subtype in _BINARY_APPLICATION_SUBTYPES)
+        or subtype.endswith(_BINARY_SUFFIXES)
+    ):
+        return KIND_BINARY
+    # Other types, e.g. XML, are decoded as text when the content is valid UTF-8
+    return KIND_TEXT
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_content_type(content_type: str) -> MediaType:
+    """
+    Parse and classify a content type, e.g. ``application/json; charset=utf-8``.
+
+    Types and parameter names are case-insensitive. JSON is detected for
+    ``application/json``, ``text/json`` and any ``+json`` structured syntax
+    suffix. Media, archive and binary serialization types are classified as
+    binary, everything else as text.
+
+    :param content_type: The content type as found in a header or attribute
+    :return: The parsed content type
+    """
+    essence, *parameters = content_type.split(";")
+    essence = essence.strip().lower()
+
+    charset = None
+    for parameter in parameters:
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            charset = value.strip().strip('"').lower() or None
+
+    encoding = DEFAULT_ENCODING
+    if charset is not None:
+        try:
+            # Encoding an empty string also rejects codecs that are not text
+            # encodings, such as base64
+            "".encode(charset)
+            encoding = codecs.lookup(charset).name
+        except LookupError:
+            pass
+
+    return MediaType(
+        essence=essence,
+        kind=_classify(essence, charset),
+        charset=charset,
+        encoding=encoding,
+    )
@@ -12,46 +12,65 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import base64
+import binascii
+import codecs
+import json
 import re
-from datetime import datetime
-from json import JSONEncoder, dumps, loads
-from typing import Any, Final, Pattern
-
-from dateutil.parser import isoparse
+from typing import IO, Any, Final, Hashable, Iterable, Iterator, Pattern, cast
 
 from cloudevents.core.base import BaseCloudEvent, EventFactory
-from cloudevents.core.formats.base import Format
+from cloudevents.core.exceptions import BaseCloudEventException, BatchEntryError
+from cloudevents.core.formats.base import (
+    Format,
+    ReadableBuffer,
+    WritableBuffer,
+    append_to_buffer,
+)
+from cloudevents.core.formats.content_type import (
+    DEFAULT_ENCODING,
+    KIND_BINARY,
+    parse_content_type,
+)
+from cloudevents.core.formats.json_backends import (
+    BufferedJSONBackend,
+    JSONBackend,
+    resolve_json_backend,
+)
+from cloudevents.core.frozen import FormatKeyMixin, FrozenEventMixin, encode_cached
+from cloudevents.core.lazy import LazyTime, RawJSON, get_encoded_attributes
 from cloudevents.core.spec import SPECVERSION_V0_3, SPECVERSION_V1_0
 
 
-class _JSONEncoderWithDatetime(JSONEncoder):
-    """
-    Custom JSON encoder to handle datetime objects in the format required by the CloudEvents spec.
-    """
-
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            dt = obj.isoformat()
-            # 'Z' denotes a UTC offset of 00:00 see
-            # https://www.rfc-editor.org/rfc/rfc3339#section-2
-            if dt.endswith("+00:00"):
-                dt = dt.removesuffix("+00:00") + "Z"
-            return dt
-
-        return super().default(obj)
-
-
-class JSONFormat(Format):
+class JSONFormat(FormatKeyMixin, Format):
     CONTENT_TYPE: Final[str] = "application/cloudevents+json"
+    BATCH_CONTENT_TYPE: Final[str] = "application/cloudevents-batch+json"
     JSON_CONTENT_TYPE_PATTERN: Pattern[str] = re.compile(
         r"^(application|text)/([a-zA-Z0-9\-\.]+\+)?json(;.*)?$"
     )
 
+    def __init__(
+        self, backend: JSONBackend | str | None = None, raw_data: bool = False
+    ) -> None:
+        """
+        :param backend: The JSON implementation to use, either a ``JSONBackend``
+            or the name of a built-in one (``"stdlib"``, ``"orjson"``, ``"msgspec"``
+            or ``"auto"``, see ``get_json_backend()``). Defaults to the standard
+            library ``json`` module.
+        :param raw_data: If True, the ``data`` of events and JSON payloads are
+            returned as ``RawJSON`` slices of the input instead of decoded values,
+            so they are written back verbatim.
+        :raises ImportError: If the package of the named backend is not installed
+        """
+        self._backend = resolve_json_backend(backend)
+        self._raw_data = raw_data
+
+    def _key(self) -> tuple[Hashable, ...]:
+        return id(self._backend), self._raw_data
+
     def read(
         self,
         event_factory: EventFactory | None,
-        data: str | bytes,
+        data: str | ReadableBuffer,
     ) -> BaseCloudEvent:
         """
         Read a CloudEvent from a JSON formatted byte string.
@@ -64,15 +83,59 @@ class JSONFormat(Format):
                              If None, automatically detects version from 'specversion' field.
         :param data: The JSON formatted byte array.
         :return: The CloudEvent instance.
+        :raises ValueError: If the data is not a JSON object.
         """
-        decoded_data: str
-        if isinstance(data, bytes):
-            decoded_data = data.decode("utf-8")
-        else:
-            decoded_data = data
+        if self._raw_data:
+            text = _as_text(data)
+            event_attributes, end = _read_envelope(text, _skip_whitespace(text, 0))
+            if _skip_whitespace(text, end) != len(text):
+                raise ValueError(
+                    f"Unexpected data after the JSON event at offset {end}"
+                )
+            return self._read_event(event_factory, event_attributes)
+
+        event_attributes = self._backend.loads(data)
+        if not isinstance(event_attributes, dict):
+            raise ValueError("A JSON formatted event must be a JSON object")
+        return self._read_event(event_factory, event_attributes)
+
+    def read_batch(
+        self,
+        event_factory: EventFactory | None,
+        data: str | ReadableBuffer,
+    ) -> list[BaseCloudEvent]:
+        """
+        Read CloudEvents from a JSON batch, a JSON array of events in the JSON format.
 
-        event_attributes = loads(decoded_data)
+        The batch may mix v0.3 and v1.0 events. If no event factory is given, the
+        version is detected for every event separately.
 
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, automatically detects version from 'specversion' field.
+        :param data: The JSON batch formatted byte array.
+        :return: The CloudEvent instances, in the order of the batch.
+        :raises ValueError: If the data is not a JSON array of JSON objects.
+        """
+        if self._raw_data:
+            return [
+                self._read_event(event_factory, event_attributes)
+                for event_attributes in _iter_envelopes(_as_text(data))
+            ]
+
+        entries = self._backend.loads(data)
+        if not isinstance(entries, list):
+            raise ValueError("A JSON batch must be a JSON array")
+
+        events: list[BaseCloudEvent] = []
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                raise ValueError(f"Entry {index} of the JSON batch is not an object")
+            events.append(self._read_event(event_factory, entry))
+        return events
+
+    def _read_event(
+        self, event_factory: EventFactory | None, event_attributes: dict[str, Any]
+    ) -> BaseCloudEvent:
         # Auto-detect version if factory not provided
         if event_factory is None:
             from cloudevents.core.bindings.common import get_event_factory_for_version
@@ -80,8 +143,9 @@ class JSONFormat(Format):
             specversion = event_attributes.get("specversion", SPECVERSION_V1_0)
             event_factory = get_event_factory_for_version(specversion)
 
-        if "time" in event_attributes:
-            event_attributes["time"] = isoparse(event_attributes["time"])
+        # Keep the timestamp as the original string until it is accessed
+        if isinstance(event_attributes.get("time"), str):
+            event_attributes["time"] = LazyTime(event_attributes["time"])
 
         # Handle data field based on version
         specversion = event_attributes.get("specversion", SPECVERSION_V1_0)
@@ -94,16 +158,20 @@ class JSONFormat(Format):
             specversion == SPECVERSION_V0_3
             and "datacontentencoding" in event_attributes
         ):
-            encoding = event_attributes.get("datacontentencoding", "").lower()
-            if encoding == "base64" and isinstance(event_data, str):
+            encoding = event_attributes["datacontentencoding"]
+            # The event rejects an encoding that is not a string
+            is_base64 = isinstance(encoding, str) and encoding.lower() == "base64"
+            if is_base64 and isinstance(event_data, RawJSON):
+                event_data = event_data.loads()
+            if is_base64 and isinstance(event_data, str):
                 # Decode base64 encoded data in v0.3
-                event_data = base64.b64decode(event_data)
+                event_data = _decode_base64(event_data)
 
         # v1.0: Check for data_base64 field (when data is None)
         if event_data is None:
             event_data_base64 = event_attributes.pop("data_base64", None)
             if event_data_base64 is not None:
-                event_data = base64.b64decode(event_data_base64)
+                event_data = _decode_base64(event_data_base64)
 
         return event_factory(event_attributes, event_data)
 
@@ -118,34 +186,142 @@ class JSONFormat(Format):
         :param event: The CloudEvent to write.
         :return: The CloudEvent as a JSON formatted byte array.
         """
+        return encode_cached(event, (self, "event"), lambda: self._write(event))
+
+    def _write(self, event: BaseCloudEvent) -> bytes:
+        return self._dumps_event(self._to_dict(event))
+
+    def _dumps_event(self, event_dict: dict[str, Any]) -> bytes:
+        event_data = event_dict.get("data")
+        if not isinstance(event_data, RawJSON):
+            return self._backend.dumps(event_dict)
+
+        # Splice the pre-encoded data into the encoded attributes
+        del event_dict["data"]
+        encoded = self._backend.dumps(event_dict).rstrip()
+        separator = b"," if encoded[:-1].strip() != b"{" else b""
+        return b"".join((encoded[:-1], separator, b'"data":', event_data, b"}"))
+
+    def write_batch(self, events: Iterable[BaseCloudEvent]) -> bytes:
+        """
+        Write CloudEvents to a JSON batch, a JSON array of events in the JSON format.
+
+        Consecutive events that are not frozen are serialized with a single call
+        of the JSON backend, frozen events reuse their cached encoding, see
+        ``write_batch_into()``.
+
+        :param events: The CloudEvents to write, v0.3 and v1.0 events may be mixed.
+        :return: The CloudEvents as a JSON batch formatted byte array.
+        """
+        chunks = list(self._encode_batch(events))
+        if len(chunks) == 1 and chunks[0][1]:
+            # The whole batch was serialized at once
+            return chunks[0][0]
+        return b"".join(_join_batch(chunks))
+
+    def write_into(self, event: BaseCloudEvent, buffer: WritableBuffer) -> int:
+        """
+        Write a CloudEvent in the JSON format to the end of a buffer.
+
+        With a JSON backend that can serialize into a ``bytearray``, events that
+        are not frozen are serialized straight into it.
+
+        :param event: The CloudEvent to write.
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        if (
+            isinstance(buffer, bytearray)
+            and not isinstance(event, FrozenEventMixin)
+            and callable(getattr(self._backend, "dumps_into", None))
+        ):
+            event_dict = self._to_dict(event)
+            if not isinstance(event_dict.get("data"), RawJSON):
+                start = len(buffer)
+                cast(BufferedJSONBackend, self._backend).dumps_into(event_dict, buffer)
+                return len(buffer) - start
+        return append_to_buffer(buffer, self.write(event))
+
+    def write_batch_into(
+        self, events: Iterable[BaseCloudEvent], buffer: WritableBuffer
+    ) -> int:
+        """
+        Write CloudEvents as a JSON batch to the end of a buffer.
+
+        Consecutive events that are not frozen are serialized with a single call
+        of the JSON backend, which is faster than one call per event. Frozen
+        events and events with ``RawJSON`` data are appended on their own, so
+        frozen events reuse their cached encoding. The events are consumed one
+        after another, so a row cursor such as the one used by ``EventBatch`` can
+        be passed as a generator.
+
+        :param events: The CloudEvents to write, v0.3 and v1.0 events may be mixed.
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        written = 0
+        for chunk in _join_batch(self._encode_batch(events)):
+            written += append_to_buffer(buffer, chunk)
+        return written
+
+    def _encode_batch(
+        self, events: Iterable[BaseCloudEvent]
+    ) -> Iterator[tuple[bytes, bool]]:
+        """
+        Encode the events of a JSON batch.
+
+        :param events: The CloudEvents to write
+        :return: An iterator over the encoded events, each paired with False, and
+            the JSON arrays of consecutive events that are not frozen, each paired
+            with True
+        """
+        run: list[dict[str, Any]] = []
+        for event in events:
+            if not isinstance(event, FrozenEventMixin):
+                event_dict = self._to_dict(event)
+                if not isinstance(event_dict.get("data"), RawJSON):
+                    run.append(event_dict)
+                    continue
+                encoded = self._dumps_event(event_dict)
+            else:
+                encoded = self.write(event)
+            if run:
+                yield self._backend.dumps(run), True
+                run = []
+            yield encoded, False
+        if run:
+            yield self._backend.dumps(run), True
+
+    def _to_dict(self, event: BaseCloudEvent) -> dict[str, Any]:
         event_data = event.get_data()
-        event_dict: dict[str, Any] = dict(event.get_attributes())
+        event_dict: dict[str, Any] = dict(get_encoded_attributes(event))
         specversion = event_dict.get("specversion", SPECVERSION_V1_0)
 
         if event_data is not None:
-            if isinstance(event_data, (bytes, bytearray)):
+            if isinstance(event_data, RawJSON):
+                # Written verbatim by _write()
+                event_dict["data"] = event_data
+            elif isinstance(event_data, (bytes, bytearray, memoryview)):
                 # Handle binary data based on version
                 if specversion == SPECVERSION_V0_3:
                     # v0.3: Use datacontentencoding with base64-encoded data field
                     event_dict["datacontentencoding"] = "base64"
-                    event_dict["data"] = base64.b64encode(event_data).decode("utf-8")
+                    event_dict["data"] = _encode_base64(event_data)
                 else:
                     # v1.0: Use data_base64 field
-                    event_dict["data_base64"] = base64.b64encode(event_data).decode(
-                        "utf-8"
-                    )
+                    event_dict["data_base64"] = _encode_base64(event_data)
             else:
                 datacontenttype = event_dict.get("datacontenttype", "application/json")
-                if re.match(JSONFormat.JSON_CONTENT_TYPE_PATTERN, datacontenttype):
+                if parse_content_type(datacontenttype).is_json:
                     event_dict["data"] = event_data
                 else:
                     event_dict["data"] = str(event_data)
 
-        return dumps(event_dict, cls=_JSONEncoderWithDatetime).encode("utf-8")
+        return event_dict
 
     def write_data(
         self,
-        data: dict[str, Any] | str | bytes | None,
+        data: dict[str, Any] | str | ReadableBuffer | None,
         datacontenttype: str | None,
     ) -> bytes:
         """
@@ -154,33 +330,56 @@ class JSONFormat(Format):
         This method is used by HTTP binary content mode to serialize only the event
         data (not the attributes) into the HTTP body.
 
-        :param data: Event data to serialize (dict, str, bytes, or None)
+        Text is encoded with the ``charset`` of the content type, like
+        ``read_data()`` decodes it, and UTF-8 when there is none.
+
+        :param data: Event data to serialize (dict, str, bytes-like, or None)
         :param datacontenttype: Content type of the data
         :return: Serialized data as bytes
+        :raises ValueError: If the text cannot be encoded with the charset
         """
         if data is None:
             return b""
 
         # If data is already bytes, return as-is
-        if isinstance(data, (bytes, bytearray)):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             return bytes(data)
 
-        # If data is a string, encode as UTF-8
-        if isinstance(data, str):
-            return data.encode("utf-8")
+        media_type = parse_content_type(datacontenttype) if datacontenttype else None
+        encoding = media_type.encoding if media_type else DEFAULT_ENCODING
 
         # If data is a dict and content type is JSON, serialize as JSON
-        if isinstance(data, dict):
-            if datacontenttype and re.match(
-                JSONFormat.JSON_CONTENT_TYPE_PATTERN, datacontenttype
-            ):
-                return dumps(data, cls=_JSONEncoderWithDatetime).encode("utf-8")
+        if isinstance(data, dict) and media_type is not None and media_type.is_json:
+            encoded = self._backend.dumps(data)
+            if encoding == DEFAULT_ENCODING:
+                return encoded
+            return str(encoded, DEFAULT_ENCODING).encode(encoding)
 
         # Default: convert to string and encode
-        return str(data).encode("utf-8")
+        return str(data).encode(encoding)
+
+    def write_data_into(
+        self,
+        data: dict[str, Any] | str | ReadableBuffer | None,
+        datacontenttype: str | None,
+        buffer: WritableBuffer,
+    ) -> int:
+        """
+        Serialize just the data payload to the end of a buffer.
+
+        Binary data is appended without an intermediate copy.
+
+        :param data: Event data to serialize (dict, str, bytes-like, or None)
+        :param datacontenttype: Content type of the data
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return append_to_buffer(buffer, data)
+        return append_to_buffer(buffer, self.write_data(data, datacontenttype))
 
     def read_data(
-        self, body: bytes, datacontenttype: str | None
+        self, body: ReadableBuffer, datacontenttype: str | None
     ) -> dict[str, Any] | str | bytes | None:
         """
         Deserialize data payload from HTTP binary mode body.
@@ -188,31 +387,57 @@ class JSONFormat(Format):
         This method is used by HTTP binary content mode to deserialize the HTTP body
         into event data based on the content type.
 
-        :param body: HTTP body as bytes
+        :param body: HTTP body as bytes, bytearray or memoryview
         :param datacontenttype: Content type of the data
-        :return: Deserialized data (dict for JSON, str for text, bytes for binary)
+        :return: Deserialized data (dict for JSON, str for text, bytes for binary,
+            ``RawJSON`` for JSON if the format reads raw data)
         """
-        if not body or len(body) == 0:
+        if not body:
             return None
 
-        # If content type indicates JSON, try to parse as JSON
-        if datacontenttype and re.match(
-            JSONFormat.JSON_CONTENT_TYPE_PATTERN, datacontenttype
-        ):
+        media_type = parse_content_type(datacontenttype) if datacontenttype else None
+        if media_type is not None and media_type.kind == KIND_BINARY:
+            return body if isinstance(body, bytes) else bytes(body)
+        if self._raw_data and media_type is not None and media_type.is_json:
+            return RawJSON(body)
+
+        # Decode the body only once, JSON is parsed from the decoded text
+        encoding = media_type.encoding if media_type else DEFAULT_ENCODING
+        try:
+            text = str(body, encoding)
+        except UnicodeDecodeError:
+            # If decoding fails, return as bytes
+            return body if isinstance(body, bytes) else bytes(body)
+
+        if media_type is not None and media_type.is_json:
             try:
-                decoded = body.decode("utf-8")
-                parsed: dict[str, Any] = loads(decoded)
+                parsed: dict[str, Any] = self._backend.loads(text)
                 return parsed
-            except (ValueError, UnicodeDecodeError):
-                # If JSON parsing fails, fall through to other handling
+            except ValueError:
+                # If JSON parsing fails, return the text
                 pass
+        return text
 
-        # Try to decode as UTF-8 string
-        try:
-            return body.decode("utf-8")
-        except UnicodeDecodeError:
-            # If UTF-8 decoding fails, return as bytes
-            return body
+    def peek_attributes(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        """
+        Read only the context attributes of a JSON formatted event.
+
+        The ``data`` and ``data_base64`` members are skipped without being
+        converted, and no event is created or validated. Use this to route
+        events by their attributes before, or instead of, reading them.
+
+        :param data: The JSON formatted byte array.
+        :return: The attributes as found in the event, with ``time`` kept as the
+            original string in a ``LazyTime``.
+        :raises ValueError: If the data is not a JSON object.
+        """
+        text = _as_text(data)
+        attributes, end = _read_envelope(text, _skip_whitespace(text, 0), peek=True)
+        if _skip_whitespace(text, end) != len(text):
+            raise ValueError(f"Unexpected data after the JSON event at offset {end}")
+        if isinstance(attributes.get("time"), str):
+            attributes["time"] = LazyTime(attributes["time"])
+        return attributes
 
     def get_content_type(self) -> str:
         """
@@ -221,3 +446,514 @@ class JSONFormat(Format):
         :return: Content type string for CloudEvents structured content mode
         """
         return self.CONTENT_TYPE
+
+    def get_batch_content_type(self) -> str:
+        """
+        Get the Content-Type header value for batched mode.
+
+        :return: Content type string for CloudEvents batched content mode
+        """
+        return self.BATCH_CONTENT_TYPE
+
+
+# Default number of bytes or characters read from a file-like source at once
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
+_NON_WHITESPACE: Final[Pattern[str]] = re.compile(r"[^ \t\n\r]")
+_STRUCTURAL: Final[Pattern[str]] = re.compile(r'[][{},"]')
+_STRING_SPECIAL: Final[Pattern[str]] = re.compile(r'["\\]')
+_ENTRY_DECODER: Final[json.JSONDecoder] = json.JSONDecoder()
+# Values shorter than this are decoded, which is faster than scanning them
+_MIN_SKIP_LENGTH: Final[int] = 4096
+# Brackets scanned before checking that the scan still covers enough text per
+# bracket to be faster than decoding the value
+_SKIP_BRACKET_BUDGET: Final[int] = 64
+_SKIP_MIN_CHARS_PER_BRACKET: Final[int] = 256
+# Members of an event in the JSON format that hold its data
+_DATA_MEMBERS: Final[frozenset[str]] = frozenset({"data", "data_base64"})
+
+
+def _iter_text(
+    source: IO[bytes] | IO[str] | Iterable[bytes | str], chunk_size: int
+) -> Iterator[str]:
+    """
+    Read a source in chunks of text.
+
+    :param source: A file-like object or an iterable of chunks
+    :param chunk_size: The number of bytes or characters to read from a file-like
+        object at once
+    :return: An iterator over the non-empty chunks, bytes decoded as UTF-8
+    """
+    read = getattr(source, "read", None)
+    chunks: Iterable[bytes | str] = source
+    if read is not None:
+        # A file-like object signals its end with an empty read
+        chunks = iter(lambda: read(chunk_size) or None, None)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+        if text:
+            yield text
+    # Fails on a multi-byte character that was cut off at the end of the source
+    decoder.decode(b"", final=True)
+
+
+class _EntryScanner:
+    """
+    Find the end of a batch entry without decoding it, in text that may arrive
+    in several pieces.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escaped")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        # Whether the previous piece ended with a backslash inside a string
+        self._escaped = False
+
+    def scan(self, text: str, pos: int) -> int:
+        """
+        Scan the next piece of the entry.
+
+        :param text: The text holding the piece
+        :param pos: The position of the piece in the text
+        :return: The position of the comma or closing bracket following the entry,
+            or -1 if the entry continues after the text
+        """
+        if self._escaped:
+            self._escaped = False
+            pos += 1
+        depth = self._depth
+        try:
+            while True:
+                if self._in_string:
+                    # Skip the rest of the string, including escaped quotes
+                    match = _STRING_SPECIAL.search(text, pos)
+                    if match is None:
+                        return -1
+                    pos = match.end()
+                    if match.group() == '"':
+                        self._in_string = False
+                    elif pos >= len(text):
+                        self._escaped = True
+                        return -1
+                    else:
+                        pos += 1
+                    continue
+                match = _STRUCTURAL.search(text, pos)
+                if match is None:
+                    return -1
+                char = match.group()
+                pos = match.end()
+                if char == '"':
+                    self._in_string = True
+                elif char in "[{":
+                    depth += 1
+                elif depth > 0:
+                    if char in "]}":
+                        depth -= 1
+                elif char in ",]":
+                    return match.start()
+        finally:
+            self._depth = depth
+
+
+def _skip_string(text: str, pos: int) -> int:
+    """
+    Find the end of a JSON string without decoding it.
+
+    :param text: The JSON text
+    :param pos: The position after the opening quote of the string
+    :return: The position after the closing quote of the string
+    :raises ValueError: If the string is not terminated
+    """
+    while True:
+        quote = text.find('"', pos)
+        if quote == -1:
+            raise ValueError("Unterminated string in the JSON event")
+        # The quote is escaped if an odd number of backslashes precedes it
+        escape = quote
+        while text[escape - 1] == "\\":
+            escape -= 1
+        if (quote - escape) % 2 == 0:
+            return quote + 1
+        pos = quote + 1
+
+
+def _skip_value(text: str, pos: int) -> int:
+    """
+    Find the end of a JSON value without decoding it.
+
+    Strings are skipped by searching for their closing quote, and objects and
+    arrays by searching for their brackets, counting the quotes in between to
+    tell whether a bracket is inside a string. Both searches run in C over long
+    stretches of text, so large strings and containers of long items are skipped
+    much faster than they are decoded. Short values, and containers so dense in
+    brackets that the C decoder is faster than the scan, are decoded instead.
+
+    :param text: The JSON text
+    :param pos: The position of the value
+    :return: The position after the value
+    :raises ValueError: If the value is not terminated
+    """
+    char = text[pos : pos + 1]
+    if char == '"':
+        return _skip_string(text, pos + 1)
+    if (char != "{" and char != "[") or len(text) - pos < _MIN_SKIP_LENGTH:
+        return _ENTRY_DECODER.raw_decode(text, pos)[1]
+
+    start = pos
+    length = len(text)
+
+    def find(char: str, pos: int) -> int:
+        found = text.find(char, pos)
+        return length if found == -1 else found
+
+    # The next position of each bracket, searched again once it is passed
+    open_brace, close_brace = find("{", pos), find("}", pos)
+    open_bracket, close_bracket = find("[", pos), find("]", pos)
+    depth = 0
+    budget_start, budget = pos, _SKIP_BRACKET_BUDGET
+    while True:
+        bracket = min(open_brace, close_brace, open_bracket, close_bracket)
+        if bracket == length:
+            raise ValueError("Unexpected end of the JSON event")
+        quotes = text.count('"', pos, bracket)
+        if quotes and (quotes % 2 or text.find("\\", pos, bracket) != -1):
+            # The bracket may be inside a string, skip the first string instead
+            pos = _skip_string(text, text.find('"', pos, bracket) + 1)
+            if open_brace < pos:
+                open_brace = find("{", pos)
+            if close_brace < pos:
+                close_brace = find("}", pos)
+            if open_bracket < pos:
+                open_bracket = find("[", pos)
+            if close_bracket < pos:
+                close_bracket = find("]", pos)
+            continue
+
+        pos = bracket + 1
+        if bracket == open_brace:
+            open_brace = find("{", pos)
+            depth += 1
+        elif bracket == open_bracket:
+            open_bracket = find("[", pos)
+            depth += 1
+        else:
+            if bracket == close_brace:
+                close_brace = find("}", pos)
+            else:
+                close_bracket = find("]", pos)
+            depth -= 1
+            if depth == 0:
+                return pos
+
+        budget -= 1
+        if budget == 0:
+            if pos - budget_start < _SKIP_BRACKET_BUDGET * _SKIP_MIN_CHARS_PER_BRACKET:
+                return _ENTRY_DECODER.raw_decode(text, start)[1]
+            budget_start, budget = pos, _SKIP_BRACKET_BUDGET
+
+
+def _join_batch(chunks: Iterable[tuple[bytes, bool]]) -> Iterator[ReadableBuffer]:
+    """
+    Join the chunks of ``JSONFormat._encode_batch()`` into a JSON batch.
+
+    :param chunks: The encoded events, and JSON arrays of encoded events
+    :return: An iterator over the parts of the batch, the items of the arrays
+        as views that are not copied
+    """
+    yield b"["
+    for index, (encoded, is_array) in enumerate(chunks):
+        if index:
+            yield b","
+        yield memoryview(encoded)[1:-1] if is_array else encoded
+    yield b"]"
+
+
+def _as_text(data: str | ReadableBuffer) -> str:
+    return data if isinstance(data, str) else str(data, "utf-8")
+
+
+def _decode_base64(value: str) -> bytes:
+    # Unlike base64.b64decode(), binascii decodes a str without first copying it
+    # into an ASCII bytes object
+    return binascii.a2b_base64(value)
+
+
+def _encode_base64(value: ReadableBuffer) -> str:
+    return binascii.b2a_base64(value, newline=False).decode("ascii")
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _NON_WHITESPACE.search(text, pos)
+    return len(text) if match is None else match.start()
+
+
+def _expect(text: str, pos: int, chars: str) -> str:
+    if pos >= len(text):
+        raise ValueError("Unexpected end of the JSON event")
+    char = text[pos]
+    if char not in chars:
+        raise ValueError(f"Expecting one of {chars!r} at offset {pos}")
+    return char
+
+
+def _read_envelope(
+    text: str, pos: int, peek: bool = False
+) -> tuple[dict[str, Any], int]:
+    """
+    Decode the context attributes of an event in the JSON format, keeping its
+    ``data`` member undecoded.
+
+    The ``data`` value is returned as a ``RawJSON`` slice of the input, or None if
+    it is ``null``.
+
+    :param text: The JSON formatted event, or a batch holding it
+    :param pos: The position of the opening brace of the event
+    :param peek: If True, the ``data`` and ``data_base64`` members are skipped
+    :return: The members of the event and the position after its closing brace
+    :raises ValueError: If the event is not a JSON object
+    """
+    if pos >= len(text) or text[pos] != "{":
+        raise ValueError("A JSON formatted event must be a JSON object")
+    raw_decode = _ENTRY_DECODER.raw_decode
+    members: dict[str, Any] = {}
+    pos = _skip_whitespace(text, pos + 1)
+    if pos < len(text) and text[pos] == "}":
+        return members, pos + 1
+
+    while True:
+        _expect(text, pos, '"')
+        name, pos = raw_decode(text, pos)
+        pos = _skip_whitespace(text, pos)
+        _expect(text, pos, ":")
+        pos = _skip_whitespace(text, pos + 1)
+        if peek and name in _DATA_MEMBERS:
+            end = _skip_value(text, pos)
+        elif name == "data":
+            # The C decoder finds the end of the value faster than scanning it
+            # in Python, the decoded value is discarded
+            _, end = raw_decode(text, pos)
+            value = text[pos:end]
+            members[name] = None if value == "null" else RawJSON(value.encode("utf-8"))
+        else:
+            members[name], end = raw_decode(text, pos)
+        pos = _skip_whitespace(text, end)
+        if _expect(text, pos, ",}") == "}":
+            return members, pos + 1
+        pos = _skip_whitespace(text, pos + 1)
+
+
+def _iter_envelopes(text: str) -> Iterator[dict[str, Any]]:
+    """
+    Decode the events of a JSON batch with ``_read_envelope()``.
+
+    :param text: The JSON batch
+    :return: An iterator over the members of every event
+    :raises ValueError: If the data is not a JSON array of JSON objects
+    """
+    pos = _skip_whitespace(text, 0)
+    if pos >= len(text) or text[pos] != "[":
+        raise ValueError("A JSON batch must be a JSON array")
+    pos = _skip_whitespace(text, pos + 1)
+    if pos < len(text) and text[pos] == "]":
+        pos += 1
+    else:
+        while True:
+            members, pos = _read_envelope(text, pos)
+            yield members
+            pos = _skip_whitespace(text, pos)
+            if _expect(text, pos, ",]") == "]":
+                pos += 1
+                break
+            pos = _skip_whitespace(text, pos + 1)
+    if _skip_whitespace(text, pos) != len(text):
+        raise ValueError(f"Unexpected data after the JSON batch at offset {pos}")
+
+
+class JSONBatchReader:
+    """
+    Incremental reader for JSON batches (``application/cloudevents-batch+json``).
+
+    The batch is read chunk by chunk and every event is produced as soon as its
+    entry is complete, so memory use is bounded by the chunk size and the size of
+    the largest entry rather than by the size of the batch. Entries are decoded
+    with the standard library JSON decoder straight from the buffered text.
+
+    An entry that is not valid JSON or not a valid event is skipped and recorded
+    in ``errors``, the remaining entries are still read. The offset of an error is
+    the character offset of the entry in the batch.
+
+    Example:
+        >>> with open("batch.json", "rb") as file:
+        ...     reader = JSONBatchReader(file)
+        ...     for event in reader:
+        ...         process(event)
+        >>> reader.errors  # [BatchEntryError(...), ...]
+    """
+
+    def __init__(
+        self,
+        source: IO[bytes] | IO[str] | Iterable[bytes | str],
+        event_factory: EventFactory | None = None,
+        event_format: JSONFormat | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        :param source: A binary or text file-like object, or an iterable of bytes
+            or str chunks, holding the JSON batch.
+        :param event_factory: A factory function to create CloudEvent instances.
+            If None, the version of every event is detected separately.
+        :param event_format: The JSON format to create the events with, defaults
+            to ``JSONFormat()``.
+        :param chunk_size: The number of bytes or characters read from a file-like
+            object at once.
+        """
+        self._source = source
+        self._event_factory = event_factory
+        self._event_format = event_format if event_format is not None else JSONFormat()
+        self._chunk_size = chunk_size
+        self.errors: list[BatchEntryError] = []
+
+    def __iter__(self) -> Iterator[BaseCloudEvent]:
+        """
+        Read the events of the batch.
+
+        :return: An iterator over the valid events, in the order of the batch.
+        :raises ValueError: If the data is not a JSON array.
+        """
+        json_format = self._event_format
+        for index, offset, entry in self._iter_entries():
+            try:
+                if isinstance(entry, Exception):
+                    raise entry
+                if not isinstance(entry, dict):
+                    raise ValueError("Entry is not a JSON object")
+                event = json_format._read_event(self._event_factory, entry)
+            except (BaseCloudEventException, ValueError, TypeError) as e:
+                self.errors.append(BatchEntryError(index, offset, e))
+                continue
+            yield event
+
+    def _iter_entries(self) -> Iterator[tuple[int, int, Any]]:
+        """
+        Decode the entries of the JSON array one at a time.
+
+        :return: An iterator over the position, character offset and decoded value
+            of every entry, or the error for an entry that cannot be decoded.
+        :raises ValueError: If the data is not a JSON array.
+        """
+        chunks = _iter_text(self._source, self._chunk_size)
+        raw_decode = _ENTRY_DECODER.raw_decode
+        buffer = ""
+        # Scans the chunks of an incomplete entry as they arrive, which are only
+        # appended to the buffer and decoded once the end of the entry is found
+        scanner: _EntryScanner | None = None
+        pending: list[str] = []
+        # Character offset of buffer[0] and the position of the next token
+        base = pos = 0
+        index = 0
+        started = finished = False
+        # Whether an entry or the end of the array is expected next, rather than
+        # the comma or closing bracket following an entry
+        expect_entry = True
+        need_more = True
+        eof = False
+
+        while True:
+            if need_more:
+                chunk = next(chunks, None)
+                need_more = False
+                if chunk is None:
+                    eof = True
+                else:
+                    pending.append(chunk)
+                    if scanner is not None and scanner.scan(chunk, 0) == -1:
+                        need_more = True
+                        continue
+                if pending:
+                    # Drop the consumed entries before growing the buffer
+                    buffer = buffer[pos:] + "".join(pending)
+                    base += pos
+                    pos = 0
+                    pending = []
+                scanner = None
+
+            match = _NON_WHITESPACE.search(buffer, pos)
+            if match is None:
+                if eof:
+                    break
+                need_more = True
+                continue
+            pos = match.start()
+            char = match.group()
+
+            if finished:
+                raise ValueError(
+                    f"Unexpected data after the JSON batch at offset {base + pos}"
+                )
+            if not started:
+                if char != "[":
+                    raise ValueError("A JSON batch must be a JSON array")
+                started = True
+                pos += 1
+                continue
+            if not expect_entry:
+                # Only a comma or the closing bracket can follow a decoded entry
+                finished = char == "]"
+                expect_entry = True
+                pos += 1
+                continue
+            if char in ",]":
+                if char == "]" and index == 0:
+                    finished = True
+                else:
+                    yield index, base + pos, ValueError("Missing entry in the batch")
+                    index += 1
+                    finished = char == "]"
+                pos += 1
+                continue
+
+            error: ValueError | None = None
+            try:
+                entry, end = raw_decode(buffer, pos)
+            except ValueError as e:
+                error = e
+            else:
+                following = _NON_WHITESPACE.search(buffer, end)
+                if following is None and not eof:
+                    # A number or literal may continue in the next chunk
+                    need_more = True
+                    continue
+                if following is None or following.group() in ",]":
+                    yield index, base + pos, entry
+                    index += 1
+                    pos = end
+                    expect_entry = False
+                    continue
+                error = ValueError(
+                    f"Unexpected data after entry at offset {base + end}"
+                )
+
+            # Skip an invalid entry, or wait for the rest of an incomplete one
+            scanner = _EntryScanner()
+            end = scanner.scan(buffer, pos)
+            if end == -1 and not eof:
+                need_more = True
+                continue
+            scanner = None
+            if end == -1:
+                error = ValueError("Unexpected end of the JSON batch")
+            yield index, base + pos, error
+            index += 1
+            if end == -1:
+                return
+            pos = end
+            expect_entry = False
+
+        if not started:
+            raise ValueError("A JSON batch must be a JSON array")
+        if not finished:
+            yield index, base + pos, ValueError("Unexpected end of the JSON batch")
@@ -0,0 +1,219 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON encoder/decoder backends for ``JSONFormat``.
+
+The standard library ``json`` module is always available. The ``orjson`` and
+``msgspec`` backends are used only when the respective package is installed.
+All backends serialize datetimes as RFC 3339 strings with a ``Z`` suffix for UTC
+and bytes nested in the data as base64 strings.
+"""
+
+import binascii
+import importlib
+from datetime import datetime
+from json import JSONEncoder, loads
+from typing import Any, Final, Protocol
+
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.time import format_time
+
+
+class JSONBackend(Protocol):
+    """
+    Protocol for the JSON implementation used by ``JSONFormat``.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        :param obj: The object to serialize
+        :return: The JSON document as bytes
+        :raises TypeError: If the object contains a value that cannot be serialized
+        """
+        ...
+
+    def loads(self, data: str | ReadableBuffer) -> Any:
+        """
+        Deserialize a JSON document.
+
+        :param data: The JSON document as str, or UTF-8 encoded bytes, bytearray or
+            memoryview
+        :return: The deserialized object
+        :raises ValueError: If the document is not valid JSON
+        """
+        ...
+
+
+class BufferedJSONBackend(JSONBackend, Protocol):
+    """
+    Protocol for JSON backends that can also serialize into an existing buffer.
+    """
+
+    def dumps_into(self, obj: Any, buffer: bytearray) -> None:
+        """
+        Serialize an object to UTF-8 encoded JSON at the end of a buffer.
+
+        :param obj: The object to serialize
+        :param buffer: The buffer to extend
+        :raises TypeError: If the object contains a value that cannot be serialized
+        """
+        ...
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Convert values that JSON does not support natively.
+
+    :param obj: The value to convert
+    :return: A JSON-compatible representation of the value
+    :raises TypeError: If the value is not supported
+    """
+    if isinstance(obj, datetime):
+        return format_time(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return binascii.b2a_base64(obj, newline=False).decode("ascii")
+    if isinstance(obj, str):
+        # msgspec only encodes exact str instances, not subclasses like LazyTime
+        return str(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _JSONEncoderWithDatetime(JSONEncoder):
+    """
+    Custom JSON encoder to handle datetime and bytes values in the format required by the CloudEvents spec.
+    """
+
+    def default(self, obj: Any) -> Any:
+        return _encode_default(obj)
+
+
+class StdlibJSONBackend:
+    """
+    JSON backend using the ``json`` module of the standard library.
+    """
+
+    _encoder: Final[JSONEncoder] = _JSONEncoderWithDatetime()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: str | ReadableBuffer) -> Any:
+        if not isinstance(data, str):
+            # Decodes any buffer, a memoryview is not copied into bytes first
+            data = str(data, "utf-8")
+        return loads(data)
+
+
+class OrjsonJSONBackend:
+    """
+    JSON backend using ``orjson``.
+    """
+
+    def __init__(self) -> None:
+        """
+        :raises ImportError: If orjson is not installed
+        """
+        self._orjson = importlib.import_module("orjson")
+        self._option = self._orjson.OPT_UTC_Z
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(  # type: ignore[no-any-return]
+            obj, default=_encode_default, option=self._option
+        )
+
+    def loads(self, data: str | ReadableBuffer) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONBackend:
+    """
+    JSON backend using ``msgspec``.
+    """
+
+    def __init__(self) -> None:
+        """
+        :raises ImportError: If msgspec is not installed
+        """
+        msgspec = importlib.import_module("msgspec")
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def dumps_into(self, obj: Any, buffer: bytearray) -> None:
+        self._encoder.encode_into(obj, buffer, -1)
+
+    def loads(self, data: str | ReadableBuffer) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+_BACKEND_CLASSES: Final[dict[str, type[JSONBackend]]] = {
+    "stdlib": StdlibJSONBackend,
+    "orjson": OrjsonJSONBackend,
+    "msgspec": MsgspecJSONBackend,
+}
+_backends: dict[str, JSONBackend] = {}
+
+
+def get_json_backend(name: str = "stdlib") -> JSONBackend:
+    """
+    Get a shared instance of a built-in JSON backend.
+
+    :param name: ``"stdlib"``, ``"orjson"``, ``"msgspec"``, or ``"auto"`` for the
+        fastest installed one
+    :return: The backend
+    :raises ValueError: If the name is unknown
+    :raises ImportError: If the package of the backend is not installed
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return get_json_backend(candidate)
+            except ImportError:
+                continue
+        return get_json_backend("stdlib")
+
+    backend = _backends.get(name)
+    if backend is None:
+        backend_class = _BACKEND_CLASSES.get(name)
+        if backend_class is None:
+            raise ValueError(f"Unknown JSON backend: {name}")
+        backend = _backends[name] = backend_class()
+    return backend
+
+
+def resolve_json_backend(backend: JSONBackend | str | None) -> JSONBackend:
+    """
+    Resolve the ``backend`` option of the formats to a JSON backend.
+
+    :param backend: A ``JSONBackend``, the name of a built-in one (see
+        ``get_json_backend()``), or None for the standard library ``json`` module
+    :return: The backend
+    :raises ValueError: If the name is unknown
+    :raises ImportError: If the package of the named backend is not installed
+    """
+    if backend is None:
+        return get_json_backend("stdlib")
+    if isinstance(backend, str):
+        return get_json_backend(backend)
+    return backend
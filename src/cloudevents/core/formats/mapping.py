@@ -0,0 +1,125 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Base class for binary event formats that encode an event as a single map.
+"""
+
+from abc import abstractmethod
+from typing import Any, Final
+
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.formats.binary import BinaryFormat
+from cloudevents.core.lazy import LazyTime, RawJSON, get_encoded_attributes
+from cloudevents.core.spec import SPECVERSION_V1_0
+
+_DATA: Final[str] = "data"
+
+
+class MappingFormat(BinaryFormat):
+    """
+    An event format that encodes an event as one map, like the JSON format, with a
+    codec that supports bytes and timestamps natively.
+
+    The map holds the attributes and the data under ``data``. Binary data is
+    written as bytes instead of ``data_base64``, and ``time`` and other timestamp
+    attributes as the native timestamp type of the codec. Subclasses implement
+    ``_encode``, ``_decode`` and ``get_content_type``.
+    """
+
+    @abstractmethod
+    def _encode(self, obj: dict[str, Any]) -> bytes:
+        """
+        :param obj: The event map
+        :return: The encoded map
+        :raises ValueError: If a value cannot be encoded
+        """
+
+    @abstractmethod
+    def _decode(self, data: ReadableBuffer) -> Any:
+        """
+        :param data: An encoded value
+        :return: The decoded value
+        :raises ValueError: If the data is not a single valid value
+        """
+
+    def read(
+        self,
+        event_factory: EventFactory | None,
+        data: str | ReadableBuffer,
+    ) -> BaseCloudEvent:
+        """
+        Read a CloudEvent from its encoded map.
+
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, automatically detects version from 'specversion' attribute.
+        :param data: The encoded event.
+        :return: The CloudEvent instance.
+        :raises ValueError: If the data is not a valid encoded event map.
+        """
+        attributes = self._decode_map(data)
+
+        # Auto-detect version if factory not provided
+        if event_factory is None:
+            from cloudevents.core.bindings.common import get_event_factory_for_version
+
+            specversion = attributes.get("specversion", SPECVERSION_V1_0)
+            event_factory = get_event_factory_for_version(specversion)
+
+        event_data = attributes.pop(_DATA, None)
+        return event_factory(self._read_time(attributes), event_data)
+
+    def peek_attributes(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        """
+        Read only the context attributes of an encoded event.
+
+        :param data: The encoded event.
+        :return: The attributes of the event.
+        :raises ValueError: If the data is not a valid encoded event map.
+        """
+        attributes = self._decode_map(data)
+        attributes.pop(_DATA, None)
+        return self._read_time(attributes)
+
+    def _decode_map(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        if isinstance(data, str):
+            raise ValueError(f"An event in {self.get_content_type()} must be bytes")
+        decoded = self._decode(data)
+        if not isinstance(decoded, dict):
+            raise ValueError(
+                f"Expected an encoded map, got {type(decoded).__name__} instead"
+            )
+        return decoded
+
+    @staticmethod
+    def _read_time(attributes: dict[str, Any]) -> dict[str, Any]:
+        # An event written by a JSON-based producer may carry the time as text
+        if isinstance(attributes.get("time"), str):
+            attributes["time"] = LazyTime(attributes["time"])
+        return attributes
+
+    def _write(self, event: BaseCloudEvent) -> bytes:
+        event_map = dict(get_encoded_attributes(event))
+        if isinstance(event_map.get("time"), LazyTime):
+            # Written as a native timestamp like any other time
+            event_map["time"] = event.get_time()
+        event_data = event.get_data()
+        if isinstance(event_data, RawJSON):
+            event_data = event_data.loads()
+        elif isinstance(event_data, (bytearray, memoryview)):
+            event_data = bytes(event_data)
+        if event_data is not None:
+            event_map[_DATA] = event_data
+        return self._encode(event_map)
@@ -0,0 +1,97 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+"""
+MessagePack event format (``application/cloudevents+msgpack``), using the optional
+``msgpack`` package.
+"""
+
+import importlib
+from typing import Any, Final
+
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.formats.json_backends import JSONBackend
+from cloudevents.core.formats.mapping import MappingFormat
+
+
+class MessagePackFormat(MappingFormat):
+    """
+    The MessagePack event format.
+
+    Binary data is written with the bin format family, and timestamps with the
+    timestamp extension type (-1).
+    """
+
+    CONTENT_TYPE: Final[str] = "application/cloudevents+msgpack"
+
+    def __init__(self, json_backend: JSONBackend | str | None = None) -> None:
+        """
+        :param json_backend: The JSON implementation for JSON data in binary
+            content mode, see ``JSONFormat``. Defaults to the standard library
+            ``json`` module.
+        :raises ImportError: If msgpack or the package of the named backend is not
+            installed
+        """
+        super().__init__(json_backend)
+        self._msgpack = importlib.import_module("msgpack")
+        self._errors = (ValueError, self._msgpack.UnpackException)
+
+    def _encode(self, obj: dict[str, Any]) -> bytes:
+        try:
+            return self._msgpack.packb(  # type: ignore[no-any-return]
+                obj, use_bin_type=True, datetime=True
+            )
+        except TypeError as e:
+            raise ValueError(str(e)) from e
+
+    def _decode(self, data: ReadableBuffer) -> Any:
+        try:
+            return self._msgpack.unpackb(data, raw=False, timestamp=3)
+        except self._errors as e:
+            raise ValueError(str(e)) from e
+
+    def peek_attributes(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        """
+        Read only the context attributes of an encoded event.
+
+        The data is skipped over without being decoded.
+
+        :param data: The encoded event.
+        :return: The attributes of the event.
+        :raises ValueError: If the data is not a valid encoded event map.
+        """
+        if isinstance(data, str):
+            raise ValueError(f"An event in {self.CONTENT_TYPE} must be bytes")
+        unpacker = self._msgpack.Unpacker(raw=False, timestamp=3)
+        unpacker.feed(data)
+        attributes: dict[str, Any] = {}
+        try:
+            for _ in range(unpacker.read_map_header()):
+                name = unpacker.unpack()
+                if name == "data":
+                    unpacker.skip()
+                else:
+                    attributes[name] = unpacker.unpack()
+        except self._errors as e:
+            raise ValueError(str(e)) from e
+        return self._read_time(attributes)
+
+    def get_content_type(self) -> str:
+        """
+        Get the Content-Type header value for structured mode.
+
+        :return: Content type string for CloudEvents structured content mode
+        """
+        return self.CONTENT_TYPE
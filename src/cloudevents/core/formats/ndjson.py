@@ -0,0 +1,220 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Newline-delimited JSON (JSON Lines) event streams.
+
+Every line of a stream holds one event in the JSON format, as produced by
+``JSONFormat.write``. Streams are written and read in chunks, which suits
+archiving events to files and replaying them.
+"""
+
+from types import TracebackType
+from typing import IO, Final, Iterable, Iterator
+
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.exceptions import BaseCloudEventException, BatchEntryError
+from cloudevents.core.formats.json import DEFAULT_CHUNK_SIZE, JSONFormat
+
+# Translation table replacing line breaks by spaces
+_LINE_BREAKS: Final[bytes] = bytes.maketrans(b"\r\n", b"  ")
+
+
+class NDJSONWriter:
+    """
+    Writes events as newline-delimited JSON to a binary stream.
+
+    Encoded events are appended to a buffer and written to the stream with a
+    single ``write`` and ``flush`` once ``chunk_size`` bytes are pending. Use the
+    writer as a context manager, or call ``flush()``, so that the last chunk is
+    written as well.
+
+    Example:
+        >>> with open("events.ndjson", "ab") as file, NDJSONWriter(file) as writer:
+        ...     writer.write_all(events)
+    """
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        event_format: JSONFormat | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        :param stream: The binary stream to append the events to.
+        :param event_format: The JSON format to encode the events with, defaults
+            to ``JSONFormat()``.
+        :param chunk_size: The number of pending bytes that triggers a flush.
+        """
+        self._stream = stream
+        self._event_format = event_format if event_format is not None else JSONFormat()
+        self._chunk_size = chunk_size
+        self._pending = bytearray()
+
+    def write(self, event: BaseCloudEvent) -> None:
+        """
+        Append an event to the stream.
+
+        :param event: The CloudEvent to write.
+        """
+        start = len(self._pending)
+        self._event_format.write_into(event, self._pending)
+        if self._pending.find(b"\n", start) != -1:
+            # Only RawJSON data spliced in verbatim can hold line breaks. Outside
+            # of strings they are whitespace, so they are replaced by spaces to
+            # keep the event on one line.
+            self._pending[start:] = self._pending[start:].translate(_LINE_BREAKS)
+        self._pending += b"\n"
+        if len(self._pending) >= self._chunk_size:
+            self.flush()
+
+    def write_all(self, events: Iterable[BaseCloudEvent]) -> int:
+        """
+        Append several events to the stream.
+
+        :param events: The CloudEvents to write.
+        :return: The number of events written.
+        """
+        count = 0
+        for event in events:
+            self.write(event)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """
+        Write the pending events to the stream and flush it.
+        """
+        if self._pending:
+            self._stream.write(self._pending)
+            self._pending.clear()
+        self._stream.flush()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.flush()
+
+
+class NDJSONReader:
+    """
+    Reads events from a newline-delimited JSON stream.
+
+    The stream is read in chunks that are split into lines, so large files are
+    read with bounded memory. Blank lines are ignored. By default a line that is
+    not a valid event raises a ``BatchEntryError``; with ``skip_errors`` the line
+    is skipped instead and the error is collected in ``errors``.
+
+    The index of an error is the zero-based line number and the offset is the
+    byte offset of the line in the stream.
+
+    Example:
+        >>> with open("events.ndjson", "rb") as file:
+        ...     reader = NDJSONReader(file, skip_errors=True)
+        ...     for event in reader:
+        ...         process(event)
+        >>> reader.errors  # [BatchEntryError(...), ...]
+    """
+
+    def __init__(
+        self,
+        source: IO[bytes] | Iterable[bytes],
+        event_factory: EventFactory | None = None,
+        event_format: JSONFormat | None = None,
+        skip_errors: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        :param source: A binary file-like object, or an iterable of bytes chunks.
+        :param event_factory: A factory function to create CloudEvent instances.
+            If None, the version of every event is detected separately.
+        :param event_format: The JSON format to decode the events with, defaults
+            to ``JSONFormat()``.
+        :param skip_errors: If True, invalid lines are skipped and collected in
+            ``errors`` instead of raising.
+        :param chunk_size: The number of bytes read from a file-like object at once.
+        """
+        self._source = source
+        self._event_factory = event_factory
+        self._event_format = event_format if event_format is not None else JSONFormat()
+        self._skip_errors = skip_errors
+        self._chunk_size = chunk_size
+        self.errors: list[BatchEntryError] = []
+
+    def _iter_chunks(self) -> Iterable[bytes]:
+        read = getattr(self._source, "read", None)
+        if read is None:
+            return self._source
+        chunk_size = self._chunk_size
+        return iter(lambda: read(chunk_size), b"")
+
+    def _iter_lines(self) -> Iterator[tuple[int, int, bytes]]:
+        """
+        Split the stream into lines.
+
+        :return: An iterator over the line number, byte offset and content of
+            every line, without the line break.
+        """
+        number = 0
+        offset = 0
+        # The parts of a line that spans chunks, joined once its end is found
+        pending: list[bytes] = []
+        for chunk in self._iter_chunks():
+            lines = chunk.split(b"\n")
+            # The last part is incomplete until the next line break
+            rest = lines.pop()
+            if not lines:
+                pending.append(rest)
+                continue
+            if pending:
+                pending.append(lines[0])
+                lines[0] = b"".join(pending)
+                pending = []
+            for line in lines:
+                yield number, offset, line
+                number += 1
+                offset += len(line) + 1
+            if rest:
+                pending.append(rest)
+        if pending:
+            yield number, offset, b"".join(pending)
+
+    def __iter__(self) -> Iterator[BaseCloudEvent]:
+        """
+        Read the events of the stream.
+
+        :return: An iterator over the events, in the order of the stream.
+        :raises BatchEntryError: If a line is not a valid event and ``skip_errors``
+            is not set.
+        """
+        read = self._event_format.read
+        event_factory = self._event_factory
+        for number, offset, line in self._iter_lines():
+            if not line.strip():
+                continue
+            try:
+                event = read(event_factory, line)
+            except (BaseCloudEventException, ValueError, TypeError) as e:
+                error = BatchEntryError(number, offset, e)
+                if not self._skip_errors:
+                    raise error from e
+                self.errors.append(error)
+                continue
+            yield event
@@ -0,0 +1,622 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Protobuf event format (``application/cloudevents+protobuf``).
+
+Events are encoded as the ``CloudEvent`` and ``CloudEventBatch`` messages of the
+CloudEvents Protobuf format specification. The wire encoding of these messages is
+implemented here, so the format does not depend on the ``protobuf`` package:
+
+.. code-block:: protobuf
+
+    message CloudEvent {
+      string id = 1;
+      string source = 2;
+      string spec_version = 3;
+      string type = 4;
+      map<string, CloudEventAttributeValue> attributes = 5;
+      oneof data {
+        bytes binary_data = 6;
+        string text_data = 7;
+        google.protobuf.Any proto_data = 8;
+      }
+    }
+
+    message CloudEventAttributeValue {
+      oneof attr {
+        bool ce_boolean = 1;
+        int32 ce_integer = 2;
+        string ce_string = 3;
+        bytes ce_bytes = 4;
+        string ce_uri = 5;
+        string ce_uri_ref = 6;
+        google.protobuf.Timestamp ce_timestamp = 7;
+      }
+    }
+
+    message CloudEventBatch {
+      repeated CloudEvent events = 1;
+    }
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Final, Iterable, Iterator
+
+from cloudevents.core.base import BaseCloudEvent, EventFactory
+from cloudevents.core.formats.base import (
+    BatchFormat,
+    ReadableBuffer,
+    WritableBuffer,
+    append_to_buffer,
+)
+from cloudevents.core.formats.binary import BinaryFormat
+from cloudevents.core.formats.content_type import parse_content_type
+from cloudevents.core.lazy import RawJSON, get_encoded_attributes
+from cloudevents.core.spec import SPECVERSION_V1_0
+
+# Wire types
+_VARINT: Final[int] = 0
+_FIXED64: Final[int] = 1
+_LENGTH_DELIMITED: Final[int] = 2
+_FIXED32: Final[int] = 5
+
+# Fields of the CloudEvent message
+_ID: Final[int] = 1
+_SOURCE: Final[int] = 2
+_SPEC_VERSION: Final[int] = 3
+_TYPE: Final[int] = 4
+_ATTRIBUTES: Final[int] = 5
+_BINARY_DATA: Final[int] = 6
+_TEXT_DATA: Final[int] = 7
+_PROTO_DATA: Final[int] = 8
+
+# Fields of the CloudEventAttributeValue message
+_CE_BOOLEAN: Final[int] = 1
+_CE_INTEGER: Final[int] = 2
+_CE_STRING: Final[int] = 3
+_CE_BYTES: Final[int] = 4
+_CE_URI: Final[int] = 5
+_CE_URI_REF: Final[int] = 6
+_CE_TIMESTAMP: Final[int] = 7
+
+# The required attributes, which have their own fields instead of map entries
+_REQUIRED_FIELDS: Final[dict[str, int]] = {
+    "id": _ID,
+    "source": _SOURCE,
+    "specversion": _SPEC_VERSION,
+    "type": _TYPE,
+}
+_REQUIRED_ATTRIBUTES: Final[dict[int, str]] = {
+    field: name for name, field in _REQUIRED_FIELDS.items()
+}
+# String attributes written as ce_uri instead of ce_string
+_URI_ATTRIBUTES: Final[frozenset[str]] = frozenset({"dataschema", "schemaurl"})
+_DATA_FIELDS: Final[frozenset[int]] = frozenset({_BINARY_DATA, _TEXT_DATA, _PROTO_DATA})
+
+_INT32_MIN: Final[int] = -(2**31)
+_INT32_MAX: Final[int] = 2**31 - 1
+_UINT64_MASK: Final[int] = 2**64 - 1
+_EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _tag(field: int, wire_type: int) -> bytes:
+    return bytes([field << 3 | wire_type])
+
+
+_REQUIRED_TAGS: Final[dict[str, bytes]] = {
+    name: _tag(field, _LENGTH_DELIMITED) for name, field in _REQUIRED_FIELDS.items()
+}
+_ENTRY_TAG: Final[bytes] = _tag(_ATTRIBUTES, _LENGTH_DELIMITED)
+_KEY_TAG: Final[bytes] = _tag(1, _LENGTH_DELIMITED)
+_VALUE_TAG: Final[bytes] = _tag(2, _LENGTH_DELIMITED)
+_BINARY_DATA_TAG: Final[bytes] = _tag(_BINARY_DATA, _LENGTH_DELIMITED)
+_TEXT_DATA_TAG: Final[bytes] = _tag(_TEXT_DATA, _LENGTH_DELIMITED)
+_EVENTS_TAG: Final[bytes] = _tag(1, _LENGTH_DELIMITED)
+
+# Maximum number of encoded string attributes kept by _encode_attribute()
+_ENTRY_CACHE_SIZE: Final[int] = 256
+
+_entry_cache: dict[tuple[str, str], bytes] = {}
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    # Negative numbers are written as 64-bit two's complement
+    if 0 <= value < 0x80:
+        buffer.append(value)
+        return
+    value &= _UINT64_MASK
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_bytes(buffer: bytearray, tag: bytes, value: ReadableBuffer) -> None:
+    buffer += tag
+    _write_varint(buffer, len(value))
+    buffer += value
+
+
+def _write_timestamp(buffer: bytearray, value: datetime) -> None:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    seconds = delta.days * 86400 + delta.seconds
+    nanos = delta.microseconds * 1000
+    if seconds:
+        buffer.append(1 << 3 | _VARINT)
+        _write_varint(buffer, seconds)
+    if nanos:
+        buffer.append(2 << 3 | _VARINT)
+        _write_varint(buffer, nanos)
+
+
+def _write_attribute_value(buffer: bytearray, name: str, value: Any) -> None:
+    """
+    Write an attribute value as a ``CloudEventAttributeValue`` message.
+
+    :param buffer: The buffer to append the message to
+    :param name: The name of the attribute
+    :param value: The value of the attribute
+    :raises ValueError: If the value cannot be represented
+    """
+    if isinstance(value, bool):
+        buffer.append(_CE_BOOLEAN << 3 | _VARINT)
+        buffer.append(int(value))
+    elif isinstance(value, int):
+        if not _INT32_MIN <= value <= _INT32_MAX:
+            raise ValueError(f"Attribute '{name}' is out of the range of an integer")
+        buffer.append(_CE_INTEGER << 3 | _VARINT)
+        _write_varint(buffer, value)
+    elif isinstance(value, str):
+        field = _CE_URI if name in _URI_ATTRIBUTES else _CE_STRING
+        _write_bytes(buffer, _tag(field, _LENGTH_DELIMITED), value.encode("utf-8"))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _write_bytes(buffer, _tag(_CE_BYTES, _LENGTH_DELIMITED), value)
+    elif isinstance(value, datetime):
+        timestamp = bytearray()
+        _write_timestamp(timestamp, value)
+        _write_bytes(buffer, _tag(_CE_TIMESTAMP, _LENGTH_DELIMITED), timestamp)
+    else:
+        raise ValueError(
+            f"Attribute '{name}' of type {type(value).__name__} cannot be written "
+            "in the protobuf format"
+        )
+
+
+def _encode_attribute(name: str, value: Any) -> bytes:
+    """
+    Encode an attribute as an entry of the ``attributes`` map, including its tag.
+
+    String attributes, such as a ``source`` or ``datacontenttype`` shared by many
+    events, are cached.
+
+    :param name: The name of the attribute
+    :param value: The value of the attribute
+    :return: The encoded map entry
+    :raises ValueError: If the value cannot be represented
+    """
+    is_string = type(value) is str
+    if is_string:
+        cached = _entry_cache.get((name, value))
+        if cached is not None:
+            return cached
+
+    attribute_value = bytearray()
+    _write_attribute_value(attribute_value, name, value)
+    entry = bytearray()
+    _write_bytes(entry, _KEY_TAG, name.encode("utf-8"))
+    _write_bytes(entry, _VALUE_TAG, attribute_value)
+    encoded = bytearray()
+    _write_bytes(encoded, _ENTRY_TAG, entry)
+
+    result = bytes(encoded)
+    if is_string:
+        if len(_entry_cache) >= _ENTRY_CACHE_SIZE:
+            _entry_cache.clear()
+        _entry_cache[name, value] = result
+    return result
+
+
+def _read_varint(data: memoryview, pos: int) -> tuple[int, int]:
+    try:
+        value = data[pos]
+    except IndexError:
+        raise ValueError("Truncated protobuf message") from None
+    if value < 0x80:
+        return value, pos + 1
+
+    value = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[pos]
+        except IndexError:
+            raise ValueError("Truncated protobuf message") from None
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Invalid varint in protobuf message")
+
+
+def _to_signed(value: int) -> int:
+    return value - 2**64 if value >= 2**63 else value
+
+
+def _skip_value(data: memoryview, pos: int, wire_type: int) -> int:
+    """
+    Skip the value of a field that is not length-delimited.
+
+    :return: The position after the value
+    :raises ValueError: If the wire type is not supported
+    """
+    if wire_type == _VARINT:
+        return _read_varint(data, pos)[1]
+    if wire_type == _FIXED64:
+        return pos + 8
+    if wire_type == _FIXED32:
+        return pos + 4
+    raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+
+
+def _iter_fields(
+    data: memoryview, pos: int, end: int
+) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Iterate over the fields of an encoded message.
+
+    :param data: The buffer holding the message
+    :param pos: The position of the first field
+    :param end: The position after the last field
+    :return: An iterator over the field number and wire type of every field, with
+        the value of varint fields followed by -1, or the start and end of the
+        payload of length-delimited fields
+    :raises ValueError: If the message is truncated or malformed
+    """
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == _VARINT:
+            value, pos = _read_varint(data, pos)
+            if pos > end:
+                raise ValueError("Truncated protobuf message")
+            yield field, wire_type, value, -1
+            continue
+        if wire_type == _LENGTH_DELIMITED:
+            length, pos = _read_varint(data, pos)
+            start, pos = pos, pos + length
+        elif wire_type == _FIXED64:
+            start, pos = pos, pos + 8
+        elif wire_type == _FIXED32:
+            start, pos = pos, pos + 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        if pos > end:
+            raise ValueError("Truncated protobuf message")
+        yield field, wire_type, start, pos
+
+
+def _read_string(data: memoryview, start: int, end: int) -> str:
+    return str(data[start:end], "utf-8")
+
+
+def _read_timestamp(data: memoryview, start: int, end: int) -> datetime:
+    seconds = nanos = 0
+    for field, wire_type, value, _ in _iter_fields(data, start, end):
+        if wire_type != _VARINT:
+            continue
+        if field == 1:
+            seconds = _to_signed(value)
+        elif field == 2:
+            nanos = _to_signed(value)
+    # Nanoseconds beyond microsecond precision are truncated
+    return _EPOCH + timedelta(seconds=seconds, microseconds=nanos // 1000)
+
+
+def _read_attribute_value(data: memoryview, start: int, end: int) -> Any:
+    # Fast path for a string value shorter than 128 bytes, the common case
+    if end - start >= 2 and data[start] == _CE_STRING << 3 | _LENGTH_DELIMITED:
+        length = data[start + 1]
+        if length < 0x80 and start + 2 + length == end:
+            return _read_string(data, start + 2, end)
+
+    value: Any = None
+    for field, wire_type, first, last in _iter_fields(data, start, end):
+        if field == _CE_BOOLEAN and wire_type == _VARINT:
+            value = bool(first)
+        elif field == _CE_INTEGER and wire_type == _VARINT:
+            # int32 values are sign-extended to 64 bits
+            value = _to_signed(first)
+        elif field in (_CE_STRING, _CE_URI, _CE_URI_REF) and wire_type != _VARINT:
+            value = _read_string(data, first, last)
+        elif field == _CE_BYTES and wire_type != _VARINT:
+            value = bytes(data[first:last])
+        elif field == _CE_TIMESTAMP and wire_type != _VARINT:
+            value = _read_timestamp(data, first, last)
+    return value
+
+
+def _read_attribute_entry(data: memoryview, start: int, end: int) -> tuple[str, Any]:
+    # Fast path for the key followed by the value, both shorter than 128 bytes
+    if end - start >= 4 and data[start] == _KEY_TAG[0]:
+        key_length = data[start + 1]
+        key_end = start + 2 + key_length
+        if (
+            key_length < 0x80
+            and key_end + 2 <= end
+            and data[key_end] == _VALUE_TAG[0]
+            and data[key_end + 1] < 0x80
+            and key_end + 2 + data[key_end + 1] == end
+        ):
+            name = _read_string(data, start + 2, key_end)
+            return name, _read_attribute_value(data, key_end + 2, end)
+
+    name = ""
+    value: Any = None
+    for field, wire_type, first, last in _iter_fields(data, start, end):
+        if wire_type != _LENGTH_DELIMITED:
+            continue
+        if field == 1:
+            name = _read_string(data, first, last)
+        elif field == 2:
+            value = _read_attribute_value(data, first, last)
+    return name, value
+
+
+def _as_view(data: str | ReadableBuffer) -> memoryview:
+    if isinstance(data, str):
+        raise ValueError("A protobuf formatted event must be bytes")
+    return memoryview(data).cast("B")
+
+
+class ProtobufFormat(BinaryFormat, BatchFormat):
+    """
+    The Protobuf event format, see the module documentation for the messages.
+
+    The ``time`` attribute and ``datetime`` extensions are written as timestamps,
+    booleans, integers and bytes keep their type, and ``dataschema`` is written as
+    a URI. Binary data is written as ``binary_data``, any other data as
+    ``text_data``, with dictionaries encoded as JSON. On reading, ``text_data`` is
+    decoded as JSON if the ``datacontenttype`` is a JSON type, or if there is no
+    ``datacontenttype`` and it holds a JSON object or array, and the value of
+    ``proto_data`` is returned as bytes.
+    """
+
+    CONTENT_TYPE: Final[str] = "application/cloudevents+protobuf"
+    BATCH_CONTENT_TYPE: Final[str] = "application/cloudevents-batch+protobuf"
+
+    def read(
+        self,
+        event_factory: EventFactory | None,
+        data: str | ReadableBuffer,
+    ) -> BaseCloudEvent:
+        """
+        Read a CloudEvent from a protobuf formatted byte string.
+
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, automatically detects version from 'spec_version' field.
+        :param data: The protobuf formatted byte array.
+        :return: The CloudEvent instance.
+        :raises ValueError: If the data is not a valid protobuf CloudEvent message.
+        """
+        view = _as_view(data)
+        return self._read_event(event_factory, view, 0, len(view))
+
+    def read_batch(
+        self,
+        event_factory: EventFactory | None,
+        data: str | ReadableBuffer,
+    ) -> list[BaseCloudEvent]:
+        """
+        Read CloudEvents from a protobuf ``CloudEventBatch`` message.
+
+        :param event_factory: A factory function to create CloudEvent instances.
+                             If None, the version of every event is detected separately.
+        :param data: The protobuf batch formatted byte array.
+        :return: The CloudEvent instances, in the order of the batch.
+        :raises ValueError: If the data is not a valid protobuf batch message.
+        """
+        view = _as_view(data)
+        return [
+            self._read_event(event_factory, view, start, end)
+            for field, wire_type, start, end in _iter_fields(view, 0, len(view))
+            if field == 1 and wire_type == _LENGTH_DELIMITED
+        ]
+
+    def peek_attributes(self, data: str | ReadableBuffer) -> dict[str, Any]:
+        """
+        Read only the context attributes of a protobuf formatted event.
+
+        The data fields are skipped without being copied, and no event is created
+        or validated.
+
+        :param data: The protobuf formatted byte array.
+        :return: The attributes of the event.
+        :raises ValueError: If the data is not a valid protobuf CloudEvent message.
+        """
+        view = _as_view(data)
+        attributes, _ = self._read_fields(view, 0, len(view), peek=True)
+        return attributes
+
+    def _read_fields(
+        self, data: memoryview, start: int, end: int, peek: bool = False
+    ) -> tuple[dict[str, Any], tuple[int, int, int] | None]:
+        """
+        Read the fields of a ``CloudEvent`` message.
+
+        :return: The attributes, and the field number, start and end of the data
+            field if there is one
+        """
+        attributes: dict[str, Any] = {}
+        data_field: tuple[int, int, int] | None = None
+        # Same as iterating over _iter_fields(), inlined as this is the hot loop
+        pos = start
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            if key & 0x07 != _LENGTH_DELIMITED:
+                pos = _skip_value(data, pos, key & 0x07)
+                continue
+            length, first = _read_varint(data, pos)
+            last = pos = first + length
+            if pos > end:
+                raise ValueError("Truncated protobuf message")
+            field = key >> 3
+            if field in _REQUIRED_ATTRIBUTES:
+                attributes[_REQUIRED_ATTRIBUTES[field]] = _read_string(
+                    data, first, last
+                )
+            elif field == _ATTRIBUTES:
+                name, value = _read_attribute_entry(data, first, last)
+                attributes[name] = value
+            elif field in _DATA_FIELDS and not peek:
+                data_field = (field, first, last)
+        if pos > end:
+            raise ValueError("Truncated protobuf message")
+        return attributes, data_field
+
+    def _read_event(
+        self,
+        event_factory: EventFactory | None,
+        data: memoryview,
+        start: int,
+        end: int,
+    ) -> BaseCloudEvent:
+        attributes, data_field = self._read_fields(data, start, end)
+
+        # Auto-detect version if factory not provided
+        if event_factory is None:
+            from cloudevents.core.bindings.common import get_event_factory_for_version
+
+            specversion = attributes.get("specversion", SPECVERSION_V1_0)
+            event_factory = get_event_factory_for_version(specversion)
+
+        event_data: dict[str, Any] | str | bytes | None = None
+        if data_field is not None:
+            field, first, last = data_field
+            if field == _BINARY_DATA:
+                event_data = bytes(data[first:last])
+            elif field == _TEXT_DATA:
+                event_data = self._read_text_data(
+                    data[first:last], attributes.get("datacontenttype")
+                )
+            else:
+                # google.protobuf.Any, the value is the packed message
+                for any_field, wire_type, value_start, value_end in _iter_fields(
+                    data, first, last
+                ):
+                    if any_field == 2 and wire_type == _LENGTH_DELIMITED:
+                        event_data = bytes(data[value_start:value_end])
+
+        return event_factory(attributes, event_data)
+
+    def _read_text_data(
+        self, text: memoryview, datacontenttype: str | None
+    ) -> dict[str, Any] | str:
+        if datacontenttype is None or parse_content_type(datacontenttype).is_json:
+            try:
+                parsed: dict[str, Any] = self._backend.loads(text)
+            except ValueError:
+                # If JSON parsing fails, return the text
+                pass
+            else:
+                # Without a datacontenttype only data other than text is written
+                # as JSON, text that happens to be a JSON scalar stays text
+                if datacontenttype is not None or isinstance(parsed, (dict, list)):
+                    return parsed
+        return str(text, "utf-8")
+
+    def _write(self, event: BaseCloudEvent) -> bytes:
+        buffer = bytearray()
+        for name, value in get_encoded_attributes(event).items():
+            tag = _REQUIRED_TAGS.get(name)
+            if tag is not None:
+                _write_bytes(buffer, tag, str(value).encode("utf-8"))
+                continue
+            if name == "time":
+                # The time may still be the original string of a lazily read event
+                value = event.get_time()
+            buffer += _encode_attribute(name, value)
+
+        event_data = event.get_data()
+        if event_data is None:
+            pass
+        elif isinstance(event_data, RawJSON):
+            _write_bytes(buffer, _TEXT_DATA_TAG, event_data)
+        elif isinstance(event_data, (bytes, bytearray, memoryview)):
+            _write_bytes(buffer, _BINARY_DATA_TAG, event_data)
+        elif isinstance(event_data, str):
+            _write_bytes(buffer, _TEXT_DATA_TAG, event_data.encode("utf-8"))
+        else:
+            datacontenttype = event.get_datacontenttype() or "application/json"
+            if parse_content_type(datacontenttype).is_json:
+                text = self._backend.dumps(event_data)
+            else:
+                text = str(event_data).encode("utf-8")
+            _write_bytes(buffer, _TEXT_DATA_TAG, text)
+        return bytes(buffer)
+
+    def write_batch(self, events: Iterable[BaseCloudEvent]) -> bytes:
+        """
+        Write CloudEvents to a protobuf ``CloudEventBatch`` message.
+
+        :param events: The CloudEvents to write.
+        :return: The CloudEvents as a protobuf batch formatted byte array.
+        """
+        buffer = bytearray()
+        self.write_batch_into(events, buffer)
+        return bytes(buffer)
+
+    def write_batch_into(
+        self, events: Iterable[BaseCloudEvent], buffer: WritableBuffer
+    ) -> int:
+        """
+        Write CloudEvents as a protobuf batch to the end of a buffer.
+
+        Every event is encoded and appended on its own, so frozen events reuse
+        their cached encoding.
+
+        :param events: The CloudEvents to write.
+        :param buffer: A ``bytearray`` to extend, or a binary stream to write to.
+        :return: The number of bytes written.
+        """
+        written = 0
+        prefix = bytearray()
+        for event in events:
+            encoded = self.write(event)
+            # The events are embedded messages, prefixed with their length
+            prefix[:] = _EVENTS_TAG
+            _write_varint(prefix, len(encoded))
+            written += append_to_buffer(buffer, prefix)
+            written += append_to_buffer(buffer, encoded)
+        return written
+
+    def get_content_type(self) -> str:
+        """
+        Get the Content-Type header value for structured mode.
+
+        :return: Content type string for CloudEvents structured content mode
+        """
+        return self.CONTENT_TYPE
+
+    def get_batch_content_type(self) -> str:
+        """
+        Get the Content-Type header value for batched mode.
+
+        :return: Content type string for CloudEvents batched content mode
+        """
+        return self.BATCH_CONTENT_TYPE
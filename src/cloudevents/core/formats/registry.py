@@ -0,0 +1,144 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+"""
+Lookup of event formats by the media type of structured and batched content mode
+messages.
+"""
+
+from typing import Iterable, cast
+
+from cloudevents.core.formats.base import BatchFormat, Format
+from cloudevents.core.formats.content_type import parse_content_type
+
+
+class FormatRegistry:
+    """
+    Maps the media types of structured and batched content mode, e.g.
+    ``application/cloudevents+json``, to the formats that read them.
+
+    Lookups ignore case and parameters such as ``charset``. The media types are
+    normalized once when a format is registered and parsed content types are
+    memoized, so a lookup is two dict accesses.
+
+    Example:
+        >>> registry = FormatRegistry([JSONFormat(), ProtobufFormat()])
+        >>> event = from_http(message, registry)
+    """
+
+    def __init__(
+        self, formats: Iterable[Format] = (), default: Format | None = None
+    ) -> None:
+        """
+        :param formats: The formats to register, see ``register()``
+        :param default: The format for binary content mode data and for messages
+            without a registered media type. Defaults to the first registered
+            format.
+        """
+        self._formats: dict[str, Format] = {}
+        self._batch_formats: dict[str, BatchFormat] = {}
+        self._default = default
+        for event_format in formats:
+            self.register(event_format)
+
+    def register(self, event_format: Format) -> None:
+        """
+        Register a format for its structured media type and, if it is a
+        ``BatchFormat``, for its batch media type. A format registered later for
+        the same media type replaces the earlier one.
+
+        :param event_format: The format to register
+        """
+        if self._default is None:
+            self._default = event_format
+        essence = parse_content_type(event_format.get_content_type()).essence
+        self._formats[essence] = event_format
+        if callable(getattr(event_format, "get_batch_content_type", None)):
+            batch_format = cast(BatchFormat, event_format)
+            batch_essence = parse_content_type(
+                batch_format.get_batch_content_type()
+            ).essence
+            self._batch_formats[batch_essence] = batch_format
+
+    @property
+    def default(self) -> Format:
+        """
+        The format for binary content mode data and unregistered media types.
+
+        :raises ValueError: If no format is registered
+        """
+        if self._default is None:
+            raise ValueError("No event format is registered")
+        return self._default
+
+    def get(self, content_type: str | None) -> Format | None:
+        """
+        Get the format of a structured content mode media type.
+
+        :param content_type: A content type, e.g. from a ``Content-Type`` header
+        :return: The registered format, or None
+        """
+        if not content_type:
+            return None
+        return self._formats.get(parse_content_type(content_type).essence)
+
+    def get_batch(self, content_type: str | None) -> BatchFormat | None:
+        """
+        Get the format of a batched content mode media type.
+
+        :param content_type: A content type, e.g. from a ``Content-Type`` header
+        :return: The registered format, or None
+        """
+        if not content_type:
+            return None
+        return self._batch_formats.get(parse_content_type(content_type).essence)
+
+
+_default_registry: FormatRegistry | None = None
+
+
+def get_default_registry() -> FormatRegistry:
+    """
+    Get the shared registry of the built-in formats.
+
+    It holds ``JSONFormat`` as the default, ``ProtobufFormat``, ``AvroFormat``,
+    and ``CBORFormat`` and ``MessagePackFormat`` when their packages are
+    installed. Pass it to the binding ``from_*`` functions to read structured
+    messages of any built-in format; a single format given to them is never
+    replaced by another one.
+
+    :return: The registry
+    """
+    global _default_registry
+    if _default_registry is None:
+        from cloudevents.core.formats.avro import AvroFormat
+        from cloudevents.core.formats.json import JSONFormat
+        from cloudevents.core.formats.protobuf import ProtobufFormat
+
+        registry = FormatRegistry([JSONFormat(), ProtobufFormat(), AvroFormat()])
+        try:
+            from cloudevents.core.formats.cbor import CBORFormat
+
+            registry.register(CBORFormat())
+        except ImportError:
+            pass
+        try:
+            from cloudevents.core.formats.msgpack import MessagePackFormat
+
+            registry.register(MessagePackFormat())
+        except ImportError:
+            pass
+        _default_registry = registry
+    return _default_registry
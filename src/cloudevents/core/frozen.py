@@ -0,0 +1,215 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Support for immutable CloudEvents.
+
+Frozen events hold their data as read-only containers, so their wire encodings
+can be computed once and reused. Formats and bindings use ``encode_cached()`` to
+serialize an event, which only caches the result for frozen events.
+"""
+
+from collections.abc import Callable, Hashable
+from typing import Any, Final, NoReturn
+
+from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.lazy import LazyData
+
+# Number of encodings a frozen event keeps, one per format/binding in practice
+_ENCODING_CACHE_LIMIT: Final[int] = 8
+
+
+class FrozenDict(dict[str, Any]):
+    """
+    Read-only ``dict`` used for the data of frozen events.
+
+    It compares equal to a regular ``dict`` with the same items and is serialized
+    like one, but any attempt to modify it raises a ``TypeError``.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (dict(self),)
+
+
+class FrozenList(list[Any]):
+    """
+    Read-only ``list`` used for arrays in the data of frozen events.
+
+    It compares equal to a regular ``list`` with the same items and is serialized
+    like one, but any attempt to modify it raises a ``TypeError``.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (list(self),)
+
+
+def freeze_data(data: Any) -> Any:
+    """
+    Convert event data into its read-only form.
+
+    Dictionaries and lists are copied recursively into ``FrozenDict`` and
+    ``FrozenList``, ``bytearray`` into ``bytes``. Other values, including data
+    that is frozen already, are returned as-is.
+
+    :param data: The event data
+    :return: The read-only event data
+    """
+    if isinstance(data, (FrozenDict, FrozenList)):
+        return data
+    if isinstance(data, dict):
+        return FrozenDict({key: freeze_data(value) for key, value in data.items()})
+    if isinstance(data, (list, tuple)):
+        return FrozenList(freeze_data(value) for value in data)
+    if isinstance(data, bytearray):
+        return bytes(data)
+    return data
+
+
+class FrozenEventMixin:
+    """
+    Mixin turning a core CloudEvent class into an immutable variant.
+
+    The data is frozen on construction, the hash is computed once and the wire
+    encodings produced through ``encode_cached()`` are kept on the event. Classes
+    using it must declare the ``_hash`` and ``_encodings`` slots.
+    """
+
+    __slots__ = ()
+
+    _data: dict[str, Any] | str | bytes | LazyData | None
+    _hash: int | None
+    _encodings: dict[Hashable, bytes] | None
+
+    def _set_attributes(self, attributes: dict[str, Any], data: Any) -> None:
+        super()._set_attributes(attributes, freeze_data(data))  # type: ignore[misc]
+        # The slots are declared by the concrete event classes
+        self._hash = None  # type: ignore[misc]
+        self._encodings = None  # type: ignore[misc]
+
+    def evolve(self, *args: Any, **kwargs: Any) -> Any:
+        event = super().evolve(*args, **kwargs)  # type: ignore[misc]
+        event._data = freeze_data(event._data)
+        event._hash = None
+        event._encodings = None
+        return event
+
+    def get_data(self) -> dict[str, Any] | str | bytes | None:
+        data = self._data
+        if isinstance(data, LazyData):
+            data = self._data = freeze_data(data.decode())  # type: ignore[misc]
+        return data
+
+    def _key(self) -> tuple[Any, ...]:
+        event: Any = self
+        # Parse a lazy time first, so that the key does not depend on whether
+        # the time has been read already. The attributes are compared as a set,
+        # so that the order in which the extensions were set does not matter
+        event.get_time()
+        return frozenset(event.get_attributes().items()), self.get_data()
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())  # type: ignore[misc]
+        return self._hash
+
+    def _encode_cached(self, key: Hashable, encode: Callable[[], bytes]) -> bytes:
+        encodings = self._encodings
+        if encodings is None:
+            encodings = self._encodings = {}  # type: ignore[misc]
+        else:
+            encoded = encodings.get(key)
+            if encoded is not None:
+                return encoded
+            if len(encodings) >= _ENCODING_CACHE_LIMIT:
+                del encodings[next(iter(encodings))]
+        encoded = encodings[key] = encode()
+        return encoded
+
+
+class FormatKeyMixin:
+    """
+    Mixin comparing format instances by ``_key()``.
+
+    Formats are part of the keys of the encodings cached on frozen events.
+    Instances with the same key are interchangeable, so frozen events can reuse
+    an encoding produced by another instance.
+    """
+
+    def _key(self) -> tuple[Hashable, ...]:
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other._key() == self._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+
+def encode_cached(
+    event: BaseCloudEvent, key: Hashable, encode: Callable[[], bytes]
+) -> bytes:
+    """
+    Encode an event, reusing a previous result for frozen events.
+
+    :param event: The event to encode
+    :param key: Identifies the encoding, e.g. the format and the content mode
+    :param encode: Produces the encoded bytes when they are not cached
+    :return: The encoded event
+    """
+    if isinstance(event, FrozenEventMixin):
+        return event._encode_cached(key, encode)
+    return encode()
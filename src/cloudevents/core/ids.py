@@ -0,0 +1,236 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Event ID generation.
+
+CloudEvent classes call ``generate_id()`` when an event is created without an
+``id``. The generator behind it can be replaced with ``set_id_generator()``.
+"""
+
+import os
+import threading
+import time
+import uuid
+import weakref
+from typing import Final, Protocol
+
+# Random bytes read from the OS at once by UUID7IdGenerator
+_RANDOM_BLOCK_SIZE: Final[int] = 4096
+# UUIDv7 keeps 74 random bits per ID: 12 bits of rand_a and 62 bits of rand_b
+_RANDOM_BITS: Final[int] = 74
+_RAND_B_BITS: Final[int] = 62
+_RAND_B_MASK: Final[int] = (1 << _RAND_B_BITS) - 1
+# The random counter is seeded with its top bit cleared, so at least 2^73
+# increments fit into a single millisecond before it overflows
+_COUNTER_SEED_MASK: Final[int] = (1 << (_RANDOM_BITS - 1)) - 1
+_COUNTER_MAX: Final[int] = (1 << _RANDOM_BITS) - 1
+_VERSION_VARIANT_MASK: Final[int] = (0xF << 76) | (0x3 << 62)
+_VERSION_4_BITS: Final[int] = 0x4 << 76
+_VERSION_7_BITS: Final[int] = 0x7 << 76
+_VARIANT_BITS: Final[int] = 0x2 << 62
+
+
+class IdGenerator(Protocol):
+    """
+    Protocol for event ID generators.
+    """
+
+    def generate_id(self) -> str:
+        """
+        Generate a new event ID.
+
+        :return: A unique event ID
+        """
+        ...
+
+    def generate(self, n: int) -> list[str]:
+        """
+        Generate several event IDs at once.
+
+        :param n: The number of IDs to generate
+        :return: A list of ``n`` unique event IDs
+        """
+        ...
+
+
+def _format_uuid(value: int) -> str:
+    """
+    Format a 128-bit integer in the canonical 8-4-4-4-12 UUID form.
+
+    :param value: The UUID as an integer
+    :return: The lowercase hex representation of the UUID
+    """
+    h = value.to_bytes(16, "big").hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class UUID4IdGenerator:
+    """
+    Generates random (version 4) UUIDs. This is the default generator.
+    """
+
+    def generate_id(self) -> str:
+        """
+        Generate a new random UUID.
+
+        :return: The UUID in its canonical string form
+        """
+        return str(uuid.uuid4())
+
+    def generate(self, n: int) -> list[str]:
+        """
+        Generate ``n`` random UUIDs, reading the randomness for all of them at once.
+
+        :param n: The number of IDs to generate
+        :return: A list of ``n`` UUIDs in their canonical string form
+        """
+        random = os.urandom(16 * n)
+        return [
+            _format_uuid(
+                (int.from_bytes(random[i : i + 16], "big") & ~_VERSION_VARIANT_MASK)
+                | _VERSION_4_BITS
+                | _VARIANT_BITS
+            )
+            for i in range(0, 16 * n, 16)
+        ]
+
+
+class UUID7IdGenerator:
+    """
+    Generates monotonic, time-ordered (version 7) UUIDs as described in RFC 9562.
+
+    Each ID starts with the Unix timestamp in milliseconds, so IDs sort by their
+    creation time. Within the same millisecond the 74 random bits are used as a
+    counter that is seeded randomly and incremented for every following ID, which
+    keeps the IDs strictly increasing even if the system clock moves backwards.
+    Random bytes are read from the OS in blocks and shared by many IDs.
+
+    Instances are thread-safe, and are reseeded in child processes after a fork.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+        _UUID7_GENERATORS.add(self)
+
+    def _reset(self) -> None:
+        self._last_ms = 0
+        self._counter = 0
+        self._random = b""
+        self._random_offset = 0
+
+    def _next_counter_seed(self) -> int:
+        offset = self._random_offset
+        if offset + 10 > len(self._random):
+            self._random = os.urandom(_RANDOM_BLOCK_SIZE)
+            offset = 0
+        self._random_offset = offset + 10
+        # 80 random bits, keep the upper 73 of them
+        seed = int.from_bytes(self._random[offset : offset + 10], "big") >> (
+            80 - _RANDOM_BITS
+        )
+        return seed & _COUNTER_SEED_MASK
+
+    def _next_value(self, ms: int) -> int:
+        if ms > self._last_ms:
+            self._last_ms = ms
+            self._counter = self._next_counter_seed()
+        else:
+            self._counter += 1
+            if self._counter > _COUNTER_MAX:
+                # Counter exhausted, borrow the next millisecond
+                self._last_ms += 1
+                self._counter = self._next_counter_seed()
+
+        counter = self._counter
+        return (
+            (self._last_ms << 80)
+            | _VERSION_7_BITS
+            | ((counter >> _RAND_B_BITS) << 64)
+            | _VARIANT_BITS
+            | (counter & _RAND_B_MASK)
+        )
+
+    def generate_id(self) -> str:
+        """
+        Generate a new time-ordered UUID.
+
+        :return: The UUID in its canonical string form
+        """
+        ms = time.time_ns() // 1_000_000
+        with self._lock:
+            value = self._next_value(ms)
+        return _format_uuid(value)
+
+    def generate(self, n: int) -> list[str]:
+        """
+        Generate ``n`` time-ordered UUIDs, reading the clock only once.
+
+        :param n: The number of IDs to generate
+        :return: A list of ``n`` increasing UUIDs in their canonical string form
+        """
+        ms = time.time_ns() // 1_000_000
+        with self._lock:
+            values = [self._next_value(ms) for _ in range(n)]
+        return [_format_uuid(value) for value in values]
+
+
+_UUID7_GENERATORS: "weakref.WeakSet[UUID7IdGenerator]" = weakref.WeakSet()
+
+
+def _reset_uuid7_generators_after_fork() -> None:
+    # A child process must not continue the parent's counter and random block,
+    # otherwise both processes would produce the same IDs
+    for generator in _UUID7_GENERATORS:
+        generator._lock = threading.Lock()
+        generator._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid7_generators_after_fork)
+
+
+_id_generator: IdGenerator = UUID4IdGenerator()
+
+
+def get_id_generator() -> IdGenerator:
+    """
+    Get the generator used for default event IDs.
+
+    :return: The current ID generator
+    """
+    return _id_generator
+
+
+def set_id_generator(generator: IdGenerator) -> None:
+    """
+    Set the generator used for default event IDs.
+
+    For example, ``set_id_generator(UUID7IdGenerator())`` makes events created
+    without an ``id`` use time-ordered IDs.
+
+    :param generator: The ID generator to use
+    """
+    global _id_generator
+    _id_generator = generator
+
+
+def generate_id() -> str:
+    """
+    Generate a new event ID with the current ID generator.
+
+    :return: A unique event ID
+    """
+    return _id_generator.generate_id()
@@ -0,0 +1,165 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Deferred decoding support for CloudEvent values.
+
+Values in this module hold the encoded form of an event value as read from the
+wire. Core CloudEvent classes accept them in place of the decoded value and only
+decode them when the value is first accessed.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, cast
+
+from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.formats.base import Format, PeekableFormat
+from cloudevents.core.time import parse_time
+
+
+class LazyData:
+    """
+    Event data kept in its encoded form until it is first accessed.
+
+    Core CloudEvent classes accept an instance of this class as ``data``. The
+    payload is decoded through ``event_format.read_data`` on the first
+    ``get_data()`` call and the result is cached by the event. Until then,
+    protocol bindings forward the original bytes unchanged.
+    """
+
+    __slots__ = ("body", "datacontenttype", "event_format")
+
+    def __init__(
+        self, body: bytes, datacontenttype: str | None, event_format: Format
+    ) -> None:
+        """
+        :param body: The encoded payload as read from the wire.
+        :param datacontenttype: Content type of the payload.
+        :param event_format: Format implementation used to decode the payload.
+        """
+        self.body: bytes = body
+        self.datacontenttype: str | None = datacontenttype
+        self.event_format: Format = event_format
+
+    def decode(self) -> dict[str, Any] | str | bytes | None:
+        """
+        Decode the payload using the format it was read with.
+
+        :return: Deserialized data (dict for JSON, str for text, bytes for binary)
+        """
+        return self.event_format.read_data(self.body, self.datacontenttype)
+
+    def body_for(
+        self, datacontenttype: str | None, event_format: Format
+    ) -> bytes | None:
+        """
+        Get the original payload if it can be forwarded as it is.
+
+        :param datacontenttype: Content type the payload is to be written with.
+        :param event_format: Format implementation the payload is to be written with.
+        :return: The original bytes if neither the content type nor the format
+            differ from those the payload was read with, otherwise None.
+        """
+        if (
+            datacontenttype == self.datacontenttype
+            and event_format == self.event_format
+        ):
+            return self.body
+        return None
+
+
+class LazyTime(str):
+    """
+    RFC 3339 timestamp kept as the original string until it is first accessed.
+
+    Core CloudEvent classes accept an instance of this class as the ``time``
+    attribute and parse it on the first ``get_time()`` call. Being a ``str``,
+    it is written back to the wire as the original string, so a timestamp that
+    is never read is never parsed or formatted.
+    """
+
+    __slots__ = ()
+
+    def parse(self) -> datetime:
+        """
+        Parse the timestamp as RFC 3339.
+
+        :return: The timestamp as a datetime
+        :raises ValueError: If the string is not a valid timestamp
+        """
+        return parse_time(self)
+
+
+def get_encoded_attributes(event: BaseCloudEvent) -> dict[str, Any]:
+    """
+    Get the attributes of an event for encoding it.
+
+    Events that keep a ``time`` attribute unparsed, the core CloudEvent classes
+    and ``EventBatch`` views, return it as the original ``LazyTime`` string, so it
+    is written back unchanged. Other events return ``get_attributes()``.
+
+    :param event: The event to encode
+    :return: The attributes of the event
+    """
+    get_attributes = getattr(event, "get_encoded_attributes", event.get_attributes)
+    return get_attributes()
+
+
+def read_attributes(event_format: Format, data: str | bytes) -> dict[str, Any]:
+    """
+    Read only the context attributes of a CloudEvent in a structured format.
+
+    Uses ``peek_attributes()`` of a ``PeekableFormat``. The event is read in full
+    with other formats, and its attributes returned as by
+    ``get_encoded_attributes()``.
+
+    :param event_format: The format of the event
+    :param data: The serialized CloudEvent
+    :return: The attributes of the event
+    :raises ValueError: If the data cannot be parsed
+    """
+    if callable(getattr(event_format, "peek_attributes", None)):
+        return cast(PeekableFormat, event_format).peek_attributes(data)
+    return get_encoded_attributes(event_format.read(None, data))
+
+
+class RawJSON(bytes):
+    """
+    Event data that is already encoded as a UTF-8 JSON value.
+
+    ``JSONFormat.write`` embeds the value verbatim as the ``data`` member of the
+    structured event instead of encoding it as ``data_base64``, and binary content
+    mode bindings send it unchanged as the message body. A ``JSONFormat`` created
+    with ``raw_data=True`` returns the data of the events it reads as instances of
+    this class, so services forwarding events never build or re-encode their
+    payloads.
+
+    Being ``bytes``, the value is accepted as event data everywhere. It is not
+    validated, the caller is responsible for it being a single valid JSON value.
+    """
+
+    __slots__ = ()
+
+    def loads(self) -> Any:
+        """
+        Decode the JSON value.
+
+        :return: The decoded value
+        :raises ValueError: If the value is not valid JSON
+        """
+        return json.loads(self)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({bytes.__repr__(self)})"
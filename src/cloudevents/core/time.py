@@ -0,0 +1,158 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+RFC 3339 timestamp codec for the ``time`` attribute.
+
+Formats and protocol bindings use ``parse_time()`` and ``format_time()`` to read
+and write timestamps, so every wire representation of an event uses the same
+rules: UTC is written with a ``Z`` suffix, and only timestamps that are valid
+RFC 3339 ``date-time`` values are accepted.
+"""
+
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Final
+
+# Maximum number of parsed timestamps kept by parse_time()
+_PARSE_CACHE_SIZE: Final[int] = 256
+
+# The common UTC shapes with no, millisecond or microsecond precision, which
+# datetime.fromisoformat() parses natively
+_UTC_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3}|\.\d{6})?Z", re.ASCII
+)
+_RFC3339_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(?:([Zz])|([+-])(\d{2}):(\d{2}))",
+    re.ASCII,
+)
+# The syntax of RFC 3339 date-time values, with the field ranges that can be
+# checked without knowing the month
+_VALID_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])[Tt ]"
+    r"(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d+)?"
+    r"(?:[Zz]|[+-](?:[01]\d|2[0-3]):[0-5]\d)",
+    re.ASCII,
+)
+# datetime.fromisoformat() only accepts the 'Z' suffix since Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z: Final[bool] = sys.version_info >= (3, 11)
+
+_parse_cache: dict[str, datetime] = {}
+_last_formatted: tuple[datetime | None, str] = (None, "")
+
+
+def _parse_utc(value: str) -> datetime:
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+
+
+def _parse_rfc3339(value: str) -> datetime:
+    match = _RFC3339_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid RFC 3339 timestamp: {value!r}")
+
+    year, month, day, hour, minute, second, fraction, utc, sign, hours, minutes = (
+        match.groups()
+    )
+    tzinfo = timezone.utc
+    if utc is None:
+        if int(hours) > 23 or int(minutes) > 59:
+            raise ValueError(f"Invalid RFC 3339 timestamp: {value!r}")
+        offset = timedelta(hours=int(hours), minutes=int(minutes))
+        # An offset of -00:00 means the local offset is unknown, the time is UTC
+        if offset:
+            tzinfo = timezone(-offset if sign == "-" else offset)
+
+    # Digits beyond microsecond precision are truncated
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        microsecond,
+        tzinfo=tzinfo,
+    )
+
+
+def parse_time(value: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp.
+
+    Timestamps in UTC with a ``Z`` suffix and no, millisecond or microsecond
+    precision take a fast path. Recently parsed timestamps are cached, so events
+    of a batch sharing a timestamp only parse it once.
+
+    :param value: The timestamp, e.g. ``2023-10-25T17:09:19.736166Z``
+    :return: The timestamp as a timezone-aware datetime
+    :raises ValueError: If the value is not a valid RFC 3339 timestamp
+    """
+    parsed = _parse_cache.get(value)
+    if parsed is not None:
+        return parsed
+
+    if _UTC_PATTERN.fullmatch(value):
+        parsed = _parse_utc(value)
+    else:
+        parsed = _parse_rfc3339(value)
+
+    if len(_parse_cache) >= _PARSE_CACHE_SIZE:
+        _parse_cache.clear()
+    _parse_cache[str(value)] = parsed
+    return parsed
+
+
+def is_valid_time(value: str) -> bool:
+    """
+    Check the syntax of an RFC 3339 timestamp without parsing it.
+
+    The fields must be within their ranges and the UTC offset must be present.
+    A day that does not exist in its month, e.g. February 30, is only rejected
+    by ``parse_time()``.
+
+    :param value: The timestamp, e.g. ``2023-10-25T17:09:19.736166Z``
+    :return: True if the value is a syntactically valid timestamp
+    """
+    return value in _parse_cache or _VALID_PATTERN.fullmatch(value) is not None
+
+
+def format_time(value: datetime) -> str:
+    """
+    Format a datetime as an RFC 3339 timestamp.
+
+    UTC is written with a ``Z`` suffix and fractional seconds are only written
+    when present. Formatting the same datetime instance again, as happens for
+    events stamped by ``batch_time()`` or created by an ``EventBatch``, reuses the
+    previous result.
+
+    :param value: The datetime to format
+    :return: The timestamp, e.g. ``2023-10-25T17:09:19.736166Z``
+    """
+    global _last_formatted
+    last, formatted = _last_formatted
+    if value is last:
+        return formatted
+
+    formatted = value.isoformat()
+    # 'Z' denotes a UTC offset of 00:00 see
+    # https://www.rfc-editor.org/rfc/rfc3339#section-2
+    if formatted.endswith("+00:00"):
+        formatted = formatted[:-6] + "Z"
+    _last_formatted = (value, formatted)
+    return formatted
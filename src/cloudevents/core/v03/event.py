@@ -13,12 +13,12 @@
 #    under the License.
 
 import re
-import uuid
 from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Any, Final
+from datetime import datetime
+from typing import Any, Final, Pattern
 
 from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.clock import current_time
 from cloudevents.core.exceptions import (
     BaseCloudEventException,
     CloudEventValidationError,
@@ -27,7 +27,11 @@ from cloudevents.core.exceptions import (
     InvalidAttributeValueError,
     MissingRequiredAttributeError,
 )
+from cloudevents.core.frozen import FrozenEventMixin
+from cloudevents.core.ids import generate_id
+from cloudevents.core.lazy import LazyData, LazyTime
 from cloudevents.core.spec import SPECVERSION_V0_3
+from cloudevents.core.time import is_valid_time
 
 REQUIRED_ATTRIBUTES: Final[list[str]] = ["id", "source", "type", "specversion"]
 OPTIONAL_ATTRIBUTES: Final[list[str]] = [
@@ -37,6 +41,28 @@ OPTIONAL_ATTRIBUTES: Final[list[str]] = [
     "subject",
     "time",
 ]
+_SPEC_ATTRIBUTES: Final[frozenset[str]] = frozenset(
+    REQUIRED_ATTRIBUTES + OPTIONAL_ATTRIBUTES
+)
+# Attributes whose only constraint is being a non-empty string
+_NON_EMPTY_STRING_ATTRIBUTES: Final[frozenset[str]] = frozenset(
+    (
+        "id",
+        "source",
+        "type",
+        "datacontenttype",
+        "datacontentencoding",
+        "schemaurl",
+        "subject",
+    )
+)
+_EXTENSION_NAME_PATTERN: Final[Pattern[str]] = re.compile(r"^[a-z0-9]+$")
+# Extension names that already passed validation, so that the pattern is only
+# matched the first time a name is seen. Bounded to keep memory in check.
+_KNOWN_EXTENSION_NAMES: Final[set[str]] = set()
+_KNOWN_EXTENSION_NAMES_LIMIT: Final[int] = 1024
+# Marks an argument that was not passed to ``CloudEvent.evolve()``
+_UNSET: Final[Any] = object()
 
 
 class CloudEvent(BaseCloudEvent):
@@ -45,31 +71,201 @@ class CloudEvent(BaseCloudEvent):
 
     This class represents a CloudEvent conforming to the v0.3 specification.
     See https://github.com/cloudevents/spec/blob/v0.3/spec.md for details.
+
+    Spec-defined attributes are stored in dedicated slots, while extension
+    attributes live in a separate mapping that is only created when the event
+    actually carries extensions.
     """
 
+    __slots__ = (
+        "_id",
+        "_source",
+        "_type",
+        "_specversion",
+        "_time",
+        "_datacontenttype",
+        "_datacontentencoding",
+        "_schemaurl",
+        "_subject",
+        "_extensions",
+        "_data",
+    )
+
     def __init__(
         self,
         attributes: dict[str, Any],
-        data: dict[str, Any] | str | bytes | None = None,
+        data: dict[str, Any] | str | bytes | LazyData | None = None,
     ) -> None:
         """
         :param attributes: The attributes of the CloudEvent instance.
             If not provided, ``specversion`` defaults to ``"0.3"``,
-            ``id`` to a UUID4, and ``time`` to the current UTC timestamp.
-        :param data: The payload of the CloudEvent instance.
+            ``id`` to a new ID from ``cloudevents.core.ids.generate_id()`` (a UUID4
+            by default), and ``time`` to
+            ``cloudevents.core.clock.current_time()`` (the current UTC timestamp by
+            default).
+            ``time`` may be given as a ``LazyTime``, which is parsed on the first
+            ``get_time()`` call.
+        :param data: The payload of the CloudEvent instance. A ``LazyData``
+            payload is decoded on the first ``get_data()`` call.
         :raises CloudEventValidationError: If any of the required attributes
             are missing or have invalid values.
         """
+        self._set_default_attributes(attributes)
+        self._validate_attribute(attributes=attributes)
+        self._set_attributes(attributes, data)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        attributes: dict[str, Any],
+        data: dict[str, Any] | str | bytes | LazyData | None = None,
+    ) -> "CloudEvent":
+        """
+        Create a CloudEvent from attributes that have already been validated.
+
+        Default values are applied as in the regular constructor, but none of the
+        specification checks are performed. Use this only for attributes coming
+        from a trusted source, e.g. an upstream that validates every event.
+        Untrusted input is stored as it is: invalid values are not detected and
+        only a missing required attribute is reported.
+
+        This method matches the ``EventFactory`` signature and can be passed to
+        formats and protocol bindings wherever an event factory is expected.
+
+        :param attributes: The attributes of the CloudEvent instance.
+        :param data: The payload of the CloudEvent instance.
+        :return: The CloudEvent instance.
+        :raises CloudEventValidationError: If a required attribute is missing.
+        """
+        event = cls.__new__(cls)
+        event._set_default_attributes(attributes)
+        try:
+            event._set_attributes(attributes, data)
+        except KeyError:
+            raise CloudEventValidationError(
+                {
+                    name: [MissingRequiredAttributeError(attribute_name=name)]
+                    for name in REQUIRED_ATTRIBUTES
+                    if name not in attributes
+                }
+            ) from None
+        return event
+
+    def evolve(
+        self,
+        attributes: dict[str, Any] | None = None,
+        data: Any = _UNSET,
+    ) -> "CloudEvent":
+        """
+        Create a copy of the event with some attributes or the data changed.
+
+        Unchanged attribute values and the data are shared with this event, and
+        only the changed attributes are validated. An attribute set to None is
+        removed from the copy.
+
+        :param attributes: The attributes to add, replace or remove.
+        :param data: The new payload. If not given, the payload of this event is
+            kept, including a ``LazyData`` payload that was not decoded yet.
+        :return: The new CloudEvent instance.
+        :raises CloudEventValidationError: If the changed attributes are invalid
+            or a required attribute is removed.
+        """
+        changes = attributes or {}
+        updates = changes
+        removes_required = False
+        if None in changes.values():
+            updates = {
+                name: value for name, value in changes.items() if value is not None
+            }
+            removes_required = any(
+                changes.get(name, _UNSET) is None for name in REQUIRED_ATTRIBUTES
+            )
+        if removes_required or not CloudEvent._has_valid_values(attributes=updates):
+            # Collect the detailed errors
+            merged = self.get_encoded_attributes()
+            merged.update(updates)
+            for name in changes.keys() - updates.keys():
+                merged.pop(name, None)
+            CloudEvent._validate_attribute(attributes=merged)
+
+        event = type(self).__new__(type(self))
+        event._id = self._id
+        event._source = self._source
+        event._type = self._type
+        event._specversion = self._specversion
+        event._time = self._time
+        event._datacontenttype = self._datacontenttype
+        event._datacontentencoding = self._datacontentencoding
+        event._schemaurl = self._schemaurl
+        event._subject = self._subject
+        extensions = self._extensions
+        for name, value in changes.items():
+            if name in _SPEC_ATTRIBUTES:
+                setattr(event, f"_{name}", value)
+                continue
+            if extensions is None or extensions is self._extensions:
+                # Copied on the first change only, otherwise the mapping is shared
+                extensions = dict(extensions or {})
+            if value is None:
+                extensions.pop(name, None)
+            else:
+                extensions[name] = value
+        event._extensions = extensions or None
+        event._data = self._data if data is _UNSET else data
+        return event
+
+    def __replace__(self, **changes: Any) -> "CloudEvent":
+        """
+        Support for ``copy.replace()``, see ``evolve()``.
+
+        :param changes: The attributes to change, and ``data`` for the payload.
+        :return: The new CloudEvent instance.
+        """
+        data = changes.pop("data", _UNSET)
+        return self.evolve(changes, data)
+
+    @staticmethod
+    def _set_default_attributes(attributes: dict[str, Any]) -> None:
+        """
+        Populates the defaults for the attributes that can be generated.
+
+        :param attributes: The attributes of the CloudEvent instance.
+        """
         if "specversion" not in attributes:
             attributes["specversion"] = SPECVERSION_V0_3
         if "id" not in attributes:
-            attributes["id"] = str(uuid.uuid4())
+            attributes["id"] = generate_id()
         if "time" not in attributes:
-            attributes["time"] = datetime.now(timezone.utc)
+            attributes["time"] = current_time()
 
-        self._validate_attribute(attributes=attributes)
-        self._attributes: dict[str, Any] = attributes
-        self._data: dict[str, Any] | str | bytes | None = data
+    def _set_attributes(
+        self,
+        attributes: dict[str, Any],
+        data: dict[str, Any] | str | bytes | LazyData | None,
+    ) -> None:
+        """
+        Stores the attributes and the payload in the instance slots.
+
+        :param attributes: The attributes of the CloudEvent instance.
+        :param data: The payload of the CloudEvent instance.
+        """
+        self._id: str = attributes["id"]
+        self._source: str = attributes["source"]
+        self._type: str = attributes["type"]
+        self._specversion: str = attributes["specversion"]
+        self._time: datetime | LazyTime | None = attributes.get("time")
+        self._datacontenttype: str | None = attributes.get("datacontenttype")
+        self._datacontentencoding: str | None = attributes.get("datacontentencoding")
+        self._schemaurl: str | None = attributes.get("schemaurl")
+        self._subject: str | None = attributes.get("subject")
+        self._extensions: dict[str, Any] | None = None
+        if not attributes.keys() <= _SPEC_ATTRIBUTES:
+            self._extensions = {
+                key: value
+                for key, value in attributes.items()
+                if key not in _SPEC_ATTRIBUTES
+            }
+        self._data: dict[str, Any] | str | bytes | LazyData | None = data
 
     @staticmethod
     def _validate_attribute(attributes: dict[str, Any]) -> None:
@@ -78,6 +274,10 @@ class CloudEvent(BaseCloudEvent):
 
         See https://github.com/cloudevents/spec/blob/v0.3/spec.md#required-attributes
         """
+        if CloudEvent._is_valid(attributes=attributes):
+            return
+
+        # Slow path, only taken for invalid attributes: collect every error
         errors: dict[str, list[BaseCloudEventException]] = defaultdict(list)
         errors.update(CloudEvent._validate_required_attributes(attributes=attributes))
         errors.update(CloudEvent._validate_optional_attributes(attributes=attributes))
@@ -85,6 +285,57 @@ class CloudEvent(BaseCloudEvent):
         if errors:
             raise CloudEventValidationError(errors=errors)
 
+    @staticmethod
+    def _is_valid(attributes: dict[str, Any]) -> bool:
+        """
+        Checks whether the attributes are valid in a single pass.
+
+        Nothing is allocated here; the detailed errors are collected separately
+        once this check fails.
+
+        :param attributes: The attributes of the CloudEvent instance.
+        :return: True if the attributes are valid, False otherwise.
+        """
+        return (
+            "id" in attributes
+            and "source" in attributes
+            and "type" in attributes
+            and "specversion" in attributes
+            and CloudEvent._has_valid_values(attributes=attributes)
+        )
+
+    @staticmethod
+    def _has_valid_values(attributes: dict[str, Any]) -> bool:
+        """
+        Checks the values and extension names of the given attributes.
+
+        Presence of the required attributes is not checked, so this can also be
+        applied to a subset of the attributes.
+
+        :param attributes: The attributes to check.
+        :return: True if all the given attributes are valid, False otherwise.
+        """
+        for name, value in attributes.items():
+            if name in _NON_EMPTY_STRING_ATTRIBUTES:
+                if not value or not isinstance(value, str):
+                    return False
+            elif name == "time":
+                if isinstance(value, LazyTime):
+                    if not is_valid_time(value):
+                        return False
+                elif not isinstance(value, datetime) or not value.tzinfo:
+                    return False
+            elif name == "specversion":
+                if value != SPECVERSION_V0_3 or not isinstance(value, str):
+                    return False
+            elif name in _KNOWN_EXTENSION_NAMES:
+                continue
+            elif name == "data" or _EXTENSION_NAME_PATTERN.match(name) is None:
+                return False
+            elif len(_KNOWN_EXTENSION_NAMES) < _KNOWN_EXTENSION_NAMES_LIMIT:
+                _KNOWN_EXTENSION_NAMES.add(name)
+        return True
+
     @staticmethod
     def _validate_required_attributes(
         attributes: dict[str, Any],
@@ -172,7 +423,7 @@ class CloudEvent(BaseCloudEvent):
         errors: dict[str, list[BaseCloudEventException]] = defaultdict(list)
 
         if "time" in attributes:
-            if not isinstance(attributes["time"], datetime):
+            if not isinstance(attributes["time"], (datetime, LazyTime)):
                 errors["time"].append(
                     InvalidAttributeTypeError(
                         attribute_name="time", expected_type=datetime
@@ -185,6 +436,15 @@ class CloudEvent(BaseCloudEvent):
                         msg="Attribute 'time' must be timezone aware",
                     )
                 )
+            if isinstance(attributes["time"], LazyTime) and not is_valid_time(
+                attributes["time"]
+            ):
+                errors["time"].append(
+                    InvalidAttributeValueError(
+                        attribute_name="time",
+                        msg="Attribute 'time' must be an RFC 3339 timestamp",
+                    )
+                )
         if "subject" in attributes:
             if not isinstance(attributes["subject"], str):
                 errors["subject"].append(
@@ -255,9 +515,7 @@ class CloudEvent(BaseCloudEvent):
         """
         errors: dict[str, list[BaseCloudEventException]] = defaultdict(list)
         extension_attributes = [
-            key
-            for key in attributes.keys()
-            if key not in REQUIRED_ATTRIBUTES and key not in OPTIONAL_ATTRIBUTES
+            key for key in attributes.keys() if key not in _SPEC_ATTRIBUTES
         ]
         for extension_attribute in extension_attributes:
             if extension_attribute == "data":
@@ -274,7 +532,7 @@ class CloudEvent(BaseCloudEvent):
                         msg=f"Extension attribute name must be at least 1 character long but was '{extension_attribute}'",
                     )
                 )
-            if not re.match(r"^[a-z0-9]+$", extension_attribute):
+            if not _EXTENSION_NAME_PATTERN.match(extension_attribute):
                 errors[extension_attribute].append(
                     CustomExtensionAttributeError(
                         attribute_name=extension_attribute,
@@ -284,19 +542,19 @@ class CloudEvent(BaseCloudEvent):
         return errors
 
     def get_id(self) -> str:
-        return self._attributes["id"]  # type: ignore
+        return self._id
 
     def get_source(self) -> str:
-        return self._attributes["source"]  # type: ignore
+        return self._source
 
     def get_type(self) -> str:
-        return self._attributes["type"]  # type: ignore
+        return self._type
 
     def get_specversion(self) -> str:
-        return self._attributes["specversion"]  # type: ignore
+        return self._specversion
 
     def get_datacontenttype(self) -> str | None:
-        return self._attributes.get("datacontenttype")
+        return self._datacontenttype
 
     def get_dataschema(self) -> str | None:
         """
@@ -305,22 +563,82 @@ class CloudEvent(BaseCloudEvent):
         Note: In v0.3, this is called 'schemaurl'. This method provides
         compatibility with the BaseCloudEvent interface.
         """
-        return self._attributes.get("schemaurl")
+        return self._schemaurl
 
     def get_subject(self) -> str | None:
-        return self._attributes.get("subject")
+        return self._subject
 
     def get_time(self) -> datetime | None:
-        return self._attributes.get("time")
+        time = self._time
+        if isinstance(time, LazyTime):
+            time = self._time = time.parse()
+        return time
 
     def get_extension(self, extension_name: str) -> Any:
-        return self._attributes.get(extension_name)
+        if self._extensions is not None and extension_name in self._extensions:
+            return self._extensions[extension_name]
+        if extension_name == "time":
+            return self.get_time()
+        if extension_name in _SPEC_ATTRIBUTES:
+            return getattr(self, f"_{extension_name}")
+        return None
 
     def get_data(self) -> dict[str, Any] | str | bytes | None:
-        return self._data
+        data = self._data
+        if isinstance(data, LazyData):
+            data = self._data = data.decode()
+        return data
+
+    def get_lazy_data(self) -> LazyData | None:
+        """
+        Retrieve the payload in its encoded form if it has not been decoded yet.
+
+        :return: The encoded payload, or None if the data is not lazily decoded
+            or has already been accessed through ``get_data()``.
+        """
+        return self._data if isinstance(self._data, LazyData) else None
 
     def get_attributes(self) -> dict[str, Any]:
-        return self._attributes
+        """
+        Retrieve all attributes of the event.
+
+        The returned dictionary is assembled from the stored attributes on each
+        call, so modifying it does not affect the event.
+
+        :return: The attributes of the event.
+        """
+        attributes = self.get_encoded_attributes()
+        if isinstance(self._time, LazyTime):
+            attributes["time"] = self.get_time()
+        return attributes
+
+    def get_encoded_attributes(self) -> dict[str, Any]:
+        """
+        Retrieve all attributes of the event like ``get_attributes()``, but with a
+        ``time`` attribute that has not been parsed yet as the original
+        ``LazyTime`` string, so encoders can write it back unchanged.
+
+        :return: The attributes of the event.
+        """
+        attributes: dict[str, Any] = {
+            "id": self._id,
+            "source": self._source,
+            "type": self._type,
+            "specversion": self._specversion,
+        }
+        if self._time is not None:
+            attributes["time"] = self._time
+        if self._datacontenttype is not None:
+            attributes["datacontenttype"] = self._datacontenttype
+        if self._datacontentencoding is not None:
+            attributes["datacontentencoding"] = self._datacontentencoding
+        if self._schemaurl is not None:
+            attributes["schemaurl"] = self._schemaurl
+        if self._subject is not None:
+            attributes["subject"] = self._subject
+        if self._extensions is not None:
+            attributes.update(self._extensions)
+        return attributes
 
     # v0.3 specific methods
 
@@ -330,7 +648,7 @@ class CloudEvent(BaseCloudEvent):
 
         This attribute was removed in v1.0.
         """
-        return self._attributes.get("datacontentencoding")
+        return self._datacontentencoding
 
     def get_schemaurl(self) -> str | None:
         """
@@ -338,4 +656,17 @@ class CloudEvent(BaseCloudEvent):
 
         This attribute was renamed to 'dataschema' in v1.0.
         """
-        return self._attributes.get("schemaurl")
+        return self._schemaurl
+
+
+class FrozenCloudEvent(FrozenEventMixin, CloudEvent):
+    """
+    Immutable variant of the CloudEvents v0.3 ``CloudEvent``.
+
+    The data is stored as read-only containers (see ``freeze_data()``), so the
+    event cannot change after construction. Frozen events compare by value, are
+    hashable, and cache their encoded bytes per format and content mode, so
+    writing the same event to several sinks serializes it only once.
+    """
+
+    __slots__ = ("_hash", "_encodings")
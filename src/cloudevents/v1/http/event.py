@@ -14,17 +14,31 @@
 
 import datetime
 import typing
-import uuid
 
 import cloudevents.v1.exceptions as cloud_exceptions
 from cloudevents.v1 import abstract
-from cloudevents.v1.sdk.event import v03, v1
+from cloudevents.v1.sdk.event import attribute, v03, v1
 
 _required_by_version = {
     "1.0": v1.Event._ce_required_fields,
     "0.3": v03.Event._ce_required_fields,
 }
 
+# The last default time and its ISO 8601 form. Clocks that reuse a timestamp,
+# such as ``cloudevents.core.clock.CoarseClock``, then skip the formatting too.
+_last_default_time: typing.Tuple[typing.Optional[datetime.datetime], str] = (None, "")
+
+
+def _default_time() -> str:
+    global _last_default_time
+    now = attribute.default_time_selection_algorithm()
+    last_time, last_string = _last_default_time
+    if now is last_time:
+        return last_string
+    string = now.isoformat()
+    _last_default_time = (now, string)
+    return string
+
 
 class CloudEvent(abstract.CloudEvent):
     """
@@ -63,11 +77,9 @@ class CloudEvent(abstract.CloudEvent):
         if "specversion" not in self._attributes:
             self._attributes["specversion"] = "1.0"
         if "id" not in self._attributes:
-            self._attributes["id"] = str(uuid.uuid4())
+            self._attributes["id"] = attribute.default_id_selection_algorithm()
         if "time" not in self._attributes:
-            self._attributes["time"] = datetime.datetime.now(
-                datetime.timezone.utc
-            ).isoformat()
+            self._attributes["time"] = _default_time()
 
         if self._attributes["specversion"] not in _required_by_version:
             raise cloud_exceptions.MissingRequiredFields(
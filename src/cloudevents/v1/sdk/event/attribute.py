@@ -13,9 +13,11 @@
 #    under the License.
 
 import datetime
-import uuid
 from enum import Enum
 
+from cloudevents.core.clock import current_time
+from cloudevents.core.ids import generate_id
+
 
 class SpecVersion(str, Enum):
     """
@@ -37,12 +39,15 @@ DEFAULT_SPECVERSION = SpecVersion.v1_0
 def default_time_selection_algorithm() -> datetime.datetime:
     """
     :return: A time value which will be used as CloudEvent time attribute value.
+        Provided by the clock configured with ``cloudevents.core.clock.set_clock()``.
     """
-    return datetime.datetime.now(datetime.timezone.utc)
+    return current_time()
 
 
 def default_id_selection_algorithm() -> str:
     """
     :return: Globally unique id to be used as a CloudEvent id attribute value.
+        Produced by the generator configured with
+        ``cloudevents.core.ids.set_id_generator()``.
     """
-    return str(uuid.uuid4())
+    return generate_id()
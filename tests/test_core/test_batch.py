@@ -0,0 +1,283 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from cloudevents.core.base import BaseCloudEvent
+from cloudevents.core.batch import EventBatch, EventView
+from cloudevents.core.exceptions import EventBatchValidationError
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.lazy import LazyData, LazyTime
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
+
+TIME = datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc)
+
+
+def _make_batch(length: int = 4) -> EventBatch:
+    return EventBatch(
+        {
+            "id": [f"id-{i}" for i in range(length)],
+            "source": ["/source"] * length,
+            "type": [
+                f"com.example.{'even' if i % 2 == 0 else 'odd'}" for i in range(length)
+            ],
+            "time": [TIME] * length,
+            "subject": [None if i % 2 else f"subject-{i}" for i in range(length)],
+        },
+        [{"index": i} for i in range(length)],
+    )
+
+
+def test_batch_rows_match_events() -> None:
+    batch = _make_batch()
+
+    assert len(batch) == 4
+    view = batch[2]
+    assert isinstance(view, EventView)
+    assert view.get_id() == "id-2"
+    assert view.get_source() == "/source"
+    assert view.get_type() == "com.example.even"
+    assert view.get_specversion() == "1.0"
+    assert view.get_time() == TIME
+    assert view.get_subject() == "subject-2"
+    assert view.get_data() == {"index": 2}
+    assert batch[-1].get_subject() is None
+    assert batch[1].get_attributes() == {
+        "id": "id-1",
+        "source": "/source",
+        "type": "com.example.odd",
+        "specversion": "1.0",
+        "time": TIME,
+    }
+    with pytest.raises(IndexError):
+        batch[4]
+
+
+def test_batch_interns_repeated_values() -> None:
+    batch = EventBatch(
+        {
+            "source": ["".join(["/sou", "rce"]) for _ in range(3)],
+            "type": ["".join(["te", "st"]) for _ in range(3)],
+        }
+    )
+
+    sources = batch.get_column("source")
+    assert sources[0] is sources[1] is sources[2]
+    types = batch.get_column("type")
+    assert types[0] is types[1] is types[2]
+
+
+def test_batch_applies_defaults() -> None:
+    batch = EventBatch({"source": ["/source"] * 3, "type": ["test"] * 3})
+
+    ids = batch.get_column("id")
+    assert len(set(ids)) == 3
+    assert batch.get_column("specversion") == ["1.0"] * 3
+    times = batch.get_column("time")
+    assert times[0] is times[1] is times[2]
+    assert list(batch[0].get_attributes()) == [
+        "id",
+        "source",
+        "type",
+        "specversion",
+        "time",
+    ]
+
+
+def test_batch_validation_reports_invalid_rows() -> None:
+    with pytest.raises(EventBatchValidationError) as e:
+        EventBatch(
+            {
+                "id": ["1", "", "3"],
+                "source": ["/source", "/source", None],
+                "type": ["test"] * 3,
+                "Invalid": [None, None, None],
+            }
+        )
+
+    assert list(e.value.errors) == [1, 2]
+    assert list(e.value.errors[1].errors) == ["id"]
+    assert list(e.value.errors[2].errors) == ["source"]
+
+
+def test_batch_validation_checks_extension_names() -> None:
+    with pytest.raises(EventBatchValidationError) as e:
+        EventBatch(
+            {"source": ["/source"] * 2, "type": ["test"] * 2, "Invalid": ["x", None]}
+        )
+
+    assert list(e.value.errors) == [0]
+
+
+def test_batch_rejects_columns_of_different_lengths() -> None:
+    with pytest.raises(ValueError):
+        EventBatch({"source": ["/source"] * 2, "type": ["test"] * 3})
+
+
+def test_batch_filter_take_and_project() -> None:
+    batch = _make_batch()
+
+    odd = batch.filter("type", lambda value: value == "com.example.odd")
+    assert [view.get_id() for view in odd] == ["id-1", "id-3"]
+    assert odd.get_data() == [{"index": 1}, {"index": 3}]
+
+    assert [view.get_id() for view in batch.take([3, 0])] == ["id-3", "id-0"]
+
+    projected = batch.project(["subject"])
+    assert projected.get_attribute_names() == [
+        "id",
+        "source",
+        "type",
+        "specversion",
+        "subject",
+    ]
+    assert projected.get_column("subject") is batch.get_column("subject")
+
+
+def test_batch_write_matches_single_events() -> None:
+    batch = _make_batch()
+    json_format = JSONFormat()
+
+    encoded = batch.write(json_format)
+
+    assert encoded == [json_format.write(event) for event in batch.to_events()]
+    assert json_format.read(None, encoded[0]).get_data() == {"index": 0}
+    json_batch = EventBatch(
+        {
+            "source": ["/source"] * 4,
+            "type": ["test"] * 4,
+            "datacontenttype": ["application/json"] * 4,
+        },
+        batch.get_data(),
+    )
+    assert json_batch.write_data(json_format) == [
+        b'{"index": 0}',
+        b'{"index": 1}',
+        b'{"index": 2}',
+        b'{"index": 3}',
+    ]
+
+
+def test_batch_write_batch_matches_single_events() -> None:
+    batch = _make_batch()
+    json_format = JSONFormat()
+
+    assert batch.write_batch(json_format) == json_format.write_batch(batch.to_events())
+
+
+def test_batch_write_data_forwards_lazy_data_only_when_unchanged() -> None:
+    body = b'{"index":   0}'
+    batch = EventBatch(
+        {
+            "source": ["/source"] * 2,
+            "type": ["test"] * 2,
+            "datacontenttype": ["application/json", "text/plain"],
+        },
+        [
+            LazyData(body, "application/json", JSONFormat()),
+            LazyData(body, "application/json", JSONFormat()),
+        ],
+    )
+
+    forwarded, changed_type = batch.write_data(JSONFormat())
+    assert forwarded is body
+    assert changed_type == b"{'index': 0}"
+
+    forwarded, changed_type = batch.write_data(ProtobufFormat())
+    assert forwarded == b'{"index": 0}'
+    assert changed_type == b"{'index': 0}"
+
+
+def test_batch_write_batch_rows_can_be_collected() -> None:
+    batch = _make_batch()
+    collected: list[Any] = []
+
+    class CollectingJSONFormat(JSONFormat):
+        def write_batch(self, events: Iterable[BaseCloudEvent]) -> bytes:
+            rows = list(events)
+            collected.extend(rows)
+            return super().write_batch(rows)
+
+    json_format = CollectingJSONFormat()
+
+    assert batch.write_batch(json_format) == JSONFormat().write_batch(batch.to_events())
+    assert [row.get_id() for row in collected] == ["id-0", "id-1", "id-2", "id-3"]
+
+
+def test_batch_from_events_roundtrip() -> None:
+    events = [
+        CloudEvent(
+            {"id": "1", "source": "/", "type": "test", "time": TIME, "ext": "a"},
+            "one",
+        ),
+        CloudEvent({"id": "2", "source": "/", "type": "test", "time": TIME}, "two"),
+    ]
+
+    batch = EventBatch.from_events(events)
+
+    assert batch.get_column("ext") == ["a", None]
+    restored = batch.to_events()
+    assert [event.get_attributes() for event in restored] == [
+        event.get_attributes() for event in events
+    ]
+    assert [event.get_data() for event in restored] == ["one", "two"]
+
+
+def test_batch_from_events_uses_version_of_events() -> None:
+    attributes = {"id": "1", "source": "/", "type": "test", "time": TIME}
+    events_v03 = [CloudEventV03(dict(attributes)), CloudEventV03(dict(attributes))]
+
+    batch = EventBatch.from_events(events_v03)
+
+    assert batch.get_column("specversion") == ["0.3", "0.3"]
+    assert [type(event) for event in batch.to_events()] == [CloudEventV03] * 2
+    assert EventBatch.from_events([]).get_column("specversion") == []
+    with pytest.raises(ValueError, match="Event 1 has specversion '1.0'"):
+        EventBatch.from_events([events_v03[0], CloudEvent(dict(attributes))])
+    with pytest.raises(ValueError, match="Event 0 has specversion '0.3'"):
+        EventBatch.from_events(events_v03, specversion="1.0")
+
+
+def test_batch_v03_views() -> None:
+    batch = EventBatch(
+        {
+            "source": ["/"],
+            "type": ["test"],
+            "schemaurl": ["http://example.com/schema"],
+            "time": [LazyTime("2023-10-25T17:09:19Z")],
+        },
+        specversion="0.3",
+    )
+
+    view = batch[0]
+    assert view.get_specversion() == "0.3"
+    assert view.get_dataschema() == "http://example.com/schema"
+    assert view.get_time() == TIME
+    assert isinstance(view.to_event(), CloudEventV03)
+
+
+def test_batch_rejects_mismatching_specversion() -> None:
+    columns: dict[str, Any] = {
+        "source": ["/"],
+        "type": ["test"],
+        "specversion": ["0.3"],
+    }
+    with pytest.raises(EventBatchValidationError):
+        EventBatch(columns)
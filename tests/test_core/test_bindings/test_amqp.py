@@ -22,10 +22,15 @@ from cloudevents.core.bindings.amqp import (
     from_amqp,
     from_binary,
     from_structured,
+    peek_attributes,
     to_binary,
     to_structured,
 )
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats.compression import CompressedFormat
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.formats.registry import FormatRegistry
 from cloudevents.core.v1.event import CloudEvent
 
 
@@ -874,3 +879,84 @@ def test_from_binary_colon_prefix_ignores_non_ce_properties() -> None:
     assert event.get_type() == "test"
     assert event.get_extension("customProperty") is None
     assert event.get_extension("anotherProp") is None
+
+
+def test_from_amqp_without_validation() -> None:
+    binary_message = AMQPMessage(
+        properties={},
+        application_properties={
+            "cloudEvents_type": "test",
+            "cloudEvents_source": "/test",
+            "cloudEvents_id": "123",
+            "cloudEvents_specversion": "1.0",
+            "cloudEvents_subject": "",
+        },
+        application_data=b"",
+    )
+    structured_message = AMQPMessage(
+        properties={"content-type": "application/cloudevents+json"},
+        application_properties={},
+        application_data=b'{"type": "test", "source": "/test", "id": "123", '
+        b'"specversion": "1.0", "subject": ""}',
+    )
+
+    for message in (binary_message, structured_message):
+        with pytest.raises(CloudEventValidationError):
+            from_amqp(message, JSONFormat(), CloudEvent)
+
+        event = from_amqp(message, JSONFormat(), CloudEvent, validate=False)
+        assert isinstance(event, CloudEvent)
+        assert event.get_subject() == ""
+
+
+def test_peek_attributes_in_both_modes() -> None:
+    event = create_event({"subject": "routing"}, {"message": "Hello"})
+
+    for message in (
+        to_binary(event, JSONFormat()),
+        to_structured(event, JSONFormat()),
+    ):
+        attributes = peek_attributes(message, JSONFormat())
+
+        assert attributes["type"] == "com.example.test"
+        assert attributes["subject"] == "routing"
+        assert "data" not in attributes
+
+
+def test_from_amqp_with_registry_dispatches_on_content_type() -> None:
+    event = create_event(
+        {"subject": "routing", "datacontenttype": "application/json"},
+        {"message": "Hello"},
+    )
+    message = to_structured(event, ProtobufFormat())
+    registry = FormatRegistry([JSONFormat(), ProtobufFormat()])
+
+    decoded = from_amqp(message, registry, CloudEvent)
+
+    assert decoded.get_subject() == "routing"
+    assert decoded.get_data() == {"message": "Hello"}
+    assert peek_attributes(message, registry)["subject"] == "routing"
+    # A single format is used as given, whatever the content type
+    with pytest.raises(ValueError):
+        from_amqp(message, JSONFormat(), CloudEvent)
+
+
+def test_compressed_format_sets_content_encoding() -> None:
+    event = create_event({"datacontenttype": "application/json"}, {"message": "Hi"})
+    event_format = CompressedFormat(JSONFormat(), min_size=0)
+
+    for message in (
+        to_binary(event, event_format),
+        to_structured(event, event_format),
+    ):
+        assert message.properties["content-encoding"] == "gzip"
+        decoded = from_amqp(message, event_format, CloudEvent)
+        assert decoded.get_data() == {"message": "Hi"}
+        assert peek_attributes(message, event_format)["id"] == "test-id-123"
+
+    # Other formats get the body as it is
+    with pytest.raises(ValueError):
+        from_amqp(to_structured(event, event_format), JSONFormat(), CloudEvent)
+
+    uncompressed = to_structured(event, CompressedFormat(JSONFormat()))
+    assert "content-encoding" not in uncompressed.properties
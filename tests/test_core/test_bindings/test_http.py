@@ -19,19 +19,28 @@ import pytest
 
 from cloudevents.core.bindings.http import (
     HTTPMessage,
+    from_batch,
+    from_batch_event,
     from_binary,
     from_binary_event,
     from_http,
     from_http_event,
     from_structured,
     from_structured_event,
+    peek_attributes,
+    to_batch,
+    to_batch_event,
     to_binary,
     to_binary_event,
     to_structured,
     to_structured_event,
 )
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats.compression import CompressedFormat
 from cloudevents.core.formats.json import JSONFormat
-from cloudevents.core.v1.event import CloudEvent
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.formats.registry import FormatRegistry
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
 
 
 @pytest.fixture
@@ -411,6 +420,40 @@ def test_from_binary_datetime_parsing() -> None:
     assert time.day == 15
 
 
+def test_from_binary_forwards_unparsed_time_header() -> None:
+    """Test that an unread time attribute is re-encoded from the original string"""
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "test-123",
+            "ce-specversion": "1.0",
+            "ce-time": "2023-01-15T10:30:45.1+02:00",
+        },
+        body=b"",
+    )
+    event = from_binary(message, JSONFormat(), CloudEvent)
+    forwarded = to_binary(event, JSONFormat())
+
+    assert forwarded.headers["ce-time"] == "2023-01-15T10:30:45.1+02:00"
+
+
+def test_from_binary_rejects_invalid_time_header() -> None:
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "test-123",
+            "ce-specversion": "1.0",
+            "ce-time": "garbage",
+        },
+        body=b"",
+    )
+
+    with pytest.raises(CloudEventValidationError):
+        from_binary(message, JSONFormat(), CloudEvent)
+
+
 def test_from_binary_header_decoding() -> None:
     """Test percent decoding of headers"""
     message = HTTPMessage(
@@ -1139,3 +1182,312 @@ def test_convenience_with_explicit_format_override() -> None:
 
     assert recovered.get_type() == event.get_type()
     assert recovered.get_data() == event.get_data()
+
+
+def test_from_binary_without_validation() -> None:
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "ce-subject": "",
+        },
+        body=b"",
+    )
+
+    with pytest.raises(CloudEventValidationError):
+        from_binary(message, JSONFormat())
+
+    event = from_binary(message, JSONFormat(), validate=False)
+    assert isinstance(event, CloudEvent)
+    assert event.get_subject() == ""
+
+    event = from_binary(message, JSONFormat(), CloudEvent, validate=False)
+    assert event.get_subject() == ""
+
+
+def test_from_structured_without_validation() -> None:
+    message = HTTPMessage(
+        headers={"content-type": "application/cloudevents+json"},
+        body=b'{"type": "com.example.test", "source": "/test", "id": "123", '
+        b'"specversion": "1.0", "subject": ""}',
+    )
+
+    with pytest.raises(CloudEventValidationError):
+        from_structured(message, JSONFormat())
+
+    event = from_structured(message, JSONFormat(), validate=False)
+    assert isinstance(event, CloudEvent)
+    assert event.get_subject() == ""
+
+    event = from_http(message, JSONFormat(), CloudEvent, validate=False)
+    assert event.get_subject() == ""
+
+
+def test_from_binary_lazy_data() -> None:
+    body = b'{"message": "Hello",   "count": 42}'
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "content-type": "application/json",
+        },
+        body=body,
+    )
+
+    event = from_binary(message, JSONFormat(), lazy=True)
+
+    assert isinstance(event, CloudEvent)
+    assert event.get_lazy_data() is not None
+    assert event.get_data() == {"message": "Hello", "count": 42}
+    assert event.get_lazy_data() is None
+
+
+def test_forward_lazy_data_reuses_original_body() -> None:
+    # Non-canonical JSON spacing shows the body is not re-encoded
+    body = b'{"message": "Hello",   "count": 42}'
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "content-type": "application/json",
+        },
+        body=body,
+    )
+
+    event = from_http(message, JSONFormat(), CloudEvent, lazy=True)
+    forwarded = to_binary(event, JSONFormat())
+
+    assert forwarded.body is body
+    assert forwarded.headers["content-type"] == "application/json"
+
+
+def test_forward_lazy_data_reencodes_changed_content_type_or_format() -> None:
+    body = b'{"message": "Hello",   "count": 42}'
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "content-type": "application/json",
+        },
+        body=body,
+    )
+    event = from_http(message, JSONFormat(), CloudEvent, lazy=True)
+    assert isinstance(event, CloudEvent)
+
+    evolved = event.evolve({"datacontenttype": "text/plain"})
+    forwarded = to_binary(evolved, JSONFormat())
+    assert forwarded.body == b"{'message': 'Hello', 'count': 42}"
+    assert forwarded.headers["content-type"] == "text/plain"
+
+    forwarded = to_binary(event, JSONFormat(raw_data=True))
+    assert forwarded.body == b'{"message": "Hello", "count": 42}'
+
+
+def test_frozen_event_reuses_encoded_body() -> None:
+    """Test that frozen events are only serialized once per content mode"""
+    event = FrozenCloudEvent(
+        {
+            "type": "com.example.test",
+            "source": "/test",
+            "id": "test-123",
+            "datacontenttype": "application/json",
+        },
+        {"message": "Hello"},
+    )
+
+    structured = to_structured(event, JSONFormat())
+    binary = to_binary(event, JSONFormat())
+
+    assert to_structured_event(event).body is structured.body
+    assert to_binary(event, JSONFormat()).body is binary.body
+    assert binary.body == b'{"message": "Hello"}'
+
+
+def test_to_batch_and_from_batch() -> None:
+    events = [create_event({"id": str(i)}, {"index": i}) for i in range(3)]
+
+    message = to_batch(events, JSONFormat())
+
+    assert message.headers == {"content-type": "application/cloudevents-batch+json"}
+    parsed = from_batch(message, JSONFormat(), CloudEvent)
+    assert [event.get_id() for event in parsed] == ["0", "1", "2"]
+    assert [event.get_data() for event in parsed] == [{"index": i} for i in range(3)]
+
+
+def test_from_batch_without_validation() -> None:
+    message = HTTPMessage(
+        headers={"content-type": "application/cloudevents-batch+json"},
+        body=b'[{"id": "", "source": "/test", "type": "test", "specversion": "1.0"}]',
+    )
+
+    with pytest.raises(CloudEventValidationError):
+        from_batch(message, JSONFormat())
+    assert from_batch(message, JSONFormat(), validate=False)[0].get_id() == ""
+
+
+def test_batch_event_convenience_wrappers() -> None:
+    events = [create_event({"id": "1"}), create_event({"id": "2"})]
+
+    parsed = from_batch_event(to_batch_event(events))
+
+    assert [event.get_id() for event in parsed] == ["1", "2"]
+
+
+def test_peek_attributes_binary_mode_reads_headers_only() -> None:
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "ce-time": "2023-01-15T10:30:45Z",
+            "content-type": "application/json",
+        },
+        body=b"not json",
+    )
+
+    attributes = peek_attributes(message, JSONFormat())
+
+    assert attributes == {
+        "type": "com.example.test",
+        "source": "/test",
+        "id": "123",
+        "specversion": "1.0",
+        "time": "2023-01-15T10:30:45Z",
+        "datacontenttype": "application/json",
+    }
+
+
+def test_peek_attributes_structured_mode() -> None:
+    event = create_event({"subject": "routing"}, {"large": "x" * 1000})
+    message = to_structured(event, JSONFormat())
+
+    attributes = peek_attributes(message, JSONFormat())
+
+    assert attributes["type"] == "com.example.test"
+    assert attributes["subject"] == "routing"
+    assert "data" not in attributes
+
+
+def test_peek_attributes_reads_event_of_format_without_peeking() -> None:
+    class NonPeekingFormat:
+        """A format implementing only the core Format protocol"""
+
+        def __init__(self) -> None:
+            self._format = JSONFormat()
+
+        def read(self, event_factory: Any, data: str | bytes) -> Any:
+            return self._format.read(event_factory, data)
+
+        def write(self, event: Any) -> bytes:
+            return self._format.write(event)
+
+        def write_data(self, data: Any, datacontenttype: str | None) -> bytes:
+            return self._format.write_data(data, datacontenttype)
+
+        def read_data(self, body: bytes, datacontenttype: str | None) -> Any:
+            return self._format.read_data(body, datacontenttype)
+
+        def get_content_type(self) -> str:
+            return self._format.get_content_type()
+
+    event_format = NonPeekingFormat()
+    event = create_event(
+        {"time": datetime(2023, 1, 15, 10, 30, 45, tzinfo=timezone.utc)},
+        {"message": "Hello"},
+    )
+    message = to_structured(event, event_format)
+
+    attributes = peek_attributes(message, event_format)
+
+    assert attributes["type"] == "com.example.test"
+    assert attributes["time"] == "2023-01-15T10:30:45Z"
+    assert "data" not in attributes
+
+
+def test_from_http_with_registry_dispatches_on_content_type() -> None:
+    event = create_event(
+        {"subject": "routing", "datacontenttype": "application/json"},
+        {"message": "Hello"},
+    )
+    message = to_structured(event, ProtobufFormat())
+    registry = FormatRegistry([JSONFormat(), ProtobufFormat()])
+
+    decoded = from_http(message, registry, CloudEvent)
+
+    assert decoded.get_subject() == "routing"
+    assert decoded.get_data() == {"message": "Hello"}
+    assert peek_attributes(message, registry)["subject"] == "routing"
+    # A single format is used as given, whatever the content type
+    with pytest.raises(ValueError):
+        from_http(message, JSONFormat(), CloudEvent)
+
+
+def test_from_binary_with_registry_uses_default_format() -> None:
+    event = create_event({"datacontenttype": "application/json"}, {"message": "Hello"})
+    registry = FormatRegistry([ProtobufFormat()], default=JSONFormat())
+
+    decoded = from_http(to_binary(event, JSONFormat()), registry, CloudEvent)
+
+    assert decoded.get_data() == {"message": "Hello"}
+
+
+def test_from_batch_with_registry_dispatches_on_content_type() -> None:
+    events = [create_event({"id": str(index)}) for index in range(3)]
+    message = to_batch(events, ProtobufFormat())
+
+    decoded = from_batch(message, FormatRegistry([ProtobufFormat()]), CloudEvent)
+
+    assert [event.get_id() for event in decoded] == ["0", "1", "2"]
+    with pytest.raises(ValueError):
+        from_batch(message, JSONFormat(), CloudEvent)
+
+    with pytest.raises(ValueError, match="No batch format"):
+        from_batch(message, FormatRegistry([JSONFormat()]), CloudEvent)
+
+
+def test_compressed_format_sets_content_encoding() -> None:
+    event = create_event({"datacontenttype": "application/json"}, {"message": "Hi"})
+    event_format = CompressedFormat(JSONFormat(), min_size=0)
+
+    for message in (
+        to_binary(event, event_format),
+        to_structured(event, event_format),
+    ):
+        assert message.headers["content-encoding"] == "gzip"
+        decoded = from_http(message, event_format, CloudEvent)
+        assert decoded.get_data() == {"message": "Hi"}
+        assert peek_attributes(message, event_format)["id"] == "test-id-123"
+
+    # Other formats get the body as it is
+    with pytest.raises(ValueError):
+        from_http(to_structured(event, event_format), JSONFormat(), CloudEvent)
+
+    uncompressed = to_structured(event, CompressedFormat(JSONFormat()))
+    assert "content-encoding" not in uncompressed.headers
+
+
+def test_from_binary_keeps_body_of_unknown_content_encoding() -> None:
+    message = HTTPMessage(
+        headers={
+            "ce-type": "com.example.test",
+            "ce-source": "/test",
+            "ce-id": "test-id-123",
+            "ce-specversion": "1.0",
+            "content-type": "application/octet-stream",
+            "content-encoding": "br",
+        },
+        body=b"\x8b\x02\x80payload\x03",
+    )
+
+    for event_format in (JSONFormat(), CompressedFormat(JSONFormat())):
+        decoded = from_http(message, event_format, CloudEvent)
+        assert decoded.get_data() == b"\x8b\x02\x80payload\x03"
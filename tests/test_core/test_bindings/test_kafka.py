@@ -26,12 +26,17 @@ from cloudevents.core.bindings.kafka import (
     from_kafka_event,
     from_structured,
     from_structured_event,
+    peek_attributes,
     to_binary,
     to_binary_event,
     to_structured,
     to_structured_event,
 )
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats.compression import CompressedFormat
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.formats.registry import FormatRegistry
 from cloudevents.core.v1.event import CloudEvent
 
 
@@ -811,3 +816,108 @@ def test_from_structured_with_key_auto_detect_v03() -> None:
     assert event.get_type() == "com.example.test"
     assert event.get_extension("partitionkey") == "partition-key-456"
     assert event.get_attributes()["specversion"] == "0.3"
+
+
+def test_from_kafka_without_validation() -> None:
+    binary_message = KafkaMessage(
+        headers={
+            "ce_type": b"com.example.test",
+            "ce_source": b"/test",
+            "ce_id": b"123",
+            "ce_specversion": b"1.0",
+            "ce_subject": b"",
+        },
+        key=None,
+        value=b"",
+    )
+    structured_message = KafkaMessage(
+        headers={"content-type": b"application/cloudevents+json"},
+        key=b"key-1",
+        value=b'{"type": "com.example.test", "source": "/test", "id": "123", '
+        b'"specversion": "1.0", "subject": ""}',
+    )
+
+    for message in (binary_message, structured_message):
+        with pytest.raises(CloudEventValidationError):
+            from_kafka(message, JSONFormat())
+
+        event = from_kafka(message, JSONFormat(), validate=False)
+        assert isinstance(event, CloudEvent)
+        assert event.get_subject() == ""
+
+    event = from_kafka(structured_message, JSONFormat(), CloudEvent, validate=False)
+    assert event.get_extension("partitionkey") == "key-1"
+
+
+def test_from_kafka_lazy_data_forwarded_unchanged() -> None:
+    value = b'{"message":   "Hello"}'
+    message = KafkaMessage(
+        headers={
+            "ce_type": b"com.example.test",
+            "ce_source": b"/test",
+            "ce_id": b"123",
+            "ce_specversion": b"1.0",
+            "content-type": b"application/json",
+        },
+        key=None,
+        value=value,
+    )
+
+    event = from_kafka(message, JSONFormat(), lazy=True)
+
+    assert to_binary(event, JSONFormat()).value is value
+    assert event.get_data() == {"message": "Hello"}
+
+
+def test_peek_attributes_adds_partition_key_in_both_modes() -> None:
+    event = create_event({"subject": "routing"}, {"message": "Hello"})
+
+    for message in (
+        to_binary(event, JSONFormat(), key_mapper=lambda _: "key-1"),
+        to_structured(event, JSONFormat(), key_mapper=lambda _: "key-1"),
+    ):
+        attributes = peek_attributes(message, JSONFormat())
+
+        assert attributes["type"] == "com.example.test"
+        assert attributes["subject"] == "routing"
+        assert attributes["partitionkey"] == "key-1"
+        assert "data" not in attributes
+
+
+def test_from_kafka_with_registry_dispatches_on_content_type() -> None:
+    event = create_event(
+        {"subject": "routing", "datacontenttype": "application/json"},
+        {"message": "Hello"},
+    )
+    message = to_structured(event, ProtobufFormat())
+    registry = FormatRegistry([JSONFormat(), ProtobufFormat()])
+
+    decoded = from_kafka(message, registry, CloudEvent)
+
+    assert decoded.get_subject() == "routing"
+    assert decoded.get_data() == {"message": "Hello"}
+    assert peek_attributes(message, registry)["subject"] == "routing"
+    # A single format is used as given, whatever the content type
+    with pytest.raises(ValueError):
+        from_kafka(message, JSONFormat(), CloudEvent)
+
+
+def test_compressed_format_sets_content_encoding() -> None:
+    event = create_event({"datacontenttype": "application/json"}, {"message": "Hi"})
+    event_format = CompressedFormat(JSONFormat(), min_size=0)
+
+    for message in (
+        to_binary(event, event_format),
+        to_structured(event, event_format),
+    ):
+        assert message.headers["content-encoding"] == b"gzip"
+        decoded = from_kafka(message, event_format, CloudEvent)
+        assert decoded.get_data() == {"message": "Hi"}
+        assert peek_attributes(message, event_format)["id"] == "test-id-123"
+
+    # Other formats get the body as it is
+    with pytest.raises(ValueError):
+        from_kafka(to_structured(event, event_format), JSONFormat(), CloudEvent)
+
+    uncompressed = to_structured(event, CompressedFormat(JSONFormat()))
+    assert "content-encoding" not in uncompressed.headers
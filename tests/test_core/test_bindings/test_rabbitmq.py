@@ -22,10 +22,15 @@ from cloudevents.core.bindings.rabbitmq import (
     from_binary,
     from_rabbitmq,
     from_structured,
+    peek_attributes,
     to_binary,
     to_structured,
 )
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats.compression import CompressedFormat
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.formats.registry import FormatRegistry
 from cloudevents.core.v1.event import CloudEvent
 
 
@@ -789,3 +794,84 @@ def test_empty_headers_structured_mode() -> None:
     event = from_structured(message, JSONFormat(), CloudEvent)
 
     assert event.get_type() == "test"
+
+
+def test_from_rabbitmq_without_validation() -> None:
+    binary_message = RabbitMQMessage(
+        headers={
+            "ce-type": "test",
+            "ce-source": "/test",
+            "ce-id": "123",
+            "ce-specversion": "1.0",
+            "ce-subject": "",
+        },
+        content_type=None,
+        body=b"",
+    )
+    structured_message = RabbitMQMessage(
+        headers={},
+        content_type="application/cloudevents+json",
+        body=b'{"type": "test", "source": "/test", "id": "123", '
+        b'"specversion": "1.0", "subject": ""}',
+    )
+
+    for message in (binary_message, structured_message):
+        with pytest.raises(CloudEventValidationError):
+            from_rabbitmq(message, JSONFormat())
+
+        event = from_rabbitmq(message, JSONFormat(), validate=False)
+        assert isinstance(event, CloudEvent)
+        assert event.get_subject() == ""
+
+
+def test_peek_attributes_in_both_modes() -> None:
+    event = create_event({"subject": "routing"}, {"message": "Hello"})
+
+    for message in (
+        to_binary(event, JSONFormat()),
+        to_structured(event, JSONFormat()),
+    ):
+        attributes = peek_attributes(message, JSONFormat())
+
+        assert attributes["type"] == "com.example.test"
+        assert attributes["subject"] == "routing"
+        assert "data" not in attributes
+
+
+def test_from_rabbitmq_with_registry_dispatches_on_content_type() -> None:
+    event = create_event(
+        {"subject": "routing", "datacontenttype": "application/json"},
+        {"message": "Hello"},
+    )
+    message = to_structured(event, ProtobufFormat())
+    registry = FormatRegistry([JSONFormat(), ProtobufFormat()])
+
+    decoded = from_rabbitmq(message, registry, CloudEvent)
+
+    assert decoded.get_subject() == "routing"
+    assert decoded.get_data() == {"message": "Hello"}
+    assert peek_attributes(message, registry)["subject"] == "routing"
+    # A single format is used as given, whatever the content type
+    with pytest.raises(ValueError):
+        from_rabbitmq(message, JSONFormat(), CloudEvent)
+
+
+def test_compressed_format_sets_content_encoding() -> None:
+    event = create_event({"datacontenttype": "application/json"}, {"message": "Hi"})
+    event_format = CompressedFormat(JSONFormat(), min_size=0)
+
+    for message in (
+        to_binary(event, event_format),
+        to_structured(event, event_format),
+    ):
+        assert message.content_encoding == "gzip"
+        decoded = from_rabbitmq(message, event_format, CloudEvent)
+        assert decoded.get_data() == {"message": "Hi"}
+        assert peek_attributes(message, event_format)["id"] == "test-id-123"
+
+    # Other formats get the body as it is
+    with pytest.raises(ValueError):
+        from_rabbitmq(to_structured(event, event_format), JSONFormat(), CloudEvent)
+
+    uncompressed = to_structured(event, CompressedFormat(JSONFormat()))
+    assert uncompressed.content_encoding is None
@@ -0,0 +1,110 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from datetime import datetime, timezone
+from typing import Iterator
+
+import pytest
+
+from cloudevents.core import clock
+from cloudevents.core.clock import (
+    CoarseClock,
+    SystemClock,
+    batch_time,
+    current_time,
+    get_clock,
+    set_clock,
+)
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
+from cloudevents.v1.http import CloudEvent as LegacyCloudEvent
+
+
+class _FixedClock:
+    def __init__(self, now: datetime) -> None:
+        self._now = now
+
+    def now(self) -> datetime:
+        return self._now
+
+
+@pytest.fixture
+def restore_clock() -> Iterator[None]:
+    current = get_clock()
+    yield
+    set_clock(current)
+
+
+def test_default_clock_is_system_clock() -> None:
+    assert isinstance(get_clock(), SystemClock)
+    now = current_time()
+    assert now.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - now).total_seconds()) < 5
+
+
+def test_coarse_clock_reuses_time_within_resolution(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monotonic_ns = 1_000_000_000
+    monkeypatch.setattr(clock.time, "monotonic_ns", lambda: monotonic_ns)
+    coarse = CoarseClock(resolution=0.5)
+
+    first = coarse.now()
+    monotonic_ns += 400_000_000
+    assert coarse.now() is first
+    monotonic_ns += 100_000_000
+    assert coarse.now() is not first
+
+
+def test_coarse_clock_rejects_negative_resolution() -> None:
+    with pytest.raises(ValueError):
+        CoarseClock(resolution=-1)
+
+
+@pytest.mark.parametrize("event_class", [CloudEvent, CloudEventV03])
+def test_events_use_configured_clock(event_class: type, restore_clock: None) -> None:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    set_clock(_FixedClock(now))
+
+    event = event_class({"source": "/", "type": "test"})
+
+    assert event.get_time() is now
+
+
+def test_legacy_event_uses_configured_clock(restore_clock: None) -> None:
+    set_clock(_FixedClock(datetime(2024, 1, 1, tzinfo=timezone.utc)))
+
+    first = LegacyCloudEvent({"source": "/", "type": "test"})
+    second = LegacyCloudEvent({"source": "/", "type": "test"})
+
+    assert first["time"] == "2024-01-01T00:00:00+00:00"
+    assert second["time"] == first["time"]
+
+
+def test_batch_time_stamps_events_with_one_timestamp() -> None:
+    with batch_time() as timestamp:
+        events = [CloudEvent({"source": "/", "type": "test"}) for _ in range(10)]
+
+    assert all(event.get_time() is timestamp for event in events)
+    assert current_time() is not timestamp
+
+
+def test_batch_time_with_explicit_timestamp_and_nesting() -> None:
+    outer = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    inner = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    with batch_time(outer):
+        with batch_time(inner):
+            assert current_time() is inner
+        assert current_time() is outer
@@ -0,0 +1,208 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from cloudevents.core.formats.avro import AvroFormat
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+# The attribute map with the strings id "1", source "/", specversion "1.0" and
+# type "t", followed by the string data "hi"
+ENCODED_EVENT = (
+    b"\x08"
+    b"\x04id\x06\x021"
+    b"\x0csource\x06\x02/"
+    b"\x16specversion\x06\x061.0"
+    b"\x08type\x06\x02t"
+    b"\x00"
+    b"\x0c\x04hi"
+)
+
+
+def create_event(
+    extra_attributes: dict[str, object] | None = None, data: object = None
+) -> CloudEvent:
+    attributes = {
+        "id": "1",
+        "source": "/",
+        "type": "t",
+        "specversion": "1.0",
+        "time": datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc),
+    }
+    attributes.update(extra_attributes or {})
+    return CloudEvent(attributes, data)  # type: ignore[arg-type]
+
+
+def test_read_spec_encoded_event() -> None:
+    event = AvroFormat().read(None, ENCODED_EVENT)
+
+    assert event.get_id() == "1"
+    assert event.get_source() == "/"
+    assert event.get_type() == "t"
+    assert event.get_specversion() == "1.0"
+    assert event.get_data() == "hi"
+
+
+def test_roundtrip_keeps_attribute_types() -> None:
+    event = create_event(
+        {
+            "subject": "subject",
+            "flag": True,
+            "count": -(2**31),
+            "blob": b"\x00\xff",
+        }
+    )
+    avro_format = AvroFormat()
+
+    decoded = avro_format.read(None, avro_format.write(event))
+
+    assert decoded.get_time() == event.get_time()
+    for name in ("subject", "flag", "count", "blob"):
+        assert decoded.get_extension(name) == event.get_extension(name)
+    assert decoded.get_extension("flag") is True
+
+
+def test_write_binary_data_as_bytes() -> None:
+    event = create_event(data=b"\x00\x01\x02")
+    avro_format = AvroFormat()
+
+    encoded = avro_format.write(event)
+
+    assert encoded.endswith(b"\x00\x06\x00\x01\x02")
+    assert avro_format.read(None, encoded).get_data() == b"\x00\x01\x02"
+
+
+def test_json_value_roundtrip() -> None:
+    data = {"a": {"b": {"c": {"d": 1}}, "l": [{"q": "r"}]}, "x": 1.5, "s": None}
+    avro_format = AvroFormat()
+
+    decoded = avro_format.read(None, avro_format.write(create_event(data=data)))
+
+    assert decoded.get_data() == {
+        "a": {"b": {"c": {"d": 1.0}}, "l": [{"q": "r"}]},
+        "x": 1.5,
+        "s": None,
+    }
+
+
+def test_write_rejects_data_outside_the_schema() -> None:
+    with pytest.raises(ValueError, match="no branch"):
+        AvroFormat().write(create_event(data={"items": [1, 2]}))
+
+
+@pytest.mark.parametrize(
+    "datacontenttype,data",
+    [
+        ("application/json", {"items": [1, 2]}),
+        ("application/json", [1, "two", None]),
+        ("text/plain", "hello"),
+        ("application/octet-stream", b"\xff"),
+    ],
+)
+def test_data_with_content_type_roundtrip(datacontenttype: str, data: object) -> None:
+    event = create_event({"datacontenttype": datacontenttype}, data)
+    avro_format = AvroFormat()
+
+    decoded = avro_format.read(None, avro_format.write(event))
+
+    assert decoded.get_data() == data
+
+
+def test_read_v03_event() -> None:
+    event = CloudEventV03(
+        {"id": "1", "source": "/", "type": "t", "specversion": "0.3"}, b"\x01"
+    )
+    avro_format = AvroFormat()
+
+    decoded = avro_format.read(None, avro_format.write(event))
+
+    assert isinstance(decoded, CloudEventV03)
+    assert decoded.get_data() == b"\x01"
+
+
+def test_read_accepts_buffers() -> None:
+    avro_format = AvroFormat()
+
+    assert avro_format.read(None, bytearray(ENCODED_EVENT)).get_data() == "hi"
+    assert avro_format.read(None, memoryview(ENCODED_EVENT)).get_data() == "hi"
+
+
+@pytest.mark.parametrize(
+    "data", [ENCODED_EVENT[:-1], ENCODED_EVENT + b"\x00", b"\x08\x04id\x0e"]
+)
+def test_read_rejects_invalid_records(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        AvroFormat().read(None, data)
+
+
+def test_write_rejects_unsupported_attributes() -> None:
+    event = create_event({"count": 2**31})
+
+    with pytest.raises(ValueError):
+        AvroFormat().write(event)
+
+
+def test_write_is_cached_for_frozen_events() -> None:
+    event = FrozenCloudEvent(create_event().get_attributes(), {"a": "b"})
+
+    assert AvroFormat().write(event) is AvroFormat().write(event)
+
+
+def test_peek_attributes_skips_data() -> None:
+    attributes = AvroFormat().peek_attributes(ENCODED_EVENT[:-3])
+
+    assert attributes == {"id": "1", "source": "/", "specversion": "1.0", "type": "t"}
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_container_file_roundtrip(codec: str) -> None:
+    events = [create_event({"id": str(index)}, {"n": index}) for index in range(50)]
+    avro_format = AvroFormat()
+    stream = io.BytesIO()
+
+    written = avro_format.write_container(events, stream, codec=codec, block_size=256)
+    stream.seek(0)
+    decoded = list(avro_format.read_container(stream))
+
+    assert written == 50
+    assert stream.getvalue().startswith(b"Obj\x01")
+    assert [event.get_id() for event in decoded] == [str(n) for n in range(50)]
+    assert decoded[49].get_data() == {"n": 49.0}
+
+
+def test_container_file_rejects_invalid_input() -> None:
+    avro_format = AvroFormat()
+    stream = io.BytesIO()
+    avro_format.write_container([create_event()], stream)
+    corrupted = stream.getvalue()[:-1] + b"\x00"
+
+    with pytest.raises(ValueError, match="Not an Avro"):
+        list(avro_format.read_container(io.BytesIO(b"PAR1")))
+    with pytest.raises(ValueError, match="sync marker"):
+        list(avro_format.read_container(io.BytesIO(corrupted)))
+    with pytest.raises(ValueError, match="codec"):
+        avro_format.write_container([], io.BytesIO(), codec="snappy")
+
+
+def test_data_payload_methods() -> None:
+    avro_format = AvroFormat()
+
+    assert avro_format.get_content_type() == "application/cloudevents+avro"
+    assert avro_format.write_data({"a": 1}, "application/json") == b'{"a": 1}'
+    assert avro_format.read_data(b'{"a": 1}', "application/json") == {"a": 1}
@@ -0,0 +1,115 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+from datetime import datetime, timezone
+
+import pytest
+
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.lazy import RawJSON
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
+
+cbor2 = pytest.importorskip("cbor2")
+
+from cloudevents.core.formats.cbor import CBORFormat  # noqa: E402
+
+TIME = datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc)
+
+
+def create_event(
+    extra_attributes: dict[str, object] | None = None, data: object = None
+) -> CloudEvent:
+    attributes = {
+        "id": "1",
+        "source": "/",
+        "type": "t",
+        "specversion": "1.0",
+        "time": TIME,
+    }
+    attributes.update(extra_attributes or {})
+    return CloudEvent(attributes, data)  # type: ignore[arg-type]
+
+
+def test_write_binary_data_and_time_natively() -> None:
+    event = create_event({"datacontenttype": "application/octet-stream"}, b"\x00\xff")
+
+    decoded = cbor2.loads(CBORFormat().write(event))
+
+    assert decoded["data"] == b"\x00\xff"
+    assert "data_base64" not in decoded
+    assert decoded["time"] == TIME
+
+
+def test_write_time_as_epoch_tag() -> None:
+    encoded = CBORFormat().write(create_event())
+
+    # Tag 1 followed by a double
+    assert b"\xc1\xfb" in encoded
+
+
+def test_roundtrip() -> None:
+    event = create_event(
+        {"subject": "s", "flag": True, "count": 3, "when": TIME},
+        {"a": [1, 2, {"b": None}]},
+    )
+    cbor_format = CBORFormat()
+
+    decoded = cbor_format.read(None, cbor_format.write(event))
+
+    assert decoded.get_attributes() == event.get_attributes()
+    assert decoded.get_data() == event.get_data()
+
+
+def test_smaller_than_json_for_binary_data() -> None:
+    event = create_event(data=bytes(range(256)) * 4)
+
+    assert len(CBORFormat().write(event)) < len(JSONFormat().write(event)) * 0.8
+
+
+def test_write_raw_json_data_as_value() -> None:
+    event = create_event({"datacontenttype": "application/json"}, RawJSON(b'{"a":1}'))
+
+    assert CBORFormat().read(None, CBORFormat().write(event)).get_data() == {"a": 1}
+
+
+def test_read_v03_event() -> None:
+    event = CloudEventV03(
+        {"id": "1", "source": "/", "type": "t", "specversion": "0.3"}, "text"
+    )
+
+    decoded = CBORFormat().read(None, CBORFormat().write(event))
+
+    assert isinstance(decoded, CloudEventV03)
+    assert decoded.get_data() == "text"
+
+
+@pytest.mark.parametrize("data", [b"\xa1", b"\x01", b"\xa0\x00", "text"])
+def test_read_rejects_invalid_input(data: bytes | str) -> None:
+    with pytest.raises(ValueError):
+        CBORFormat().read(None, data)
+
+
+def test_peek_attributes() -> None:
+    encoded = CBORFormat().write(create_event(data=b"payload"))
+
+    attributes = CBORFormat().peek_attributes(encoded)
+
+    assert "data" not in attributes
+    assert attributes["time"] == TIME
+
+
+def test_content_type() -> None:
+    assert CBORFormat().get_content_type() == "application/cloudevents+cbor"
@@ -0,0 +1,163 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gzip
+from typing import Any
+
+import pytest
+
+from cloudevents.core.formats.compression import (
+    DEFAULT_MIN_SIZE,
+    CompressedFormat,
+    decompress,
+    supported_encodings,
+)
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.v1.event import CloudEvent
+
+
+def create_event(data: Any = None, **extra: Any) -> CloudEvent:
+    attributes = {
+        "type": "com.example.test",
+        "source": "/test",
+        "id": "test-id-123",
+        "specversion": "1.0",
+        **extra,
+    }
+    return CloudEvent(attributes, data)
+
+
+LARGE_DATA = {"message": "Hello " * (DEFAULT_MIN_SIZE // 4)}
+
+
+@pytest.mark.parametrize("encoding", sorted(supported_encodings()))
+def test_write_and_read_compressed_event(encoding: str) -> None:
+    event_format = CompressedFormat(JSONFormat(), encoding)
+    event = create_event(LARGE_DATA, datacontenttype="application/json")
+
+    body = event_format.write(event)
+    decoded = event_format.read(CloudEvent, body)
+
+    assert len(body) < len(JSONFormat().write(event))
+    assert decompress(body, encoding) == JSONFormat().write(event)
+    assert decoded.get_data() == LARGE_DATA
+    assert event_format.peek_attributes(body)["id"] == "test-id-123"
+
+
+def test_small_bodies_are_not_compressed() -> None:
+    event_format = CompressedFormat(JSONFormat())
+    event = create_event({"message": "Hello"})
+
+    assert event_format.compress(b"small") == (b"small", None)
+    assert event_format.write(event) == JSONFormat().write(event)
+    assert event_format.read(None, event_format.write(event)).get_data() == {
+        "message": "Hello"
+    }
+
+
+def test_compress_reports_encoding() -> None:
+    event_format = CompressedFormat(JSONFormat(), "x-gzip", min_size=0)
+
+    body, encoding = event_format.compress(b"payload")
+
+    assert encoding == "gzip"
+    assert event_format.encoding == "gzip"
+    assert gzip.decompress(body) == b"payload"
+
+
+@pytest.mark.parametrize(
+    ("alias", "encoding"), [("zlib", "deflate"), ("LZMA", "xz"), ("x-gzip", "gzip")]
+)
+def test_encoding_aliases(alias: str, encoding: str) -> None:
+    assert CompressedFormat(JSONFormat(), alias).encoding == encoding
+
+
+def test_unsupported_encoding() -> None:
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        CompressedFormat(JSONFormat(), "br")
+    # Bodies in an unknown encoding are left for the caller
+    assert decompress(b"data", "br") == b"data"
+    assert decompress(gzip.compress(b"data"), "gzip, br") == gzip.compress(b"data")
+
+
+def test_decompress_undoes_codings_in_reverse_order() -> None:
+    body = gzip.compress(CompressedFormat(JSONFormat(), "xz", 0).compress(b"x")[0])
+
+    assert decompress(body, "xz, identity, gzip") == b"x"
+    assert decompress(b"x", "identity") == b"x"
+    assert decompress(b"x", None) == b"x"
+
+
+def test_decompress_invalid_data() -> None:
+    with pytest.raises(ValueError, match="Invalid compressed data"):
+        decompress(b"\x1f\x8bnot gzip", "gzip")
+    with pytest.raises(ValueError, match="truncated"):
+        decompress(gzip.compress(b"data")[:-4], "gzip")
+
+
+@pytest.mark.parametrize("encoding", sorted(supported_encodings()))
+def test_decompress_limits_output_size(encoding: str) -> None:
+    body = CompressedFormat(JSONFormat(), encoding, min_size=0).compress(
+        bytes(100_000)
+    )[0]
+
+    assert decompress(body, encoding, max_size=100_000) == bytes(100_000)
+    with pytest.raises(ValueError, match="exceeds 99999 bytes"):
+        decompress(body, encoding, max_size=99_999)
+
+
+def test_decompress_concatenated_gzip_members() -> None:
+    assert decompress(gzip.compress(b"a") + gzip.compress(b"b"), "gzip") == b"ab"
+
+
+def test_compressed_format_limits_output_size() -> None:
+    event_format = CompressedFormat(JSONFormat(), min_size=0, max_size=1024)
+    body = event_format.write(create_event(LARGE_DATA))
+
+    with pytest.raises(ValueError, match="exceeds 1024 bytes"):
+        event_format.read(CloudEvent, body)
+    with pytest.raises(ValueError, match="exceeds 1024 bytes"):
+        event_format.decompress(body, "gzip")
+    assert event_format.decompress(b"data", "br") == b"data"
+
+
+@pytest.mark.skipif("zstd" not in supported_encodings(), reason="needs zstd")
+def test_zstd_compressor_is_reused() -> None:
+    event_format = CompressedFormat(ProtobufFormat(), "zstd", min_size=0)
+    events = [create_event(LARGE_DATA, id=str(index)) for index in range(3)]
+
+    bodies = [event_format.write(event) for event in events]
+
+    assert [event_format.read(CloudEvent, body).get_id() for body in bodies] == [
+        "0",
+        "1",
+        "2",
+    ]
+
+
+def test_write_and_read_compressed_data() -> None:
+    event_format = CompressedFormat(JSONFormat(), "deflate", min_size=0)
+
+    body = event_format.write_data(LARGE_DATA, "application/json")
+
+    assert event_format.read_data(body, "application/json") == LARGE_DATA
+    assert event_format.read_data(b'{"a": 1}', "application/json") == {"a": 1}
+
+
+def test_content_type_of_wrapped_format() -> None:
+    event_format = CompressedFormat(ProtobufFormat())
+
+    assert event_format.get_content_type() == ProtobufFormat().get_content_type()
+    assert isinstance(event_format.format, ProtobufFormat)
@@ -0,0 +1,120 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from typing import Any
+
+import pytest
+
+from cloudevents.core.formats.content_type import (
+    KIND_BINARY,
+    KIND_JSON,
+    KIND_TEXT,
+    parse_content_type,
+)
+from cloudevents.core.formats.json import JSONFormat
+
+
+@pytest.mark.parametrize(
+    "content_type,kind",
+    [
+        ("application/json", KIND_JSON),
+        ("Application/JSON; charset=utf-8", KIND_JSON),
+        ("text/json", KIND_JSON),
+        ("application/cloudevents+json", KIND_JSON),
+        ("application/vnd.api+json ; foo=bar", KIND_JSON),
+        ("text/plain", KIND_TEXT),
+        ("application/xml", KIND_TEXT),
+        ("application/octet-stream; charset=utf-8", KIND_TEXT),
+        ("application/octet-stream", KIND_BINARY),
+        ("image/png", KIND_BINARY),
+        ("application/protobuf", KIND_BINARY),
+        ("application/cloudevents+protobuf", KIND_BINARY),
+        ("application/cloudevents+msgpack", KIND_BINARY),
+        ("application/vnd.example+cbor", KIND_BINARY),
+    ],
+)
+def test_parse_content_type_kind(content_type: str, kind: str) -> None:
+    assert parse_content_type(content_type).kind == kind
+
+
+def test_parse_content_type_parameters() -> None:
+    media_type = parse_content_type('Text/Plain; format=flowed; Charset="ISO-8859-1"')
+
+    assert media_type.essence == "text/plain"
+    assert media_type.charset == "iso-8859-1"
+    assert media_type.encoding == "iso8859-1"
+
+
+@pytest.mark.parametrize("charset", ["unknown", "base64", ""])
+def test_parse_content_type_falls_back_to_utf8(charset: str) -> None:
+    assert parse_content_type(f"text/plain; charset={charset}").encoding == "utf-8"
+
+
+def test_parse_content_type_is_memoized() -> None:
+    assert parse_content_type("application/json") is parse_content_type(
+        "application/json"
+    )
+
+
+@pytest.mark.parametrize(
+    "content_type,structured",
+    [
+        ("application/cloudevents+json", True),
+        ("Application/CloudEvents-Batch+JSON", True),
+        ("application/json", False),
+    ],
+)
+def test_parse_content_type_structured(content_type: str, structured: bool) -> None:
+    assert parse_content_type(content_type).is_structured is structured
+
+
+@pytest.mark.parametrize(
+    "body,content_type,expected",
+    [
+        (b'{"key": "value"}', "application/json", {"key": "value"}),
+        (b'{"key": "value"}', "APPLICATION/JSON", {"key": "value"}),
+        (b"not json", "application/json", "not json"),
+        (b"\xff\xfe", "application/json", b"\xff\xfe"),
+        ("café".encode("latin-1"), "text/plain; charset=latin-1", "café"),
+        (b"text", "application/octet-stream", b"text"),
+        (b"text", None, "text"),
+        (b"", "application/json", None),
+    ],
+)
+def test_json_format_read_data_uses_content_type(
+    body: bytes, content_type: str | None, expected: Any
+) -> None:
+    assert JSONFormat().read_data(body, content_type) == expected
+
+
+@pytest.mark.parametrize(
+    "body,content_type",
+    [
+        (b"caf\xe9", "text/plain; charset=iso-8859-1"),
+        ("café".encode("utf-16"), "text/plain; charset=utf-16"),
+        ("café".encode("utf-8"), "text/plain"),
+        (b'{"key": "caf\xe9"}', "application/json; charset=latin-1"),
+    ],
+)
+def test_json_format_write_data_uses_charset(body: bytes, content_type: str) -> None:
+    json_format = JSONFormat()
+
+    data = json_format.read_data(body, content_type)
+
+    assert (
+        json_format.read_data(json_format.write_data(data, content_type), content_type)
+        == data
+    )
+    if isinstance(data, str):
+        assert json_format.write_data(data, content_type) == body
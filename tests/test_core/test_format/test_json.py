@@ -13,9 +13,16 @@
 #    under the License.
 
 
+import json
 from datetime import datetime, timezone
+from typing import Any
 
+import pytest
+
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats import json as json_format
 from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.lazy import LazyTime, get_encoded_attributes
 from cloudevents.core.v1.event import CloudEvent
 
 
@@ -323,3 +330,140 @@ def test_read_cloud_event_from_string_input() -> None:
 
     assert result.get_id() == "123"
     assert result.get_source() == "source"
+
+
+def test_read_cloud_event_keeps_time_unparsed_until_accessed() -> None:
+    data = b'{"id": "123", "source": "source", "type": "type", "specversion": "1.0", "time": "2023-10-25T17:09:19.7Z"}'
+    formatter = JSONFormat()
+    result = formatter.read(CloudEvent, data)
+
+    time = get_encoded_attributes(result)["time"]
+    assert isinstance(time, LazyTime)
+    assert time == "2023-10-25T17:09:19.7Z"
+
+    assert result.get_time() == datetime(
+        2023, 10, 25, 17, 9, 19, 700000, tzinfo=timezone.utc
+    )
+    assert isinstance(get_encoded_attributes(result)["time"], datetime)
+
+
+def test_read_cloud_event_rejects_invalid_time() -> None:
+    for time in ("garbage", "2020-01-01T00:00:00", "2020-01-01T00:00:00+24:00"):
+        data = (
+            b'{"id": "123", "source": "source", "type": "type", '
+            b'"specversion": "1.0", "time": "%s"}' % time.encode()
+        )
+        with pytest.raises(CloudEventValidationError):
+            JSONFormat().read(CloudEvent, data)
+
+
+def test_write_cloud_event_reuses_unparsed_time_string() -> None:
+    data = b'{"id": "123", "source": "source", "type": "type", "specversion": "1.0", "time": "2023-10-25T17:09:19.7Z"}'
+    formatter = JSONFormat()
+    result = formatter.write(formatter.read(CloudEvent, data))
+
+    assert b'"time": "2023-10-25T17:09:19.7Z"' in result
+
+
+def test_peek_attributes_skips_data() -> None:
+    data = (
+        b'{"id": "123", "source": "source", "type": "type", "specversion": "1.0",'
+        b' "time": "2023-10-25T17:09:19.7Z", "data": {"key": [1, 2]},'
+        b' "subject": "test_subject"}'
+    )
+    result = JSONFormat().peek_attributes(data)
+
+    assert result == {
+        "id": "123",
+        "source": "source",
+        "type": "type",
+        "specversion": "1.0",
+        "time": "2023-10-25T17:09:19.7Z",
+        "subject": "test_subject",
+    }
+    assert isinstance(result["time"], LazyTime)
+
+
+def test_peek_attributes_skips_data_base64() -> None:
+    data = '{"id": "123", "source": "source", "type": "type", "data_base64": "AAE="}'
+
+    assert JSONFormat().peek_attributes(data) == {
+        "id": "123",
+        "source": "source",
+        "type": "type",
+    }
+
+
+@pytest.mark.parametrize(
+    ("data", "skipped"),
+    [
+        ("x" * 10_000, True),
+        ('a "quoted" \\ [text] {with} brackets\\' * 500, True),
+        ({f"key-{i}": f'value "{i}" ] }} [ {{ \\' for i in range(500)}, True),
+        ({"values": list(range(5000)), "nested": [[{"a": None}], {}, []]}, True),
+        # Decoding is faster for containers dense in brackets and small values
+        ([{"id": i, "tags": ["a", "b"], "text": "]"} for i in range(1000)], False),
+        ([1, {"small": True}], False),
+    ],
+)
+def test_peek_attributes_skips_data_without_decoding_it(
+    data: Any, skipped: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    attributes = {"id": "123", "source": "source", "type": "type"}
+    body = json.dumps({**attributes, "data": data, "subject": "after"}).encode()
+    decoded: list[Any] = []
+
+    class RecordingDecoder(json.JSONDecoder):
+        def raw_decode(self, s: str, idx: int = 0) -> tuple[Any, int]:
+            value, end = super().raw_decode(s, idx)
+            decoded.append(value)
+            return value, end
+
+    monkeypatch.setattr(json_format, "_ENTRY_DECODER", RecordingDecoder())
+
+    assert JSONFormat().peek_attributes(body) == {**attributes, "subject": "after"}
+    assert (data not in decoded) is skipped
+
+
+def test_peek_attributes_does_not_validate() -> None:
+    assert JSONFormat().peek_attributes(b'{"type": 1}') == {"type": 1}
+
+
+def test_peek_attributes_rejects_non_objects() -> None:
+    formatter = JSONFormat()
+    for data in (
+        b"[]",
+        b'{"id": "1"',
+        b'{"id": "1"} {}',
+        b'{"data": "unterminated}',
+        b'{"data": [' + b'"item", ' * 1000 + b"}",
+    ):
+        with pytest.raises(ValueError):
+            formatter.peek_attributes(data)
+
+
+def test_read_data_accepts_memoryview() -> None:
+    formatter = JSONFormat()
+    body = memoryview(b'{"key": "value"}')
+
+    assert formatter.read_data(body, "application/json") == {"key": "value"}
+    assert formatter.read_data(body, "text/plain") == '{"key": "value"}'
+
+    binary = formatter.read_data(memoryview(b"\x00\xff"), "application/octet-stream")
+    assert isinstance(binary, bytes)
+    assert binary == b"\x00\xff"
+
+
+def test_peek_attributes_accepts_memoryview() -> None:
+    data = memoryview(bytearray(b'{"id": "123", "data_base64": "AAE="}'))
+
+    assert JSONFormat().peek_attributes(data) == {"id": "123"}
+
+
+def test_write_memoryview_data_as_base64() -> None:
+    attributes = {"id": "123", "source": "source", "type": "type"}
+    event = CloudEvent(attributes=attributes, data=memoryview(b"\x00\x01"))  # type: ignore[arg-type]
+    formatter = JSONFormat()
+
+    assert formatter.read(None, formatter.write(event)).get_data() == b"\x00\x01"
+    assert formatter.write_data(memoryview(b"\x00\x01"), None) == b"\x00\x01"
@@ -0,0 +1,207 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from cloudevents.core.formats.avro import AvroFormat
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.json_backends import (
+    StdlibJSONBackend,
+    get_json_backend,
+)
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.lazy import RawJSON
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+
+@pytest.fixture(params=["stdlib", "orjson", "msgspec"])
+def json_format(request: pytest.FixtureRequest) -> JSONFormat:
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    return JSONFormat(backend=request.param)
+
+
+@pytest.mark.parametrize(
+    "time,expected",
+    [
+        (
+            datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc),
+            "2023-10-25T17:09:19.736166Z",
+        ),
+        (
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc),
+            "2023-10-25T17:09:19Z",
+        ),
+        (
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone(timedelta(hours=2))),
+            "2023-10-25T17:09:19+02:00",
+        ),
+    ],
+)
+def test_write_time(json_format: JSONFormat, time: datetime, expected: str) -> None:
+    event = CloudEvent({"id": "1", "source": "/", "type": "test", "time": time})
+
+    written = json.loads(json_format.write(event))
+
+    assert written["time"] == expected
+
+
+def test_write_json_data(json_format: JSONFormat) -> None:
+    event = CloudEvent(
+        {
+            "id": "1",
+            "source": "/",
+            "type": "test",
+            "datacontenttype": "application/json",
+        },
+        {
+            "text": "Hello 世界 🌍",
+            "number": 1.5,
+            "items": [1, None, True],
+            "raw": b"\x00\x01",
+            "at": datetime(2023, 10, 25, tzinfo=timezone.utc),
+        },
+    )
+
+    written = json.loads(json_format.write(event))
+
+    assert written["data"] == {
+        "text": "Hello 世界 🌍",
+        "number": 1.5,
+        "items": [1, None, True],
+        "raw": "AAE=",
+        "at": "2023-10-25T00:00:00Z",
+    }
+
+
+@pytest.mark.parametrize(
+    "event_class,field", [(CloudEvent, "data_base64"), (CloudEventV03, "data")]
+)
+def test_binary_data_roundtrip(
+    json_format: JSONFormat, event_class: Any, field: str
+) -> None:
+    event = event_class({"id": "1", "source": "/", "type": "test"}, b"\xff\x00binary")
+
+    written = json_format.write(event)
+
+    assert json.loads(written)[field] == "/wBiaW5hcnk="
+    assert json_format.read(None, written).get_data() == b"\xff\x00binary"
+
+
+@pytest.mark.parametrize("as_bytes", [True, False])
+def test_read(json_format: JSONFormat, as_bytes: bool) -> None:
+    document = (
+        '{"id": "1", "source": "/", "type": "test", "specversion": "1.0", '
+        '"time": "2023-10-25T17:09:19Z", "ext": 5, "data": {"text": "Hello 世界"}}'
+    )
+
+    event = json_format.read(None, document.encode("utf-8") if as_bytes else document)
+
+    assert event.get_time() == datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc)
+    assert event.get_extension("ext") == 5
+    assert event.get_data() == {"text": "Hello 世界"}
+
+
+def test_read_and_write_roundtrip(json_format: JSONFormat) -> None:
+    document = (
+        b'{"id": "1", "source": "/", "type": "test", "specversion": "1.0", '
+        b'"time": "2023-10-25T17:09:19.5+02:00", "data": {"key": "value"}}'
+    )
+
+    written = json_format.write(json_format.read(None, document))
+
+    # The unparsed time is written back as the original string
+    assert json.loads(written) == json.loads(document)
+
+
+def test_write_into_and_write_batch_mixed_events(json_format: JSONFormat) -> None:
+    attributes = {"source": "/", "type": "test", "specversion": "1.0"}
+    events = [
+        CloudEvent({**attributes, "id": "1"}, {"key": "value"}),
+        CloudEvent({**attributes, "id": "2"}, b"\x00\x01"),
+        FrozenCloudEvent({**attributes, "id": "3"}, {"key": "frozen"}),
+        CloudEvent({**attributes, "id": "4"}, RawJSON(b'{"raw": true}')),
+        CloudEvent({**attributes, "id": "5"}, "text"),
+    ]
+    buffer = bytearray(b"prefix")
+
+    written = [json_format.write_into(event, buffer) for event in events]
+
+    encoded = [json_format.write(event) for event in events]
+    assert buffer == b"prefix" + b"".join(encoded)
+    assert written == [len(item) for item in encoded]
+    batch = json_format.write_batch(events)
+    assert json.loads(batch) == [json.loads(item) for item in encoded]
+    assert json_format.write_batch(events[:2]) == json_format._backend.dumps(
+        [json.loads(item) for item in encoded[:2]]
+    )
+
+
+def test_read_invalid_json(json_format: JSONFormat) -> None:
+    with pytest.raises(ValueError):
+        json_format.read(None, b'{"id": ')
+
+
+def test_write_and_read_data(json_format: JSONFormat) -> None:
+    body = json_format.write_data({"key": [1, "two"]}, "application/json")
+
+    assert json.loads(body) == {"key": [1, "two"]}
+    assert json_format.read_data(body, "application/json") == {"key": [1, "two"]}
+    assert json_format.read_data(b"not json", "application/json") == "not json"
+
+
+def test_default_backend_is_stdlib() -> None:
+    assert isinstance(JSONFormat()._backend, StdlibJSONBackend)
+    assert JSONFormat() == JSONFormat("stdlib")
+
+
+def test_formats_with_the_same_backend_are_equal() -> None:
+    backend = StdlibJSONBackend()
+
+    assert JSONFormat(raw_data=True) == JSONFormat("stdlib", raw_data=True)
+    assert JSONFormat(raw_data=True) != JSONFormat()
+    assert JSONFormat(backend) != JSONFormat()
+    for format_class in (AvroFormat, ProtobufFormat):
+        assert format_class() == format_class("stdlib")
+        assert hash(format_class()) == hash(format_class("stdlib"))
+        assert format_class(backend) != format_class()
+    assert AvroFormat() != ProtobufFormat()
+
+
+def test_auto_backend() -> None:
+    assert JSONFormat("auto")._backend is get_json_backend("auto")
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        JSONFormat("unknown")
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_read_buffer_input(json_format: JSONFormat, wrap: Any) -> None:
+    event = CloudEvent({"id": "1", "source": "/", "type": "test"}, b"\x00\xff")
+    body = wrap(bytearray(JSONFormat().write(event)))
+
+    read = json_format.read(None, body)
+
+    assert read.get_id() == "1"
+    assert read.get_data() == b"\x00\xff"
+    assert (
+        json_format.read_batch(None, wrap(b"[" + bytes(body) + b"]"))[0].get_id() == "1"
+    )
@@ -0,0 +1,264 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+import pytest
+
+from cloudevents.core.exceptions import CloudEventValidationError
+from cloudevents.core.formats import json as json_format
+from cloudevents.core.formats.json import JSONBatchReader, JSONFormat
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+
+def test_write_batch_writes_json_array_of_events() -> None:
+    events = [
+        CloudEvent(
+            {"id": "1", "source": "/", "type": "test", "specversion": "1.0"},
+            {"key": "value"},
+        ),
+        CloudEventV03(
+            {"id": "2", "source": "/", "type": "test", "specversion": "0.3"},
+            b"\x00\x01",
+        ),
+    ]
+    json_format = JSONFormat()
+
+    written = json_format.write_batch(events)
+
+    assert json.loads(written) == [
+        json.loads(json_format.write(event)) for event in events
+    ]
+
+
+def test_write_batch_reuses_frozen_event_encodings() -> None:
+    json_format = JSONFormat()
+    event = FrozenCloudEvent({"id": "1", "source": "/", "type": "test"})
+    encoded = json_format.write(event)
+
+    assert (
+        json_format.write_batch([event, event])
+        == b"[" + encoded + b"," + encoded + b"]"
+    )
+
+
+def test_write_into_appends_to_bytearray_and_stream() -> None:
+    json_format = JSONFormat()
+    events = [
+        CloudEvent({"id": str(i), "source": "/", "type": "test"}) for i in range(2)
+    ]
+    buffer = bytearray(b"prefix")
+    stream = io.BytesIO()
+
+    written = json_format.write_into(events[0], buffer)
+    json_format.write_batch_into(events, stream)
+
+    assert buffer == b"prefix" + json_format.write(events[0])
+    assert written == len(buffer) - len(b"prefix")
+    assert stream.getvalue() == json_format.write_batch(events)
+
+
+def test_write_data_into() -> None:
+    json_format = JSONFormat()
+    buffer = bytearray()
+
+    json_format.write_data_into(b"\x00\x01", "application/octet-stream", buffer)
+    json_format.write_data_into({"key": 1}, "application/json", buffer)
+    json_format.write_data_into(None, None, buffer)
+
+    assert buffer == b'\x00\x01{"key": 1}'
+
+
+def test_write_batch_empty() -> None:
+    assert JSONFormat().write_batch([]) == b"[]"
+
+
+def test_read_batch_detects_version_per_entry() -> None:
+    data = (
+        b'[{"id": "1", "source": "/", "type": "test", "specversion": "1.0", '
+        b'"time": "2023-10-25T17:09:19Z", "data_base64": "AAE="}, '
+        b'{"id": "2", "source": "/", "type": "test", "specversion": "0.3", '
+        b'"datacontentencoding": "base64", "data": "AAE="}]'
+    )
+
+    events = JSONFormat().read_batch(None, data)
+
+    assert [type(event) for event in events] == [CloudEvent, CloudEventV03]
+    assert [event.get_id() for event in events] == ["1", "2"]
+    assert [event.get_data() for event in events] == [b"\x00\x01", b"\x00\x01"]
+    assert events[0].get_time() == datetime(
+        2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc
+    )
+
+
+def test_read_batch_with_event_factory() -> None:
+    events = JSONFormat().read_batch(
+        CloudEvent, '[{"id": "1", "source": "/", "type": "test", "specversion": "1.0"}]'
+    )
+
+    assert len(events) == 1
+    assert isinstance(events[0], CloudEvent)
+
+
+def test_batch_roundtrip() -> None:
+    events = [
+        CloudEvent({"id": str(i), "source": "/", "type": "test"}, {"index": i})
+        for i in range(3)
+    ]
+    json_format = JSONFormat()
+
+    read = json_format.read_batch(None, json_format.write_batch(events))
+
+    assert [(event.get_id(), event.get_time()) for event in read] == [
+        (event.get_id(), event.get_time()) for event in events
+    ]
+    assert [event.get_data() for event in read] == [{"index": i} for i in range(3)]
+
+
+@pytest.mark.parametrize("data", [b'{"id": "1"}', b"[1, 2]", b"[[]]"])
+def test_read_batch_rejects_invalid_batches(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        JSONFormat().read_batch(None, data)
+
+
+def test_batch_content_type() -> None:
+    assert JSONFormat().get_batch_content_type() == "application/cloudevents-batch+json"
+
+
+def _make_events(count: int) -> list[CloudEvent]:
+    return [
+        CloudEvent(
+            {"id": str(i), "source": "/", "type": "test"},
+            {"text": 'quotes " and \\ brackets ]}, 世界', "index": i},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 16])
+def test_batch_reader_reads_file_in_chunks(chunk_size: int) -> None:
+    events = _make_events(20)
+    body = JSONFormat().write_batch(events)
+
+    reader = JSONBatchReader(io.BytesIO(body), chunk_size=chunk_size)
+    read = list(reader)
+
+    assert [event.get_id() for event in read] == [str(i) for i in range(20)]
+    assert [event.get_data() for event in read] == [
+        event.get_data() for event in events
+    ]
+    assert reader.errors == []
+
+
+def test_batch_reader_is_incremental() -> None:
+    body = JSONFormat().write_batch(_make_events(3))
+    consumed = []
+
+    def chunks() -> Iterator[bytes]:
+        for i in range(0, len(body), 16):
+            consumed.append(i)
+            yield body[i : i + 16]
+
+    reader = iter(JSONBatchReader(chunks(), CloudEvent))
+
+    assert next(reader).get_id() == "0"
+    assert len(consumed) < len(body) // 16
+
+
+def test_batch_reader_decodes_entries_spanning_chunks_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = JSONFormat().write_batch(_make_events(3))
+    decoded: list[int] = []
+
+    class RecordingDecoder(json.JSONDecoder):
+        def raw_decode(self, s: str, idx: int = 0) -> tuple[Any, int]:
+            decoded.append(idx)
+            return super().raw_decode(s, idx)
+
+    monkeypatch.setattr(json_format, "_ENTRY_DECODER", RecordingDecoder())
+
+    read = list(JSONBatchReader(io.BytesIO(body), chunk_size=4))
+
+    assert [event.get_id() for event in read] == ["0", "1", "2"]
+    # One failed attempt when an entry is first found incomplete, and one once
+    # all of it has arrived
+    assert len(decoded) <= 2 * len(read)
+
+
+def test_batch_reader_reports_invalid_datacontentencoding() -> None:
+    data = (
+        b'[{"id": "1", "source": "/", "type": "test", "specversion": "0.3",'
+        b' "datacontentencoding": 5, "data": "AAE="}]'
+    )
+
+    reader = JSONBatchReader(io.BytesIO(data))
+
+    assert list(reader) == []
+    assert isinstance(reader.errors[0].error, CloudEventValidationError)
+
+
+def test_batch_reader_accepts_text_chunks() -> None:
+    body = JSONFormat().write_batch(_make_events(2)).decode("utf-8")
+
+    read = list(JSONBatchReader(io.StringIO(body), chunk_size=5))
+
+    assert [event.get_id() for event in read] == ["0", "1"]
+
+
+def test_batch_reader_skips_invalid_entries() -> None:
+    data = (
+        b'[{"id": "1", "source": "/", "type": "test"}, {"id": oops}, 5, '
+        b'{"id": "", "source": "/", "type": "test"}, '
+        b'{"id": "2", "source": "/", "type": "test"}]'
+    )
+
+    reader = JSONBatchReader([data[i : i + 7] for i in range(0, len(data), 7)])
+
+    assert [event.get_id() for event in reader] == ["1", "2"]
+    assert [(error.index, error.offset) for error in reader.errors] == [
+        (1, 45),
+        (2, 59),
+        (3, 62),
+    ]
+    assert isinstance(reader.errors[1].error, ValueError)
+    assert isinstance(reader.errors[2].error, CloudEventValidationError)
+
+
+@pytest.mark.parametrize(
+    "data,errors",
+    [
+        (b"[]", []),
+        (b" [ ] ", []),
+        (b'[{"id": "1", "source": "/", "type": "test"},]', [1]),
+        (b'[{"id": "1", "source": "/", "type": "test"}', [1]),
+        (b'[{"id": "1", "source": "/", "type": "test"}, {"id": ', [1]),
+    ],
+)
+def test_batch_reader_reports_malformed_arrays(data: bytes, errors: list[int]) -> None:
+    reader = JSONBatchReader(io.BytesIO(data))
+
+    list(reader)
+
+    assert [error.index for error in reader.errors] == errors
+
+
+@pytest.mark.parametrize("data", [b"", b'{"id": "1"}', b"[] []"])
+def test_batch_reader_rejects_non_arrays(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        list(JSONBatchReader(io.BytesIO(data)))
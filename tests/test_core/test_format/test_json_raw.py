@@ -0,0 +1,159 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import pytest
+
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.lazy import RawJSON
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+ATTRIBUTES = {
+    "id": "1",
+    "source": "/source",
+    "type": "test",
+    "specversion": "1.0",
+    "datacontenttype": "application/json",
+}
+
+
+def test_write_splices_raw_json_verbatim() -> None:
+    raw = RawJSON(b'{"b": [1, "}", {"c": null}],  "a":1}')
+    event = CloudEvent(dict(ATTRIBUTES), raw)
+
+    encoded = JSONFormat().write(event)
+
+    assert encoded.endswith(b'"data":' + raw + b"}")
+    assert b"data_base64" not in encoded
+    assert json.loads(encoded)["data"] == {"b": [1, "}", {"c": None}], "a": 1}
+
+
+def test_write_splices_raw_json_of_frozen_event() -> None:
+    event = FrozenCloudEvent(dict(ATTRIBUTES), RawJSON(b"[1,2]"))
+
+    assert json.loads(JSONFormat().write(event))["data"] == [1, 2]
+
+
+def test_read_raw_data_returns_undecoded_slice() -> None:
+    body = (
+        b'{"id": "1", "source": "/source", "type": "test", "specversion": "1.0",'
+        b' "data": {"nested": ["x", "y\\"}"]} , "subject": "s"}'
+    )
+
+    event = JSONFormat(raw_data=True).read(None, body)
+
+    data = event.get_data()
+    assert isinstance(data, RawJSON)
+    assert data == b'{"nested": ["x", "y\\"}"]}'
+    assert data.loads() == {"nested": ["x", 'y"}']}
+    assert event.get_extension("subject") == "s"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [b'"text"', b"12.5", b"true", b"[]", b'{"a": {"b": {}}}'],
+)
+def test_raw_data_roundtrip_is_verbatim(value: bytes) -> None:
+    body = JSONFormat().write(CloudEvent(dict(ATTRIBUTES), RawJSON(value)))
+
+    event = JSONFormat(raw_data=True).read(None, body)
+
+    assert event.get_data() == value
+    assert JSONFormat().write(event) == body
+
+
+def test_read_raw_data_null_is_none() -> None:
+    body = (
+        b'{"id": "1", "source": "/", "type": "t", "specversion": "1.0", "data": null}'
+    )
+
+    assert JSONFormat(raw_data=True).read(None, body).get_data() is None
+
+
+def test_read_raw_data_decodes_data_base64() -> None:
+    attributes = {"id": "1", "source": "/", "type": "t", "specversion": "1.0"}
+    event = CloudEvent(attributes, b"\x00\x01")
+
+    decoded = JSONFormat(raw_data=True).read(None, JSONFormat().write(event))
+
+    assert decoded.get_data() == b"\x00\x01"
+    assert not isinstance(decoded.get_data(), RawJSON)
+
+
+def test_read_raw_data_decodes_v03_base64_data() -> None:
+    event = CloudEventV03(
+        {"id": "1", "source": "/", "type": "t", "specversion": "0.3"}, b"\xff"
+    )
+
+    decoded = JSONFormat(raw_data=True).read(None, JSONFormat().write(event))
+
+    assert decoded.get_data() == b"\xff"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"[]",
+        b'{"id": "1", "data": }',
+        b'{"id": "1", "data": {"a": 1}',
+        b'{"id": "1"} trailing',
+        b'{"id" "1"}',
+    ],
+)
+def test_read_raw_data_rejects_invalid_events(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        JSONFormat(raw_data=True).read(None, body)
+
+
+def test_read_batch_raw_data() -> None:
+    events = [
+        CloudEvent(dict(ATTRIBUTES, id=str(i)), RawJSON(b'{"i": %d}' % i))
+        for i in range(3)
+    ]
+    batch = JSONFormat().write_batch(events)
+
+    decoded = JSONFormat(raw_data=True).read_batch(None, batch)
+
+    assert [event.get_id() for event in decoded] == ["0", "1", "2"]
+    assert [event.get_data() for event in decoded] == [
+        b'{"i": 0}',
+        b'{"i": 1}',
+        b'{"i": 2}',
+    ]
+    assert JSONFormat(raw_data=True).read_batch(None, b" [ ] ") == []
+
+
+def test_read_data_raw_json() -> None:
+    json_format = JSONFormat(raw_data=True)
+
+    assert json_format.read_data(b'{"a": 1}', "application/json") == RawJSON(
+        b'{"a": 1}'
+    )
+    assert json_format.read_data(b"text", "text/plain") == "text"
+    assert isinstance(json_format.read_data(b"{}", "application/json"), RawJSON)
+
+
+def test_write_data_raw_json_is_unchanged() -> None:
+    raw = RawJSON(b'{"a": 1}')
+
+    assert JSONFormat().write_data(raw, "application/json") == raw
+
+
+def test_raw_json_repr_and_loads() -> None:
+    raw = RawJSON(b"[1]")
+
+    assert repr(raw) == "RawJSON(b'[1]')"
+    assert raw.loads() == [1]
@@ -0,0 +1,167 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+
+import pytest
+
+from cloudevents.core.exceptions import BatchEntryError, CloudEventValidationError
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.ndjson import NDJSONReader, NDJSONWriter
+from cloudevents.core.lazy import RawJSON
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
+
+
+class _CountingStream(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.writes += 1
+        return super().write(data)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def _make_events(count: int) -> list[CloudEvent]:
+    return [
+        CloudEvent(
+            {"id": str(i), "source": "/", "type": "test"},
+            {"text": "line\nbreak", "index": i},
+        )
+        for i in range(count)
+    ]
+
+
+def test_writer_writes_one_event_per_line() -> None:
+    events = _make_events(3)
+    stream = io.BytesIO()
+
+    with NDJSONWriter(stream) as writer:
+        assert writer.write_all(events) == 3
+
+    json_format = JSONFormat()
+    assert stream.getvalue() == b"".join(
+        json_format.write(event) + b"\n" for event in events
+    )
+
+
+def test_writer_keeps_pretty_printed_raw_json_on_one_line() -> None:
+    raw_format = JSONFormat(raw_data=True)
+    events = [
+        CloudEvent(
+            {"id": str(i), "source": "/", "type": "test"},
+            RawJSON(b'{\n  "a": 1,\r\n  "text": "x\\ny"\n}'),
+        )
+        for i in range(2)
+    ]
+    stream = io.BytesIO()
+
+    with NDJSONWriter(stream, raw_format) as writer:
+        writer.write_all(events)
+
+    assert stream.getvalue().count(b"\n") == 2
+    reader = NDJSONReader(io.BytesIO(stream.getvalue()), skip_errors=True)
+    read = list(reader)
+    assert reader.errors == []
+    assert [event.get_data() for event in read] == [{"a": 1, "text": "x\ny"}] * 2
+
+
+def test_writer_flushes_once_per_chunk() -> None:
+    events = _make_events(100)
+    line_size = len(JSONFormat().write(events[0])) + 1
+    stream = _CountingStream()
+
+    writer = NDJSONWriter(stream, chunk_size=line_size * 10)
+    writer.write_all(events)
+
+    assert stream.writes == 10
+    assert stream.flushes == 10
+    writer.flush()
+    assert stream.writes == 10
+    assert len(stream.getvalue().splitlines()) == 100
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_reader_roundtrip(chunk_size: int) -> None:
+    events = _make_events(20)
+    stream = io.BytesIO()
+    with NDJSONWriter(stream) as writer:
+        writer.write_all(events)
+    stream.seek(0)
+
+    read = list(NDJSONReader(stream, chunk_size=chunk_size))
+
+    assert [event.get_id() for event in read] == [str(i) for i in range(20)]
+    assert [event.get_data() for event in read] == [
+        event.get_data() for event in events
+    ]
+
+
+def test_reader_joins_lines_spanning_many_chunks() -> None:
+    events = [
+        CloudEvent({"id": str(i), "source": "/", "type": "test"}, b"x" * 1000)
+        for i in range(2)
+    ]
+    data = b"\n".join(JSONFormat().write(event) for event in events)
+
+    read = list(NDJSONReader(io.BytesIO(data), chunk_size=10))
+
+    assert [event.get_id() for event in read] == ["0", "1"]
+    assert [event.get_data() for event in read] == [b"x" * 1000] * 2
+
+
+def test_reader_mixed_versions_and_chunk_iterable() -> None:
+    lines = [
+        JSONFormat().write(CloudEvent({"id": "1", "source": "/", "type": "test"})),
+        JSONFormat().write(CloudEventV03({"id": "2", "source": "/", "type": "test"})),
+    ]
+    data = b"\n".join(lines) + b"\r\n\n"
+
+    read = list(NDJSONReader([data[:10], data[10:]]))
+
+    assert [type(event) for event in read] == [CloudEvent, CloudEventV03]
+
+
+def test_reader_raises_on_corrupt_line() -> None:
+    data = b'{"id": "1", "source": "/", "type": "test"}\n{"id": \n'
+
+    with pytest.raises(BatchEntryError) as error:
+        list(NDJSONReader(io.BytesIO(data)))
+
+    assert (error.value.index, error.value.offset) == (1, 43)
+
+
+def test_reader_skips_corrupt_lines() -> None:
+    data = (
+        b'{"id": "1", "source": "/", "type": "test"}\n'
+        b"not json\n"
+        b"[1, 2]\n"
+        b'{"id": "", "source": "/", "type": "test"}\n'
+        b'{"id": "2", "source": "/", "type": "test"}'
+    )
+
+    reader = NDJSONReader(io.BytesIO(data), skip_errors=True, chunk_size=16)
+
+    assert [event.get_id() for event in reader] == ["1", "2"]
+    assert [(error.index, error.offset) for error in reader.errors] == [
+        (1, 43),
+        (2, 52),
+        (3, 59),
+    ]
+    assert isinstance(reader.errors[2].error, CloudEventValidationError)
@@ -0,0 +1,203 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from datetime import datetime, timezone
+
+import pytest
+
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.lazy import RawJSON
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
+
+# id "1", source "/", spec_version "1.0", type "t", the attributes "n" (integer
+# -1) and "time" (1970-01-01T00:00:01.000001Z) and the text_data "hi"
+ENCODED_EVENT = (
+    b"\x0a\x011"
+    b"\x12\x01/"
+    b"\x1a\x031.0"
+    b"\x22\x01t"
+    b"\x2a\x10\x0a\x01n\x12\x0b\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+    b"\x2a\x0f\x0a\x04time\x12\x07\x3a\x05\x08\x01\x10\xe8\x07"
+    b"\x3a\x02hi"
+)
+
+
+def create_event(
+    extra_attributes: dict[str, object] | None = None, data: object = None
+) -> CloudEvent:
+    attributes = {
+        "id": "1",
+        "source": "/",
+        "type": "t",
+        "specversion": "1.0",
+        "time": datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc),
+    }
+    attributes.update(extra_attributes or {})
+    return CloudEvent(attributes, data)  # type: ignore[arg-type]
+
+
+def test_read_spec_encoded_event() -> None:
+    event = ProtobufFormat().read(None, ENCODED_EVENT)
+
+    assert event.get_id() == "1"
+    assert event.get_source() == "/"
+    assert event.get_type() == "t"
+    assert event.get_specversion() == "1.0"
+    assert event.get_extension("n") == -1
+    assert event.get_time() == datetime(1970, 1, 1, 0, 0, 1, 1, tzinfo=timezone.utc)
+    assert event.get_data() == "hi"
+
+
+def test_roundtrip_keeps_attribute_types() -> None:
+    event = create_event(
+        {
+            "datacontenttype": "application/octet-stream",
+            "dataschema": "https://example.com/schema",
+            "subject": "subject",
+            "flag": True,
+            "count": -(2**31),
+            "blob": b"\x00\xff",
+            "when": datetime(1960, 5, 1, 12, 0, 0, 5, tzinfo=timezone.utc),
+        },
+        b"\x00\x01\x02",
+    )
+    protobuf_format = ProtobufFormat()
+
+    decoded = protobuf_format.read(None, protobuf_format.write(event))
+
+    assert decoded.get_attributes() == event.get_attributes()
+    assert decoded.get_data() == b"\x00\x01\x02"
+
+
+def test_write_binary_data_without_base64() -> None:
+    data = bytes(range(256)) * 4
+    encoded = ProtobufFormat().write(create_event(data=data))
+
+    assert b"\x32\x80\x08" + data in encoded
+    assert len(encoded) < len(JSONFormat().write(create_event(data=data)))
+
+
+@pytest.mark.parametrize(
+    "datacontenttype,data,expected",
+    [
+        ("application/json", {"key": [1, 2]}, {"key": [1, 2]}),
+        ("text/plain", "text", "text"),
+        (None, "text", "text"),
+        (None, "123", "123"),
+        (None, {"a": 1}, {"a": 1}),
+        ("application/json", RawJSON(b'{"a": 1}'), {"a": 1}),
+    ],
+)
+def test_text_data_roundtrip(
+    datacontenttype: str | None, data: object, expected: object
+) -> None:
+    extra: dict[str, object] = {}
+    if datacontenttype:
+        extra["datacontenttype"] = datacontenttype
+    protobuf_format = ProtobufFormat()
+
+    encoded = protobuf_format.write(create_event(extra, data))
+
+    assert protobuf_format.read(None, encoded).get_data() == expected
+
+
+def test_read_proto_data_returns_packed_message() -> None:
+    any_message = b"\x0a\x03t/x\x12\x02\x08\x01"
+    encoded = b"\x0a\x011\x12\x01/\x1a\x031.0\x22\x01t\x42\x09" + any_message
+
+    assert ProtobufFormat().read(None, encoded).get_data() == b"\x08\x01"
+
+
+def test_read_skips_unknown_fields() -> None:
+    unknown = b"\x48\x96\x01\x51" + bytes(8) + b"\x5d" + bytes(4) + b"\x62\x01x"
+
+    event = ProtobufFormat().read(CloudEvent, ENCODED_EVENT + unknown)
+
+    assert event.get_data() == "hi"
+
+
+def test_read_v03_event() -> None:
+    event = CloudEventV03(
+        {"id": "1", "source": "/", "type": "t", "specversion": "0.3"}, "text"
+    )
+    protobuf_format = ProtobufFormat()
+
+    decoded = protobuf_format.read(None, protobuf_format.write(event))
+
+    assert isinstance(decoded, CloudEventV03)
+    assert decoded.get_data() == "text"
+
+
+def test_read_accepts_buffers() -> None:
+    for data in (bytearray(ENCODED_EVENT), memoryview(ENCODED_EVENT)):
+        assert ProtobufFormat().read(None, data).get_id() == "1"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [ENCODED_EVENT[:-1], b"\x0a\x05ab", b"\x0f", b"\x0a\xff"],
+)
+def test_read_rejects_truncated_messages(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        ProtobufFormat().read(CloudEvent, data)
+
+
+def test_write_rejects_unsupported_attributes() -> None:
+    with pytest.raises(ValueError, match="out of the range"):
+        ProtobufFormat().write(create_event({"big": 2**31}))
+    with pytest.raises(ValueError, match="cannot be written"):
+        ProtobufFormat().write(create_event({"ratio": 0.5}))
+
+
+def test_write_lazily_read_time_as_timestamp() -> None:
+    body = JSONFormat().write(create_event())
+    event = JSONFormat().read(None, body)
+
+    decoded = ProtobufFormat().read(None, ProtobufFormat().write(event))
+
+    assert decoded.get_time() == event.get_time()
+
+
+def test_batch_roundtrip() -> None:
+    events = [create_event({"id": str(index)}, {"index": index}) for index in range(3)]
+    frozen = FrozenCloudEvent(dict(events[0].get_attributes()), b"\x00")
+    protobuf_format = ProtobufFormat()
+
+    batch = protobuf_format.write_batch([*events, frozen])
+    decoded = protobuf_format.read_batch(None, batch)
+
+    assert [event.get_id() for event in decoded] == ["0", "1", "2", "0"]
+    assert decoded[3].get_data() == b"\x00"
+    assert protobuf_format.read_batch(None, b"") == []
+    assert protobuf_format.get_batch_content_type() == (
+        "application/cloudevents-batch+protobuf"
+    )
+
+
+def test_peek_attributes_skips_data() -> None:
+    attributes = ProtobufFormat().peek_attributes(ENCODED_EVENT)
+
+    assert attributes["type"] == "t"
+    assert attributes["n"] == -1
+    assert "data" not in attributes
+
+
+def test_data_payload_methods() -> None:
+    protobuf_format = ProtobufFormat()
+
+    assert protobuf_format.write_data({"a": 1}, "application/json") == b'{"a": 1}'
+    assert protobuf_format.read_data(b'{"a": 1}', "application/json") == {"a": 1}
+    assert protobuf_format.get_content_type() == "application/cloudevents+protobuf"
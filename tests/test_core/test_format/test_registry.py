@@ -0,0 +1,84 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+import pytest
+
+from cloudevents.core.formats.avro import AvroFormat
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.formats.protobuf import ProtobufFormat
+from cloudevents.core.formats.registry import FormatRegistry, get_default_registry
+
+
+def test_get_ignores_case_and_parameters() -> None:
+    json_format = JSONFormat()
+    registry = FormatRegistry([json_format, ProtobufFormat()])
+
+    assert registry.get("application/cloudevents+json") is json_format
+    assert registry.get("Application/CloudEvents+JSON; charset=UTF-8") is json_format
+    assert isinstance(registry.get("application/cloudevents+protobuf"), ProtobufFormat)
+
+
+def test_get_unknown_or_missing_content_type() -> None:
+    registry = FormatRegistry([JSONFormat()])
+
+    assert registry.get("application/cloudevents+avro") is None
+    assert registry.get("application/json") is None
+    assert registry.get(None) is None
+    assert registry.get("") is None
+
+
+def test_get_batch() -> None:
+    protobuf_format = ProtobufFormat()
+    registry = FormatRegistry([protobuf_format, AvroFormat()])
+
+    assert registry.get_batch("application/cloudevents-batch+protobuf") is (
+        protobuf_format
+    )
+    assert registry.get_batch("application/cloudevents+protobuf") is None
+    assert registry.get_batch("application/cloudevents-batch+avro") is None
+
+
+def test_register_replaces_format_of_same_media_type() -> None:
+    first, second = JSONFormat(), JSONFormat(raw_data=True)
+    registry = FormatRegistry([first])
+
+    registry.register(second)
+
+    assert registry.get("application/cloudevents+json") is second
+    assert registry.get_batch("application/cloudevents-batch+json") is second
+    assert registry.default is first
+
+
+def test_default() -> None:
+    json_format = JSONFormat()
+
+    assert FormatRegistry([ProtobufFormat()], default=json_format).default is (
+        json_format
+    )
+    with pytest.raises(ValueError, match="No event format"):
+        FormatRegistry().default
+
+
+def test_default_registry_holds_built_in_formats() -> None:
+    registry = get_default_registry()
+
+    assert registry is get_default_registry()
+    assert isinstance(registry.default, JSONFormat)
+    for content_type, format_type in (
+        ("application/cloudevents+json", JSONFormat),
+        ("application/cloudevents+protobuf", ProtobufFormat),
+        ("application/cloudevents+avro", AvroFormat),
+    ):
+        assert isinstance(registry.get(content_type), format_type)
@@ -0,0 +1,111 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import uuid
+from typing import Iterator
+
+import pytest
+
+from cloudevents.core import ids
+from cloudevents.core.ids import (
+    UUID4IdGenerator,
+    UUID7IdGenerator,
+    generate_id,
+    get_id_generator,
+    set_id_generator,
+)
+from cloudevents.core.v03.event import CloudEvent as CloudEventV03
+from cloudevents.core.v1.event import CloudEvent
+
+
+@pytest.fixture
+def restore_id_generator() -> Iterator[None]:
+    generator = get_id_generator()
+    yield
+    set_id_generator(generator)
+
+
+def test_default_generator_produces_uuid4() -> None:
+    assert isinstance(get_id_generator(), UUID4IdGenerator)
+    assert uuid.UUID(generate_id()).version == 4
+
+
+def test_uuid4_generate_bulk() -> None:
+    generated = UUID4IdGenerator().generate(100)
+
+    assert len(set(generated)) == 100
+    for event_id in generated:
+        parsed = uuid.UUID(event_id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == event_id
+
+
+def test_uuid7_ids_are_time_ordered_and_increasing() -> None:
+    generator = UUID7IdGenerator()
+    generated = generator.generate(1000) + [
+        generator.generate_id() for _ in range(1000)
+    ]
+
+    assert generated == sorted(generated)
+    assert len(set(generated)) == len(generated)
+    for event_id in generated[::100]:
+        parsed = uuid.UUID(event_id)
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == event_id
+
+
+def test_uuid7_embeds_unix_timestamp(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+
+    event_id = UUID7IdGenerator().generate_id()
+
+    assert uuid.UUID(event_id).int >> 80 == 1_700_000_000_123
+
+
+def test_uuid7_stays_monotonic_when_clock_moves_backwards(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generator = UUID7IdGenerator()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    first = generator.generate_id()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_600_000_000_000_000_000)
+    second = generator.generate_id()
+
+    assert second > first
+
+
+def test_uuid7_counter_overflow_moves_to_next_millisecond(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    generator = UUID7IdGenerator()
+    first = generator.generate_id()
+    generator._counter = ids._COUNTER_MAX
+    second = generator.generate_id()
+
+    assert second > first
+    assert uuid.UUID(second).int >> 80 == 1_700_000_000_001
+
+
+@pytest.mark.parametrize("event_class", [CloudEvent, CloudEventV03])
+def test_events_use_configured_id_generator(
+    event_class: type, restore_id_generator: None
+) -> None:
+    set_id_generator(UUID7IdGenerator())
+
+    event = event_class({"source": "/", "type": "test"})
+
+    assert uuid.UUID(event.get_id()).version == 7
@@ -0,0 +1,137 @@
+#  Copyright 2018-Present The CloudEvents Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cloudevents.core.lazy import LazyTime
+from cloudevents.core.time import format_time, parse_time
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (
+            "2023-10-25T17:09:19Z",
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc),
+        ),
+        (
+            "2023-10-25T17:09:19.736Z",
+            datetime(2023, 10, 25, 17, 9, 19, 736000, tzinfo=timezone.utc),
+        ),
+        (
+            "2023-10-25T17:09:19.736166Z",
+            datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc),
+        ),
+        (
+            "2023-10-25t17:09:19.5z",
+            datetime(2023, 10, 25, 17, 9, 19, 500000, tzinfo=timezone.utc),
+        ),
+        (
+            "2023-10-25T17:09:19.123456789Z",
+            datetime(2023, 10, 25, 17, 9, 19, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            "2023-10-25T17:09:19+02:00",
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone(timedelta(hours=2))),
+        ),
+        (
+            "2023-10-25 17:09:19.25-05:30",
+            datetime(
+                2023,
+                10,
+                25,
+                17,
+                9,
+                19,
+                250000,
+                tzinfo=timezone(-timedelta(hours=5, minutes=30)),
+            ),
+        ),
+        (
+            "2023-10-25T17:09:19-00:00",
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_parse_time(value: str, expected: datetime) -> None:
+    parsed = parse_time(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2023-10-25",
+        "2023-10-25T17:09:19",
+        "2023-10-25T17:09Z",
+        "20231025T170919Z",
+        "2023-W43-3T17:09:19Z",
+        "2023-10-25T17:09:19.Z",
+        "2023-13-25T17:09:19Z",
+        "2023-10-25T24:09:19Z",
+        "2023-10-25T17:09:19+24:00",
+        "2023-10-25T17:09:19+02:60",
+        "2023-10-25T17:09:19+0200",
+        "２０２３-10-25T17:09:19Z",
+        " 2023-10-25T17:09:19Z",
+    ],
+)
+def test_parse_time_rejects_invalid_timestamps(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_time(value)
+
+
+def test_parse_time_caches_repeated_timestamps() -> None:
+    assert parse_time("2024-02-29T12:00:00Z") is parse_time("2024-02-29T12:00:00Z")
+
+
+def test_lazy_time_uses_parse_time() -> None:
+    assert LazyTime("2023-10-25T17:09:19+02:00").parse() == parse_time(
+        "2023-10-25T17:09:19+02:00"
+    )
+    with pytest.raises(ValueError):
+        LazyTime("2023-10-25").parse()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc),
+            "2023-10-25T17:09:19Z",
+        ),
+        (
+            datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc),
+            "2023-10-25T17:09:19.736166Z",
+        ),
+        (
+            datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone(timedelta(hours=-5))),
+            "2023-10-25T17:09:19-05:00",
+        ),
+    ],
+)
+def test_format_time(value: datetime, expected: str) -> None:
+    assert format_time(value) == expected
+    assert parse_time(expected) == value
+
+
+def test_format_time_reuses_result_for_same_instance() -> None:
+    value = datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc)
+
+    assert format_time(value) is format_time(value)
@@ -24,7 +24,7 @@ from cloudevents.core.exceptions import (
     InvalidAttributeValueError,
     MissingRequiredAttributeError,
 )
-from cloudevents.core.v03.event import CloudEvent
+from cloudevents.core.v03.event import CloudEvent, FrozenCloudEvent
 
 
 def test_missing_required_attributes() -> None:
@@ -607,3 +607,96 @@ def test_v03_minimal_event() -> None:
     assert event.get_data() is None
     assert event.get_datacontentencoding() is None
     assert event.get_schemaurl() is None
+
+
+def test_v03_event_has_no_instance_dict() -> None:
+    event = CloudEvent(attributes={"source": "/source", "type": "test"})
+    assert not hasattr(event, "__dict__")
+
+
+def test_v03_get_attributes_returns_all_attributes() -> None:
+    time = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+    attributes = {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "specversion": "0.3",
+        "time": time,
+        "datacontenttype": "application/json",
+        "datacontentencoding": "base64",
+        "schemaurl": "http://example.com/schema.json",
+        "subject": "test_subject",
+        "customext": "value",
+    }
+    event = CloudEvent(attributes=dict(attributes))
+
+    assert event.get_attributes() == attributes
+    assert event.get_extension("customext") == "value"
+
+
+def test_v03_from_trusted_skips_validation() -> None:
+    event = CloudEvent.from_trusted(
+        {"id": "1", "source": "/source", "type": "test", "subject": ""}
+    )
+
+    assert isinstance(event, CloudEvent)
+    assert event.get_specversion() == "0.3"
+    assert event.get_subject() == ""
+
+
+def test_v03_from_trusted_missing_required_attribute() -> None:
+    with pytest.raises(CloudEventValidationError) as e:
+        CloudEvent.from_trusted({"id": "1", "type": "test"})
+
+    assert {key: [str(e) for e in value] for key, value in e.value.errors.items()} == {
+        "source": [str(MissingRequiredAttributeError("source"))]
+    }
+
+
+def test_v03_many_extension_attributes() -> None:
+    attributes: dict[str, Any] = {"id": "1", "source": "/source", "type": "test"}
+    attributes.update({f"ext{i}": i for i in range(50)})
+
+    event = CloudEvent(attributes=attributes)
+
+    assert event.get_extension("ext0") == 0
+    assert event.get_extension("ext49") == 49
+
+
+def test_v03_frozen_event() -> None:
+    attributes = {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "time": datetime(2023, 10, 25, tzinfo=timezone.utc),
+    }
+    event = FrozenCloudEvent(attributes=dict(attributes), data={"key": [1]})
+
+    assert event.get_specversion() == "0.3"
+    assert event == FrozenCloudEvent(attributes=dict(attributes), data={"key": [1]})
+    assert hash(event) == hash(
+        FrozenCloudEvent(attributes=dict(attributes), data={"key": [1]})
+    )
+    with pytest.raises(TypeError):
+        event.get_data()["key"] = []  # type: ignore[index]
+
+
+def test_v03_evolve() -> None:
+    event = CloudEvent(
+        attributes={
+            "id": "1",
+            "source": "/source",
+            "type": "test",
+            "schemaurl": "http://example.com/schema",
+        },
+        data={"key": "value"},
+    )
+
+    evolved = event.evolve({"schemaurl": None, "subject": "changed"})
+
+    assert evolved.get_specversion() == "0.3"
+    assert evolved.get_schemaurl() is None
+    assert evolved.get_subject() == "changed"
+    assert evolved.get_data() is event.get_data()
+    with pytest.raises(CloudEventValidationError):
+        event.evolve({"specversion": "1.0"})
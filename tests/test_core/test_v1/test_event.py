@@ -12,11 +12,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
+import sys
 from datetime import datetime, timezone
 from typing import Any
 
 import pytest
 
+from cloudevents.core.base import BaseCloudEvent
 from cloudevents.core.exceptions import (
     CloudEventValidationError,
     CustomExtensionAttributeError,
@@ -24,7 +27,10 @@ from cloudevents.core.exceptions import (
     InvalidAttributeValueError,
     MissingRequiredAttributeError,
 )
-from cloudevents.core.v1.event import CloudEvent
+from cloudevents.core.formats.base import ReadableBuffer
+from cloudevents.core.formats.json import JSONFormat
+from cloudevents.core.lazy import LazyData, LazyTime
+from cloudevents.core.v1.event import CloudEvent, FrozenCloudEvent
 
 
 def test_missing_required_attributes() -> None:
@@ -102,6 +108,59 @@ def test_time_validation(time: Any, expected_error: dict) -> None:
     assert actual_errors == expected_error
 
 
+def test_lazy_time_is_parsed_on_first_access() -> None:
+    event = CloudEvent(
+        {
+            "id": "1",
+            "source": "/",
+            "type": "test",
+            "specversion": "1.0",
+            "time": LazyTime("2023-10-25T17:09:19.736166Z"),
+        }
+    )
+
+    assert event.get_encoded_attributes()["time"] == "2023-10-25T17:09:19.736166Z"
+    time = event.get_time()
+    assert time == datetime(2023, 10, 25, 17, 9, 19, 736166, tzinfo=timezone.utc)
+    assert event.get_time() is time
+    assert event.get_attributes()["time"] is time
+    assert event.get_extension("time") is time
+
+
+def test_lazy_time_returned_as_datetime_from_attributes() -> None:
+    event = CloudEvent(
+        {
+            "id": "1",
+            "source": "/",
+            "type": "test",
+            "specversion": "1.0",
+            "time": LazyTime("2023-10-25T17:09:19Z"),
+        }
+    )
+
+    expected = datetime(2023, 10, 25, 17, 9, 19, tzinfo=timezone.utc)
+    assert event.get_attributes()["time"] == expected
+    assert event.get_extension("time") == expected
+
+
+@pytest.mark.parametrize(
+    "time", ["garbage", "2023-10-25T17:09:19", "2023-13-25T17:09:19Z", ""]
+)
+def test_invalid_lazy_time_is_rejected(time: str) -> None:
+    with pytest.raises(CloudEventValidationError) as e:
+        CloudEvent(
+            {
+                "id": "1",
+                "source": "/",
+                "type": "test",
+                "specversion": "1.0",
+                "time": LazyTime(time),
+            }
+        )
+
+    assert "time" in e.value.errors
+
+
 @pytest.mark.parametrize(
     "subject,expected_error",
     [
@@ -502,3 +561,376 @@ def test_cloud_event_constructor() -> None:
     assert event.get_time() == time
     assert event.get_extension("customextension") == customextension
     assert event.get_data() == data
+
+
+def test_event_has_no_instance_dict() -> None:
+    event = CloudEvent(attributes={"source": "/source", "type": "test"})
+    assert not hasattr(event, "__dict__")
+
+
+def test_get_attributes_returns_all_attributes() -> None:
+    time = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+    attributes = {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "specversion": "1.0",
+        "time": time,
+        "datacontenttype": "application/json",
+        "dataschema": "http://example.com/schema",
+        "subject": "test_subject",
+        "customext": "value",
+    }
+    event = CloudEvent(attributes=dict(attributes))
+
+    assert event.get_attributes() == attributes
+
+
+def test_get_attributes_modification_does_not_affect_event() -> None:
+    event = CloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test", "ext": "a"}
+    )
+    attributes = event.get_attributes()
+    attributes["ext"] = "b"
+    attributes["subject"] = "changed"
+
+    assert event.get_extension("ext") == "a"
+    assert event.get_subject() is None
+
+
+def test_get_extension_missing_returns_none() -> None:
+    event = CloudEvent(attributes={"id": "1", "source": "/source", "type": "test"})
+    assert event.get_extension("missing") is None
+
+
+def test_from_trusted_skips_validation() -> None:
+    event = CloudEvent.from_trusted(
+        {"id": "1", "source": "/source", "type": "test", "Invalid-Name": "value"},
+        data={"key": "value"},
+    )
+
+    assert isinstance(event, CloudEvent)
+    assert event.get_extension("Invalid-Name") == "value"
+    assert event.get_data() == {"key": "value"}
+
+
+def test_from_trusted_applies_defaults() -> None:
+    event = CloudEvent.from_trusted({"source": "/source", "type": "test"})
+
+    assert event.get_specversion() == "1.0"
+    assert event.get_id() is not None
+    assert event.get_time() is not None
+
+
+def test_from_trusted_missing_required_attribute() -> None:
+    with pytest.raises(CloudEventValidationError) as e:
+        CloudEvent.from_trusted({"id": "1", "type": "test"})
+
+    assert {key: [str(e) for e in value] for key, value in e.value.errors.items()} == {
+        "source": [str(MissingRequiredAttributeError("source"))]
+    }
+
+
+def test_many_extension_attributes() -> None:
+    attributes: dict[str, Any] = {"id": "1", "source": "/source", "type": "test"}
+    attributes.update({f"ext{i}": i for i in range(50)})
+
+    event = CloudEvent(attributes=attributes)
+
+    assert event.get_extension("ext0") == 0
+    assert event.get_extension("ext49") == 49
+
+
+def test_validation_errors_for_multiple_invalid_attributes() -> None:
+    with pytest.raises(CloudEventValidationError) as e:
+        CloudEvent(
+            {
+                "id": "1",
+                "source": "/",
+                "type": "test",
+                "valid": "value",
+                "Invalid": "value",
+                "subject": "",
+                "specversion": "0.3",
+            }
+        )
+
+    actual_errors = {
+        key: [str(e) for e in value] for key, value in e.value.errors.items()
+    }
+    assert actual_errors == {
+        "specversion": [
+            str(
+                InvalidAttributeValueError(
+                    "specversion", "Attribute 'specversion' must be '1.0'"
+                )
+            )
+        ],
+        "subject": [
+            str(
+                InvalidAttributeValueError(
+                    "subject", "Attribute 'subject' must not be empty"
+                )
+            )
+        ],
+        "Invalid": [
+            str(
+                CustomExtensionAttributeError(
+                    "Invalid",
+                    "Extension attribute 'Invalid' should only contain lowercase letters and numbers",
+                )
+            )
+        ],
+    }
+    assert list(actual_errors) == ["specversion", "subject", "Invalid"]
+
+
+def test_lazy_data_is_decoded_once_on_access() -> None:
+    calls = []
+
+    class CountingJSONFormat(JSONFormat):
+        def read_data(
+            self, body: ReadableBuffer, datacontenttype: str | None
+        ) -> dict[str, Any] | str | bytes | None:
+            calls.append(body)
+            return super().read_data(body, datacontenttype)
+
+    lazy_data = LazyData(b'{"key": "value"}', "application/json", CountingJSONFormat())
+    event = CloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data=lazy_data,
+    )
+
+    assert event.get_lazy_data() is lazy_data
+    assert calls == []
+
+    assert event.get_data() == {"key": "value"}
+    assert event.get_data() == {"key": "value"}
+    assert len(calls) == 1
+    assert event.get_lazy_data() is None
+
+
+def test_get_lazy_data_for_regular_data() -> None:
+    event = CloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data=b"raw",
+    )
+    assert event.get_lazy_data() is None
+
+
+def test_frozen_event_data_cannot_be_modified() -> None:
+    data = {"key": "value", "items": [1, {"nested": True}]}
+    event = FrozenCloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"}, data=data
+    )
+    data["key"] = "changed"
+
+    frozen_data = event.get_data()
+    assert frozen_data == {"key": "value", "items": [1, {"nested": True}]}
+    with pytest.raises(TypeError):
+        frozen_data["key"] = "changed"
+    with pytest.raises(TypeError):
+        frozen_data["items"].append(2)
+    with pytest.raises(TypeError):
+        frozen_data["items"][1]["nested"] = False
+
+
+def test_frozen_event_equality_and_hash() -> None:
+    attributes = {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "time": LazyTime("2023-10-25T17:09:19Z"),
+    }
+    first = FrozenCloudEvent(attributes=dict(attributes), data={"key": [1, 2]})
+    second = FrozenCloudEvent(attributes=dict(attributes), data={"key": [1, 2]})
+    second.get_time()
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first != FrozenCloudEvent(
+        attributes={**attributes, "id": "2"}, data={"key": [1, 2]}
+    )
+
+
+def test_frozen_event_equality_ignores_extension_order() -> None:
+    attributes = {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "time": LazyTime("2023-10-25T17:09:19Z"),
+    }
+    first = FrozenCloudEvent(
+        attributes={**attributes, "exta": "a", "extb": "b"}, data=None
+    )
+    second = FrozenCloudEvent(
+        attributes={**attributes, "extb": "b", "exta": "a"}, data=None
+    )
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+
+
+def test_frozen_event_caches_encoded_bytes() -> None:
+    calls = []
+
+    class CountingJSONFormat(JSONFormat):
+        def _write(self, event: BaseCloudEvent) -> bytes:
+            calls.append(event)
+            return super()._write(event)
+
+    event = FrozenCloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data={"key": "value"},
+    )
+    json_format = CountingJSONFormat()
+
+    first = json_format.write(event)
+    assert json_format.write(event) is first
+    assert CountingJSONFormat().write(event) is first
+    assert len(calls) == 1
+
+    regular = CloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data={"key": "value"},
+    )
+    json_format.write(regular)
+    json_format.write(regular)
+    assert len(calls) == 3
+
+
+def test_frozen_event_from_trusted() -> None:
+    event = FrozenCloudEvent.from_trusted(
+        {"id": "1", "source": "/source", "type": "test"}, data={"key": "value"}
+    )
+
+    assert isinstance(event, FrozenCloudEvent)
+    with pytest.raises(TypeError):
+        event.get_data()["key"] = "changed"  # type: ignore[index]
+
+
+def test_evolve_changes_only_given_attributes() -> None:
+    lazy_data = LazyData(b'{"key": "value"}', "application/json", JSONFormat())
+    event = CloudEvent(
+        attributes={
+            "id": "1",
+            "source": "/source",
+            "type": "test",
+            "subject": "subject",
+            "time": LazyTime("2023-10-25T17:09:19Z"),
+            "ext": "value",
+        },
+        data=lazy_data,
+    )
+
+    evolved = event.evolve({"subject": "changed", "ext": None, "new": "added"})
+
+    assert evolved.get_encoded_attributes() == {
+        "id": "1",
+        "source": "/source",
+        "type": "test",
+        "specversion": "1.0",
+        "time": "2023-10-25T17:09:19Z",
+        "subject": "changed",
+        "new": "added",
+    }
+    assert evolved.get_lazy_data() is lazy_data
+    assert event.get_subject() == "subject"
+    assert event.get_extension("ext") == "value"
+
+
+def test_evolve_replaces_data() -> None:
+    event = CloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data={"key": "value"},
+    )
+
+    assert event.evolve(data=None).get_data() is None
+    assert event.evolve(data=b"raw").get_data() == b"raw"
+    assert event.evolve().get_data() is event.get_data()
+
+
+@pytest.mark.parametrize(
+    "changes,expected_errors",
+    [
+        (
+            {"id": None},
+            {
+                "id": [
+                    str(MissingRequiredAttributeError("id")),
+                    str(
+                        InvalidAttributeValueError(
+                            attribute_name="id",
+                            msg="Attribute 'id' must not be None or empty",
+                        )
+                    ),
+                    str(InvalidAttributeTypeError("id", str)),
+                ]
+            },
+        ),
+        (
+            {"subject": ""},
+            {
+                "subject": [
+                    str(
+                        InvalidAttributeValueError(
+                            "subject", "Attribute 'subject' must not be empty"
+                        )
+                    )
+                ]
+            },
+        ),
+        (
+            {"Invalid": "value"},
+            {
+                "Invalid": [
+                    str(
+                        CustomExtensionAttributeError(
+                            "Invalid",
+                            "Extension attribute 'Invalid' should only contain lowercase letters and numbers",
+                        )
+                    )
+                ]
+            },
+        ),
+    ],
+)
+def test_evolve_validates_changed_attributes(
+    changes: dict[str, Any], expected_errors: dict
+) -> None:
+    event = CloudEvent(attributes={"id": "1", "source": "/source", "type": "test"})
+
+    with pytest.raises(CloudEventValidationError) as e:
+        event.evolve(changes)
+
+    actual_errors = {
+        key: [str(e) for e in value] for key, value in e.value.errors.items()
+    }
+    assert actual_errors == expected_errors
+
+
+def test_evolve_frozen_event_stays_frozen() -> None:
+    event = FrozenCloudEvent(
+        attributes={"id": "1", "source": "/source", "type": "test"},
+        data={"key": "value"},
+    )
+
+    evolved = event.evolve({"subject": "changed"})
+
+    assert isinstance(evolved, FrozenCloudEvent)
+    assert evolved.get_data() is event.get_data()
+    assert evolved != event
+    with pytest.raises(TypeError):
+        event.evolve(data={"key": []}).get_data()["key"].append(1)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 13), reason="copy.replace is 3.13+")
+def test_copy_replace() -> None:
+    event = CloudEvent(attributes={"id": "1", "source": "/source", "type": "test"})
+
+    replaced = copy.replace(event, subject="changed", data="data")  # type: ignore[attr-defined]
+
+    assert replaced.get_subject() == "changed"
+    assert replaced.get_data() == "data"